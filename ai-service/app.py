@@ -1,21 +1,179 @@
+import json
 import time
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory
 import os
 import uuid
 from flask_cors import CORS
-from logic.nlp_engine import classifier, style_extractor
-from logic.templates import TEMPLATES_MAP, PRICING_SECTION_SNIPPET
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import parse_accept_header
+from logic.nlp_engine import analyze, prompt_analyzer
+from logic.template_engine import section_templates, template_engine
+from logic.rewrite_engine import apply_modifications, plan_modifications
+from logic.cache import LRUCache
+from logic.cache_backends import make_cache
+from logic.sessions import SessionStore, utf16_edits
+from logic.metrics import NULL_TIMER, NullTimer, StageTimer, render_counter, render_metrics
+from logic.responses import EncodedCode, compress_body, encode_payload, encode_response, etag_matches
+from logic.chunk_store import KEY_PATTERN, ChunkStore, GarbageCollector
+from logic.deployments import ARTIFACT_PATTERN, DeploymentBuilder
+from logic.composer import page_composer
+from logic.offload import ProcessOffloader, modify_job
+from logic.singleflight import SingleFlight
 
 FRONTEND_URL = os.getenv("FRONTEND_URL")
 
+# Rendered-output cache: generation depends only on (intent, color, brand).
+# Entries are EncodedCode, so they also hold the JSON-encoded code, its ETag
+# and (with compression on) the deflated start of the response body
+RENDER_CACHE_MAX_ENTRIES = int(os.getenv("RENDER_CACHE_MAX_ENTRIES", 512))
+RENDER_CACHE_MAX_BYTES = int(os.getenv("RENDER_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+RENDER_CACHE_TTL = float(os.getenv("RENDER_CACHE_TTL", 0)) or None
+
+# Where the render and analysis caches are shared beyond the worker: "local"
+# (each worker keeps its own), "shared" (one memory-mapped file per cache in
+# CACHE_SHARED_DIR, mapped by every worker on the host) or "redis" (the
+# server at REDIS_URL). The per-worker LRU stays in front either way
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "local")
+# Analyses are cheaper to redo than a network round trip, so only opt in
+ANALYSIS_CACHE_BACKEND = os.getenv("ANALYSIS_CACHE_BACKEND", "local")
+# Must belong to the service user and be writable only by it (created 0700)
+CACHE_SHARED_DIR = os.getenv("CACHE_SHARED_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache"))
+CACHE_SHARED_MB = int(os.getenv("CACHE_SHARED_MB", 64))
+REDIS_URL = os.getenv("REDIS_URL")
+
+render_cache = make_cache(
+    CACHE_BACKEND,
+    LRUCache(
+        max_entries=RENDER_CACHE_MAX_ENTRIES,
+        max_bytes=RENDER_CACHE_MAX_BYTES,
+        ttl=RENDER_CACHE_TTL,
+        sizeof=lambda code: len(code.encode('utf-8')) + code.size(),
+    ),
+    'render',
+    shared_dir=CACHE_SHARED_DIR,
+    size_bytes=CACHE_SHARED_MB * 1024 * 1024,
+    redis_url=REDIS_URL,
+    ttl=RENDER_CACHE_TTL,
+)
+prompt_analyzer.cache = make_cache(
+    ANALYSIS_CACHE_BACKEND, prompt_analyzer.cache, 'analysis',
+    shared_dir=CACHE_SHARED_DIR, size_bytes=4 * 1024 * 1024, slot_bytes=2048, redis_url=REDIS_URL,
+)
+
+# Single-flight: requests that miss the cache for the same render at the
+# same time wait on one computation. With SINGLE_FLIGHT_DIR (a local
+# directory all workers share, owned by the service user and created 0700)
+# workers on the host coalesce too, through lock files; results stay there
+# SINGLE_FLIGHT_TTL seconds for late waiters
+SINGLE_FLIGHT_DIR = os.getenv("SINGLE_FLIGHT_DIR") or None
+SINGLE_FLIGHT_TTL = float(os.getenv("SINGLE_FLIGHT_TTL", 5))
+
+render_flight = SingleFlight(SINGLE_FLIGHT_DIR, ttl=SINGLE_FLIGHT_TTL)
+
+# Pre-rendered templates filled by warm_up(); read-only once published
+prerendered = {}
+warmed_up = False
+
+# Session mode for /modify: latest code per session id, bounded like the render cache
+SESSION_MAX_ENTRIES = int(os.getenv("SESSION_MAX_ENTRIES", 1024))
+SESSION_MAX_BYTES = int(os.getenv("SESSION_MAX_BYTES", 64 * 1024 * 1024))
+SESSION_TTL = float(os.getenv("SESSION_TTL", 3600)) or None
+
+session_store = SessionStore(
+    max_entries=SESSION_MAX_ENTRIES,
+    max_bytes=SESSION_MAX_BYTES,
+    ttl=SESSION_TTL,
+)
+
+# Per-stage latency histograms, exposed at /metrics
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1") != "0"
+stage_timer = StageTimer if METRICS_ENABLED else NullTimer
+
+# Warm-up before serving: every template is pre-rendered in these colors
+# (with the default brand) into a read-only table shared by forked workers
+WARMUP_ENABLED = os.getenv("WARMUP", "1") != "0"
+WARMUP_COLORS = tuple(
+    color.strip() for color in os.getenv("WARMUP_COLORS", "blue,purple,indigo,green,red,emerald").split(",")
+    if color.strip()
+)
+# Exercises every modify_ui heuristic during warm-up
+WARMUP_MODIFY_PROMPT = (
+    "add a navbar, hero, features, testimonials, sidebar, chart, footer and a pricing section"
+)
+
+# gzip for clients that accept it: zlib level 1-9 (0 disables); smaller bodies go out as is
+COMPRESSION_LEVEL = int(os.getenv("COMPRESSION_LEVEL", 6))
+COMPRESSION_MIN_BYTES = int(os.getenv("COMPRESSION_MIN_BYTES", 1024))
+
+# Standalone HTML deployments, stored (and served) by content hash. Pages are
+# kept as shared chunks plus a manifest; older flat .html files in the same
+# directory are still served until migrate_deployments.py moves them over
+DEPLOYMENTS_DIR = os.getenv("DEPLOYMENTS_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "deployments"))
+# Artifact names change with their content, so browsers and CDNs may keep them forever
+DEPLOYMENT_MAX_AGE = int(os.getenv("DEPLOYMENT_MAX_AGE", 365 * 24 * 3600))
+DEPLOYMENT_CACHE_MB = int(os.getenv("DEPLOYMENT_CACHE_MB", 32))
+# Garbage collection (both off by default): drop pages not read for this many
+# seconds, and/or the least recently read beyond this many pages
+DEPLOYMENT_TTL = int(os.getenv("DEPLOYMENT_TTL", 0))
+DEPLOYMENT_MAX_ARTIFACTS = int(os.getenv("DEPLOYMENT_MAX_ARTIFACTS", 0))
+# Seconds for one incremental pass over the whole store
+DEPLOYMENT_GC_INTERVAL = int(os.getenv("DEPLOYMENT_GC_INTERVAL", 3600))
+
+deployment_store = ChunkStore(DEPLOYMENTS_DIR, cache_bytes=DEPLOYMENT_CACHE_MB * 1024 * 1024)
+deployment_builder = DeploymentBuilder(deployment_store, frontend_url=FRONTEND_URL or "https://ryze-ai-agent.vercel.app")
+deployment_gc = GarbageCollector(
+    deployment_store,
+    ttl=DEPLOYMENT_TTL or None,
+    max_artifacts=DEPLOYMENT_MAX_ARTIFACTS or None,
+    interval=DEPLOYMENT_GC_INTERVAL,
+)
+
+# Upper bound on prompts accepted by /generate/batch in one request
+BATCH_MAX_PROMPTS = int(os.getenv("BATCH_MAX_PROMPTS", 10000))
+
+# Process pool for CPU-heavy jobs (off by default): /modify on code of at
+# least OFFLOAD_MIN_CHARS characters and batches of at least
+# OFFLOAD_BATCH_MIN prompts run in OFFLOAD_WORKERS processes per server worker
+OFFLOAD_WORKERS = int(os.getenv("OFFLOAD_WORKERS", 0))
+OFFLOAD_MIN_CHARS = int(os.getenv("OFFLOAD_MIN_CHARS", 256 * 1024))
+OFFLOAD_BATCH_MIN = int(os.getenv("OFFLOAD_BATCH_MIN", 512))
+
+# Pool workers import this module for the batch pipeline
+offloader = ProcessOffloader(OFFLOAD_WORKERS, OFFLOAD_MIN_CHARS, OFFLOAD_BATCH_MIN, preload=['app'])
+
+# NDJSON streaming: code is emitted in records of at most this many characters
+NDJSON_MIMETYPE = "application/x-ndjson"
+STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", 8192))
+
 app = Flask(__name__)
 # Enable CORS for all routes and origins (Critical for Render microservices)
-CORS(app, resources={r"/*": {"origins": "*"}})
+CORS(app, resources={r"/*": {"origins": "*"}}, expose_headers=["ETag"])
 app.logger.info("CORS Enabled for all origins")
 
 @app.route('/health', methods=['GET'])
 def health_check():
-    return jsonify({"status": "running", "engine": "Symbolic NLP"}), 200
+    return jsonify({
+        "status": "running",
+        "engine": "Symbolic NLP",
+        "render_cache": render_cache.stats(),
+        "analysis_cache": prompt_analyzer.cache.stats(),
+        "templates": template_engine.stats(),
+        "compositions": page_composer.stats(),
+        "deployments": dict(deployment_builder.stats(), gc=deployment_gc.stats()),
+        "sessions": session_store.stats(),
+        "offload": offloader.stats(),
+        "single_flight": render_flight.stats()
+    }), 200
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus text exposition of the per-stage latency histograms and coalescing counters."""
+    coalesced = render_counter(
+        'ryze_render_coalesced_total',
+        'Renders served from a concurrent request\'s computation, by where it ran.',
+        'scope', {"thread": render_flight.coalesced, "process": render_flight.shared},
+    )
+    return Response(render_metrics() + coalesced, mimetype='text/plain; version=0.0.4')
 
 @app.errorhandler(500)
 def internal_error(error):
@@ -35,16 +193,181 @@ def handle_exception(e):
     app.logger.error(f"Unhandled Exception: {e}", exc_info=True)
     return jsonify({"error": "Internal Server Error", "details": str(e)}), 500
 
+def wants_stream(stream, accept):
+    """
+    NDJSON streaming is opt-in via ?stream=1 or an explicit Accept header.
+    `stream` is the first ?stream value and `accept` the Accept header
+    (either may be None); shared by the Flask views and the ASGI router.
+    """
+    if (stream or '').lower() in ('1', 'true', 'yes'):
+        return True
+    return any(
+        mimetype == NDJSON_MIMETYPE and quality > 0
+        for mimetype, quality in parse_accept_header(accept, MIMEAccept)
+    )
+
+def _wants_stream():
+    return wants_stream(request.args.get('stream'), request.headers.get('Accept'))
+
+def _iter_item_records(item, index=None):
+    """
+    Splits one generation result into plan, code chunk and explanation records.
+    """
+    base = {} if index is None else {"index": index}
+    if "error" in item:
+        yield {**base, "type": "error", **item}
+        return
+
+    yield {**base, "type": "plan", "plan": item["plan"]}
+    code = item["code"]
+    for seq, offset in enumerate(range(0, len(code), STREAM_CHUNK_SIZE)):
+        yield {**base, "type": "code", "seq": seq, "chunk": code[offset:offset + STREAM_CHUNK_SIZE]}
+    yield {**base, "type": "explanation", "explanation": item["explanation"], "meta": item.get("meta", {})}
+
+def _ndjson_lines(records):
+    for record in records:
+        yield json.dumps(record, separators=(',', ':')) + "\n"
+
+def _ndjson_response(records):
+    return Response(_ndjson_lines(records), mimetype=NDJSON_MIMETYPE)
+
+def _render_key(template, primary_color, brand_name):
+    """
+    Key of a rendered page in the render cache, the warm-up table and
+    single-flight. The entities must be the exact values rendered (see
+    _render_code), or two different pages would share one entry.
+    """
+    return (template.name, template.version, template.digest, primary_color, brand_name)
+
+def _render_code(intent, primary_color, brand_name, sections=()):
+    """
+    Renders the template for an (intent, color, brand) triple through the render cache.
+    With `sections` (further intents), renders the page composed from the
+    intent's template and their section fragments instead.
+    Returns (code, template, cache_hit); cache_hit is also True when a
+    concurrent request did the render.
+    """
+    # Resolves fallbacks and picks up hot-reloaded template versions
+    template = page_composer.get(intent, sections) if sections else template_engine.get(intent)
+    # Normalized once: the same values make the key and fill the template
+    primary_color = primary_color.lower()
+    brand_name = brand_name.strip()
+
+    # Output depends only on the template source and the normalized entities,
+    # so repeated prompts hit the cache and neither a new version nor an edit
+    # in place (same version, new digest) serves stale code
+    cache_key = _render_key(template, primary_color, brand_name)
+    generated_code = prerendered.get(cache_key)
+    if generated_code is None:
+        generated_code = render_cache.get(cache_key)
+    if generated_code is not None:
+        return generated_code, template, True
+
+    # Templates are compiled on first use, so rendering is a single join;
+    # the JSON encoding is done once here instead of on every response.
+    # A burst of identical prompts shares one render, cached before the
+    # waiting requests are released so none arriving after them misses
+    def render():
+        code = EncodedCode(template.render({
+            "PRIMARY_COLOR": primary_color,
+            "BRAND_NAME": brand_name,
+        }), COMPRESSION_LEVEL)
+        render_cache.set(cache_key, code)
+        return code
+
+    generated_code, coalesced = render_flight.do(cache_key, render)
+    if coalesced and render_cache.get(cache_key) is None:
+        # Rendered by another worker (SINGLE_FLIGHT_DIR): not cached here yet
+        render_cache.set(cache_key, generated_code)
+    return generated_code, template, coalesced
+
+def warm_up():
+    """
+    Pays first-use costs before the process serves traffic: compiles every
+    template, runs the analysis and modify pipelines once (so their code
+    paths are warm) and pre-renders every template in WARMUP_COLORS.
+    Runs once per process; under gunicorn it runs in the master before
+    forking (see gunicorn.conf.py), so workers start warm.
+    Returns the seconds spent, or 0.0 if it already ran.
+    """
+    global prerendered, warmed_up
+    if warmed_up:
+        return 0.0
+    warmed_up = True
+    start = time.perf_counter()
+
+    template_engine.preload()
+    section_templates.preload()
+    brand = prompt_analyzer.style_extractor.default_brand
+    table = {}
+    for name in template_engine.names():
+        template = template_engine.get(name)
+        for color in WARMUP_COLORS:
+            color = color.lower()
+            # Same key as the render cache: a template edited after warm-up
+            # gets a new digest, so its pre-rendered pages are never served
+            table[_render_key(template, color, brand)] = EncodedCode(template.render({
+                "PRIMARY_COLOR": color,
+                "BRAND_NAME": brand,
+            }), COMPRESSION_LEVEL)
+        # One pass through analysis and every modify heuristic per template
+        analyze(f"{name} page called {brand}")
+        apply_modifications(template.source, WARMUP_MODIFY_PROMPT, "green", brand)
+
+    # Request parsing, routing and JSON encoding have first-use costs of their
+    # own; one untimed request per endpoint pays them (metrics stay empty)
+    with app.test_request_context('/generate', method='POST', json={"prompt": "warm-up"}):
+        payload, _ = generate_result(request.get_json(), time.perf_counter())
+        _json_response(payload)
+        _json_response(modify_result({"prompt": WARMUP_MODIFY_PROMPT, "currentCode": payload["code"]})[0])
+
+    # Published in one assignment and never mutated afterwards, so forked
+    # workers only ever read the pages they inherited
+    prerendered = table
+    return time.perf_counter() - start
+
+def _template_meta(template):
+    return {"name": template.name, "version": template.version}
+
+def _build_generation_text(prompt, intent, primary_color, brand_name, processing_time, template, sections=()):
+    composition = (
+        f"- **Composition**: Added {', '.join(sections)} sections to the {intent} layout in the same render.\n"
+        if sections else ""
+    )
+    explanation = (
+        f"I analyzed your request using a Symbolic NLP engine.\n"
+        f"- **Intent Detected**: {intent.capitalize()} (Based on keyword frequency)\n"
+        f"- **Style Extraction**: Primary Color = '{primary_color}', Brand = '{brand_name}'\n"
+        f"- **Architecture**: Selected the optimal {intent} layout pattern from the deterministic library.\n"
+        f"{composition}"
+        f"- **Processing Time**: {processing_time}ms"
+    )
+
+    plan = (
+        f"1. **Analyze Intent**: '{prompt}' -> {intent}\n"
+        f"2. **Extract Entities**: Color: {primary_color}, Brand: {brand_name}\n"
+        f"3. **Select Template**: {template.name}_v{template.version}.jsx\n"
+        f"4. **Compile**: Inject variables and validate structure."
+    )
+    return plan, explanation
+
 @app.route('/generate', methods=['POST'])
 @app.route('/api/generator/generate', methods=['POST'])
 
 def generate_ui():
     """
     Main endpoint for AI UI Generation.
-    Receives: { "prompt": "Create a red dashboard..." }
+    Receives: { "prompt": "Create a red dashboard...", "sessionId"?: "...", "compose"?: true }
     Returns: { "plan": "...", "code": "...", "explanation": "..." }
+    With "compose", intents ranked below the top one ("a dashboard with a
+    login and pricing") add their sections to the page in the same render.
+    With "sessionId" (or "session": true for a server-assigned id) the code
+    is also stored as the session's next version for incremental /modify.
+    Non-session responses carry an ETag identifying the generated code; a
+    request whose If-None-Match matches it gets an empty 304.
     """
-    start_time = time.time()
+    timer = stage_timer('generate')
+    start_time = time.perf_counter()
     if not request.is_json:
         app.logger.warning("Request content-type is not JSON or body is empty.")
         # Attempt to parse anyway if content-type is missing but body exists
@@ -54,57 +377,288 @@ def generate_ui():
     
     if data is None:
         return jsonify({"error": "Invalid JSON or empty body"}), 400
+    timer.lap('parse')
+
+    result, status = generate_result(data, start_time, timer)
+    intent = result.get("meta", {}).get("intent", "")
+    if status == 200 and _wants_stream():
+        timer.finish(intent)
+        return _ndjson_response(_iter_item_records(result))
+    # The code is spliced in pre-encoded; an If-None-Match hit skips the body.
+    # RFC 9110 answers a failed If-None-Match on a POST with 412, but /generate
+    # is a safe lookup of the code for a prompt that clients revalidate like a
+    # GET, so a matching ETag means "keep what you have": 304. "*" never
+    # matches, or any request carrying it would get no page at all
+    etag = generation_etag(result) if status == 200 else None
+    if etag is not None and etag_matches(request.headers.get('If-None-Match'), etag, wildcard=False):
+        response = Response(status=304, headers={"ETag": etag})
+    else:
+        response = _json_response(result, status)
+        if etag is not None:
+            response.headers["ETag"] = etag
+    timer.lap('serialize')
+    timer.finish(intent)
+    return response
+
+def _json_response(payload, status=200):
+    """
+    JSON response, gzipped when the client accepts it and the body is large
+    enough. Pre-encoded (and pre-deflated) code is spliced in, not re-encoded.
+    `payload` may also be an already encoded body (bytes).
+    """
+    accept_encoding = request.headers.get('Accept-Encoding')
+    if isinstance(payload, bytes):
+        body, encoding = compress_body(payload, accept_encoding, COMPRESSION_LEVEL, COMPRESSION_MIN_BYTES)
+    else:
+        body, encoding = encode_response(payload, accept_encoding, COMPRESSION_LEVEL, COMPRESSION_MIN_BYTES)
+    response = Response(body, status=status, mimetype='application/json')
+    if encoding is not None:
+        response.headers["Content-Encoding"] = encoding
+    if COMPRESSION_LEVEL:
+        response.vary.add("Accept-Encoding")
+    return response
+
+def generation_etag(result):
+    """
+    ETag of a /generate result: identifies the generated code. None when
+    the result is tied to a session, which must always get its body.
+    """
+    code = result.get("code")
+    if isinstance(code, EncodedCode) and "session" not in result:
+        return code.etag
+    return None
 
+def generate_result(data, start_time, timer=NULL_TIMER):
+    """
+    The generation pipeline behind /generate, independent of the serving
+    stack (shared by the Flask view and the ASGI entry point).
+    `start_time` is a perf_counter() reading. Returns (payload, status).
+    """
     prompt = data.get('prompt', '')
     
     if not prompt:
-        return jsonify({"error": "Prompt is required"}), 400
+        return {"error": "Prompt is required"}, 400
 
     try:
-        # 1. Intent Classification (AI Fundamentals)
-        intent = classifier.predict(prompt)
-        
-        # 2. Entity Extraction (Rule-based NLP)
-        primary_color = style_extractor.extract_primary_color(prompt)
-        brand_name = style_extractor.extract_brand_name(prompt)
+        # 1-2. Intent Classification & Entity Extraction (one memoized analysis)
+        analysis = analyze(prompt)
+        intent, primary_color, brand_name = analysis.intent, analysis.color, analysis.brand
+        sections = page_composer.sections(analysis) if data.get('compose') else ()
+        timer.lap('analyze')
         
         # 3. Template Selection & Filling (Deterministic Generation)
-        raw_template = TEMPLATES_MAP.get(intent, TEMPLATES_MAP['dashboard'])
-        
-        # Simple Jinja-like replacement
-        generated_code = raw_template.replace("{{PRIMARY_COLOR}}", primary_color)
-        generated_code = generated_code.replace("{{BRAND_NAME}}", brand_name)
+        generated_code, template, cache_hit = _render_code(intent, primary_color, brand_name, sections)
+        timer.lap('render')
     except Exception as e:
         app.logger.error(f"Generation Logic Failed: {str(e)}", exc_info=True)
-        return jsonify({"error": "Generation Failed", "details": str(e)}), 500
+        return {"error": "Generation Failed", "details": str(e)}, 500
     
     # 4. Construct Response
-    processing_time = round((time.time() - start_time) * 1000, 2)
-    
-    explanation = (
-        f"I analyzed your request using a Symbolic NLP engine.\n"
-        f"- **Intent Detected**: {intent.capitalize()} (Based on keyword frequency)\n"
-        f"- **Style Extraction**: Primary Color = '{primary_color}', Brand = '{brand_name}'\n"
-        f"- **Architecture**: Selected the optimal {intent} layout pattern from the deterministic library.\n"
-        f"- **Processing Time**: {processing_time}ms"
+    processing_time = round((time.perf_counter() - start_time) * 1000, 2)
+    plan, explanation = _build_generation_text(
+        prompt, intent, primary_color, brand_name, processing_time, template, sections
     )
 
-    plan = (
-        f"1. **Analyze Intent**: '{prompt}' -> {intent}\n"
-        f"2. **Extract Entities**: Color: {primary_color}, Brand: {brand_name}\n"
-        f"3. **Select Template**: {intent}_v1.0.js\n"
-        f"4. **Compile**: Inject variables and validate structure."
-    )
-
-    return jsonify({
+    result = {
         "plan": plan,
         "code": generated_code,
         "explanation": explanation,
         "meta": {
             "intent": intent,
-            "processing_time_ms": processing_time
+            "processing_time_ms": processing_time,
+            "template": _template_meta(template),
+            "cache": "hit" if cache_hit else "miss"
+        }
+    }
+    if data.get('compose'):
+        result["meta"]["sections"] = list(sections)
+
+    # 5. Session Tracking (optional)
+    session_id = data.get('sessionId') or (uuid.uuid4().hex if data.get('session') else None)
+    if session_id:
+        version = session_store.seed(str(session_id), generated_code)
+        if version is not None:
+            result["session"] = {"id": str(session_id), "version": version}
+
+    return result, 200
+
+def _analyze_batch(prompts, offset=0):
+    """
+    Classification & Extraction over the whole batch in one pass.
+    Returns (analyses, errors): analyses[i] is (intent, color, brand) or None,
+    errors maps an item index to its error payload. `offset` is added to
+    the reported indexes when `prompts` is a slice of the batch.
+    """
+    analyses = [None] * len(prompts)
+    errors = {}
+    for i, prompt in enumerate(prompts):
+        if not isinstance(prompt, str) or not prompt:
+            errors[i] = {"index": offset + i, "error": "Prompt is required"}
+            continue
+        try:
+            analysis = analyze(prompt)
+        except Exception as e:
+            app.logger.error(f"Batch analysis failed for item {offset + i}: {e}", exc_info=True)
+            errors[i] = {"index": offset + i, "error": "Generation Failed", "details": str(e)}
+            continue
+        analyses[i] = (analysis.intent, analysis.color, analysis.brand)
+    return analyses, errors
+
+def _iter_batch_results(prompts, analyses, errors, analysis_ms, summary, offset=0):
+    """
+    Yields one result per prompt in input order. Each distinct
+    (intent, color, brand) is rendered once, on first use, so only one
+    item is materialized at a time. `summary` is filled in as items go by.
+    """
+    rendered = {}
+    failed = {}
+    for i, prompt in enumerate(prompts):
+        if i in errors:
+            summary["errors"] += 1
+            yield errors[i]
+            continue
+
+        item_start = time.perf_counter()
+        analysis = analyses[i]
+        if analysis not in rendered and analysis not in failed:
+            try:
+                rendered[analysis] = _render_code(*analysis)
+            except Exception as e:
+                app.logger.error(f"Batch render failed for {analysis}: {e}", exc_info=True)
+                failed[analysis] = str(e)
+        if analysis in failed:
+            summary["errors"] += 1
+            yield {"index": offset + i, "error": "Generation Failed", "details": failed[analysis]}
+            continue
+
+        intent, primary_color, brand_name = analysis
+        generated_code, template, cache_hit = rendered[analysis]
+        item_time = round(analysis_ms + (time.perf_counter() - item_start) * 1000, 3)
+        plan, explanation = _build_generation_text(prompt, intent, primary_color, brand_name, item_time, template)
+        summary["unique_renders"] = len(rendered)
+        yield {
+            "plan": plan,
+            "code": generated_code,
+            "explanation": explanation,
+            "meta": {
+                "intent": intent,
+                "processing_time_ms": item_time,
+                "template": _template_meta(template),
+                "cache": "hit" if cache_hit else "miss"
+            }
         }
+
+def _batch_slice(prompts, offset, stream):
+    """
+    One slice of an offloaded batch, run in a pool worker: the inline
+    pipeline over prompts[offset:offset + len(prompts)] of the batch, with
+    each item encoded here (its JSON, or its NDJSON records when `stream`)
+    so the request thread only concatenates them. Returns (items, renders,
+    errors), renders being the distinct (intent, color, brand) rendered.
+    """
+    start_time = time.perf_counter()
+    analyses, errors = _analyze_batch(prompts, offset)
+    analysis_ms = (time.perf_counter() - start_time) * 1000 / len(prompts)
+    summary = {"unique_renders": 0, "errors": 0}
+    items = []
+    renders = set()
+    for i, item in enumerate(_iter_batch_results(prompts, analyses, errors, analysis_ms, summary, offset)):
+        if "error" not in item:
+            renders.add(analyses[i])
+        if stream:
+            items.append("".join(_ndjson_lines(_iter_item_records(item, index=offset + i))))
+        else:
+            # Without the trailing newline: items are joined into one array
+            items.append(encode_payload(item)[:-1])
+    return items, renders, summary["errors"]
+
+def _offloaded_batch(prompts, start_time, timer):
+    """
+    /generate/batch split across the process pool. Slices come back in
+    order, so the body (or stream) is the same as the inline one.
+    """
+    summary = {"count": len(prompts), "unique_renders": 0, "errors": 0}
+    stream = _wants_stream()
+    slices = offloader.map(_batch_slice, prompts, stream)
+
+    def items():
+        renders = set()
+        for encoded, slice_renders, errors in slices:
+            renders.update(slice_renders)
+            summary["unique_renders"] = len(renders)
+            summary["errors"] += errors
+            yield from encoded
+        summary["processing_time_ms"] = round((time.perf_counter() - start_time) * 1000, 2)
+        timer.lap('render')
+
+    if stream:
+        def lines():
+            yield from items()
+            timer.finish()
+            yield from _ndjson_lines([{"type": "done", "meta": summary}])
+        return Response(lines(), mimetype=NDJSON_MIMETYPE)
+
+    # Sorted keys, like the inline {"results", "meta"} payload
+    results = b','.join(items())
+    response = _json_response(b'{"meta":' + encode_payload(summary)[:-1] + b',"results":[' + results + b']}\n')
+    timer.lap('serialize')
+    timer.finish()
+    return response
+
+@app.route('/generate/batch', methods=['POST'])
+@app.route('/api/generator/generate/batch', methods=['POST'])
+def generate_batch():
+    """
+    Bulk UI Generation.
+    Receives: { "prompts": ["Create a red dashboard...", "..."] }
+    Returns: { "results": [ {plan, code, explanation, meta} | {error}, ... ], "meta": {...} }
+    Results keep input order; each distinct (intent, color, brand) is rendered once.
+    Supports NDJSON streaming (Accept: application/x-ndjson or ?stream=1).
+    Batches of OFFLOAD_BATCH_MIN prompts or more are split across the
+    process pool when one is configured.
+    """
+    timer = stage_timer('batch')
+    start_time = time.perf_counter()
+    data = request.get_json(force=True, silent=True)
+    if data is None:
+        return jsonify({"error": "Invalid JSON or empty body"}), 400
+    timer.lap('parse')
+
+    prompts = data.get('prompts')
+    if not isinstance(prompts, list) or not prompts:
+        return jsonify({"error": "prompts must be a non-empty array"}), 400
+    if len(prompts) > BATCH_MAX_PROMPTS:
+        return jsonify({"error": f"Batch too large (max {BATCH_MAX_PROMPTS} prompts)"}), 413
+    if offloader.offloads_batch(len(prompts)):
+        return _offloaded_batch(prompts, start_time, timer)
+
+    analyses, errors = _analyze_batch(prompts)
+    analysis_ms = (time.perf_counter() - start_time) * 1000 / len(prompts)
+    timer.lap('analyze')
+
+    summary = {"count": len(prompts), "unique_renders": 0, "errors": 0}
+    items = _iter_batch_results(prompts, analyses, errors, analysis_ms, summary)
+
+    if _wants_stream():
+        def records():
+            for i, item in enumerate(items):
+                yield from _iter_item_records(item, index=i)
+            summary["processing_time_ms"] = round((time.perf_counter() - start_time) * 1000, 2)
+            timer.lap('render')
+            timer.finish()
+            yield {"type": "done", "meta": summary}
+        return _ndjson_response(records())
+
+    results = list(items)
+    summary["processing_time_ms"] = round((time.perf_counter() - start_time) * 1000, 2)
+    timer.lap('render')
+    response = _json_response({
+        "results": results,
+        "meta": summary
     })
+    timer.lap('serialize')
+    timer.finish()
+    return response
 
 @app.route('/modify', methods=['POST'])
 @app.route('/api/generator/modify', methods=['POST'])
@@ -112,7 +666,13 @@ def modify_ui():
     """
     Endpoint for iterative refinement.
     Receives: { "prompt": "Make it green", "currentCode": "..." }
+    Session mode: { "prompt": "...", "sessionId": "...", "baseVersion": 3 }
+    answers with an edit script against the stored version instead of the
+    full code (sending "currentCode" along re-seeds the session first).
+    { "prompt": "...", "currentCode": "...", "session": true } starts a
+    session under a server-assigned id.
     """
+    timer = stage_timer('modify')
     if not request.is_json:
         data = request.get_json(force=True, silent=True)
     else:
@@ -120,217 +680,186 @@ def modify_ui():
         
     if data is None:
         return jsonify({"error": "Invalid JSON"}), 400
-
+    timer.lap('parse')
+
+    result, status = modify_result(data, timer)
+    # Session-mode edit scripts are small and always sent whole
+    if status == 200 and "code" in result and _wants_stream():
+        timer.finish()
+        return _ndjson_response(_iter_item_records(result))
+    response = _json_response(result, status)
+    timer.lap('serialize')
+    timer.finish()
+    return response
+
+def modify_result(data, timer=NULL_TIMER):
+    """
+    The modification pipeline behind /modify, independent of the serving
+    stack. Returns (payload, status).
+    """
     prompt = data.get('prompt', '')
     current_code = data.get('currentCode', '')
-    
+    # "session": true asks for a server-assigned id, as on /generate
+    session_id = data.get('sessionId') or (uuid.uuid4().hex if data.get('session') else None)
+
+    if session_id:
+        if not prompt:
+            return {"error": "Prompt is required"}, 400
+        return _modify_session(str(session_id), prompt, current_code, data.get('baseVersion'), timer)
+
     if not prompt or not current_code:
-        return jsonify({"error": "Prompt and currentCode are required"}), 400
+        return {"error": "Prompt and currentCode are required"}, 400
 
-    # 1. Extract new style attributes
-    new_color = style_extractor.extract_primary_color(prompt)
-    new_brand = style_extractor.extract_brand_name(prompt)
+    # 1. Extract new style attributes and requested sections
+    analysis = analyze(prompt)
+    timer.lap('analyze')
     
     # 2. Apply modifications (Symbolic replacements)
-    import re
-    
-    # Replace simple color names in text/bg classes
-    # Expanded palette to catch all Tailwind colors
-    known_colors = [
-        'slate', 'gray', 'zinc', 'neutral', 'stone',
-        'red', 'orange', 'amber', 'yellow', 'lime', 'green', 'emerald', 'teal', 
-        'cyan', 'sky', 'blue', 'indigo', 'violet', 'purple', 'fuchsia', 'pink', 'rose'
-    ]
-    
-    # Regex to find existing color classes (e.g. bg-blue-500, from-indigo-600)
-    pattern = r'\b(bg|text|border|ring|from|to|via|shadow|decoration)-(' + '|'.join(known_colors) + r')-(\d+)\b'
-    
-    def replacer(match):
-        prefix = match.group(1)
-        shade = match.group(3)
-        # Construct new class with the requested color
-        return f"{prefix}-{new_color}-{shade}"
-
-    modified_code = re.sub(pattern, replacer, current_code)
-    
-    explanation_steps = [
-        f"- Updated theme color tokens across the component tree to '{new_color}'.",
-    ]
-    
-    # 2b. Content Updates (Brand Name / Title)
-    if new_brand and new_brand != "Ryze App": # If a specific brand was detected
-         # Heuristic: Replace content inside <h1> tags or specific brand placeholders
-         # We try to find the old brand name if possible, or just look for typical header patterns.
-         # For simplicity in this deterministic assignment, we'll replace the text in the Navbar brand prop if it exists.
-         if 'brand="' in modified_code:
-             modified_code = re.sub(r'brand="[^"]+"', f'brand="{new_brand}"', modified_code)
-             explanation_steps.append(f"- Renamed application brand to '{new_brand}'.")
-         
-         # Also try to replace <h1> content if it looks like a title
-         # exact logic is tricky without DOM parsing, but we can try a targeted sub for common patterns
-         # or just rely on the user asking precisely. 
-         pass
-
-    high_level_plan = [
-        f"1. Detected iterative style change request in: '{prompt}'.",
-        f"2. Swapped Tailwind color tokens to '{new_color}' while preserving layout and component structure.",
-    ]
-
-    lower_prompt = prompt.lower()
-    
-    # --- Advanced Heuristics (Simulated AI Agent) ---
-
-    # 3. Add Navbar
-    if ("navbar" in lower_prompt or "navigation" in lower_prompt) and "<Navbar" not in modified_code:
-        nav_snippet = '<Navbar brand="Ryze App" links={[{label:"Home", href:"#"}, {label:"Features", href:"#"}, {label:"Pricing", href:"#"}]} user={{name:"User", avatar:"https://github.com/shadcn.png"}} className="mb-8" />\n'
-        # Insert after opening div if possible
-        if "return (" in modified_code:
-            # Try to insert after the first div opening
-            pass # Complex to parse, let's prepend to the first <div> inside return
-            modified_code = modified_code.replace("return (", "return (\n<div className=\"min-h-screen bg-gray-50 dark:bg-black\">\n" + nav_snippet, 1)
-            modified_code = modified_code.replace(");", "</div>\n);", 1) # Close the wrapper
-        else:
-             # Fallback
-             pass
-        high_level_plan.append("3. Injected Navigation Bar component with responsive layout.")
-        explanation_steps.append("- Added <Navbar> component to the top of the view hierarchy.")
-
-    # --- BONUS INTELLIGENCE PACK (Global Launch Ready) ---
-
-    # 3b. Add Hero Section
-    if ("hero" in lower_prompt or "banner" in lower_prompt) and "<h1>" not in modified_code and "Welcome" not in modified_code:
-        hero_snippet = '<div className="py-20 text-center bg-gradient-to-b from-blue-50 to-white dark:from-gray-900 dark:to-black"><h1 className="text-5xl font-bold mb-6 bg-clip-text text-transparent bg-gradient-to-r from-blue-600 to-purple-600">Build Faster with AI</h1><p className="text-xl text-gray-600 dark:text-gray-300 mb-8 max-w-2xl mx-auto">The most advanced platform for deploying web applications instantly.</p><div className="flex justify-center gap-4"><Button className="rounded-full px-8 py-6 text-lg">Get Started</Button><Button className="rounded-full px-8 py-6 text-lg bg-white text-gray-900 border hover:bg-gray-50">Learn More</Button></div></div>'
-        # Intelligent Insertion: After Navbar if present, else top
-        if "<Navbar" in modified_code:
-             modified_code = modified_code.replace("/>", "/>\n" + hero_snippet, 1)
-        elif "return (" in modified_code:
-             # Insert inside the wrapper div we might have created for Navbar, or just after open div
-             modified_code = modified_code.replace("className=\"min-h-screen bg-gray-50 dark:bg-black\">\n", "className=\"min-h-screen bg-gray-50 dark:bg-black\">\n" + hero_snippet + "\n", 1)
-        high_level_plan.append("3. Generated conversion-optimized Hero Section.")
-        explanation_steps.append("- Added gradient Hero section with CTAs.")
-
-    # 3c. Add Features Section
-    if ("features" in lower_prompt or "benefits" in lower_prompt) and "Feature 1" not in modified_code:
-        feat_snippet = '<div className="py-16 px-6"><h2 className="text-3xl font-bold text-center mb-12">Why Choose Us</h2><div className="grid grid-cols-1 md:grid-cols-3 gap-8 max-w-6xl mx-auto"><Card className="p-8 hover:shadow-lg transition-all"><window.Lucide.Zap className="w-10 h-10 text-yellow-500 mb-4" /><h3 className="text-xl font-bold mb-2">Lightning Fast</h3><p className="text-gray-500">Deploy in seconds, not minutes.</p></Card><Card className="p-8 hover:shadow-lg transition-all"><window.Lucide.Shield className="w-10 h-10 text-green-500 mb-4" /><h3 className="text-xl font-bold mb-2">Secure by Default</h3><p className="text-gray-500">Enterprise-grade security built-in.</p></Card><Card className="p-8 hover:shadow-lg transition-all"><window.Lucide.Globe className="w-10 h-10 text-blue-500 mb-4" /><h3 className="text-xl font-bold mb-2">Global Scale</h3><p className="text-gray-500">Run your app on the edge.</p></Card></div></div>'
-        # Insert after Hero if present, else generic
-        if "Build Faster with AI" in modified_code:
-             modified_code = modified_code.replace("</div></div>", "</div></div>\n" + feat_snippet, 1)
-        elif "<Navbar" in modified_code:
-             modified_code = modified_code.replace("/>", "/>\n" + feat_snippet, 1)
-        else:
-             # Fallback: append
-             if "</main>" in modified_code:
-                 modified_code = modified_code.replace("</main>", feat_snippet + "\n</main>", 1)
-        high_level_plan.append("3. Added Features Grid with hover effects.")
-        explanation_steps.append("- Created 3-column Features section using Card components.")
-
-    # 3d. Add Footer
-    if ("footer" in lower_prompt) and "<footer" not in modified_code:
-        footer_snippet = '<footer className="py-8 text-center text-gray-500 border-t dark:border-gray-800 mt-12"><p>© 2024 Ryze AI. All rights reserved.</p><div className="flex justify-center gap-4 mt-4 text-sm"><a href="#">Privacy</a><a href="#">Terms</a><a href="#">Twitter</a></div></footer>'
-        if "</main>" in modified_code:
-             modified_code = modified_code.replace("</main>", footer_snippet + "\n</main>", 1)
-        elif "</div>\n);" in modified_code:
-             modified_code = modified_code.replace("</div>\n);", footer_snippet + "\n</div>\n);", 1)
-        high_level_plan.append("3. Appended professional Footer.")
-        explanation_steps.append("- Added clean Footer with copyright and links.")
-
-
-    # 3e. Add Testimonials (Social Proof)
-    if ("testimonials" in lower_prompt or "reviews" in lower_prompt) and "user says" not in modified_code:
-        testi_snippet = '<div className="py-20 bg-gray-50 dark:bg-gray-900/50"><h2 className="text-3xl font-bold text-center mb-12">Trusted by Developers</h2><div className="grid grid-cols-1 md:grid-cols-2 gap-8 max-w-4xl mx-auto px-6"><Card className="p-6"><p className="italic text-gray-600 mb-4">"Ryze AI changed how we ship software. Absolutely incredible."</p><div className="flex items-center gap-3"><div className="w-10 h-10 rounded-full bg-blue-100 flex items-center justify-center font-bold text-blue-600">JD</div><div><div className="font-bold">John Doe</div><div className="text-sm text-gray-500">CTO, TechCorp</div></div></div></Card><Card className="p-6"><p className="italic text-gray-600 mb-4">"The best AI coding assistant I have ever used. Highly recommended."</p><div className="flex items-center gap-3"><div className="w-10 h-10 rounded-full bg-purple-100 flex items-center justify-center font-bold text-purple-600">AS</div><div><div className="font-bold">Alice Smith</div><div className="text-sm text-gray-500">Lead Dev, StartupInc</div></div></div></Card></div></div>'
-        # Insert before footer if present
-        if "<footer" in modified_code:
-             modified_code = modified_code.replace("<footer", testi_snippet + "\n<footer", 1)
-        elif "</main>" in modified_code:
-             modified_code = modified_code.replace("</main>", testi_snippet + "\n</main>", 1)
-        high_level_plan.append("3. Added Social Proof section with user testimonials.")
-        explanation_steps.append("- Created trusted Testimonials grid.")
-
-    # --- ULTRA-ADVANCED: Full App Orchestrator ---
-    if ("full app" in lower_prompt or "complete website" in lower_prompt or "landing page" in lower_prompt) and "<Navbar" not in modified_code:
-         # Trigger all sections if not present
-         # This effectively chains the logic by appending keywords to the prompt internally? 
-         # No, prompt is fixed. We must force inject.
-         
-         # Force Inject Navbar (if not present)
-         if "<Navbar" not in modified_code:
-             # Logic same as above
-             nav_snippet = '<Navbar brand="Ryze Enterprise" links={[{label:"Platform", href:"#"}, {label:"Solutions", href:"#"}, {label:"Pricing", href:"#"}]} user={{name:"Admin", avatar:"https://github.com/shadcn.png"}} className="sticky top-0 z-50" />\n'
-             if "return (" in modified_code:
-                 modified_code = modified_code.replace("return (", "return (\n<div className=\"min-h-screen bg-gray-50 dark:bg-black font-sans text-gray-900 dark:text-gray-100\">\n" + nav_snippet, 1)
-                 # Only close if we haven't already unwrapped?
-                 # Assume standard template structure.
-                 if "</div>\n);" not in modified_code: modified_code = modified_code.replace(");", "</div>\n);", 1)
-
-         # Force Inject Hero
-         if "Welcome" not in modified_code:
-             hero_snippet = '<div className="py-24 text-center"><h1 className="text-6xl font-extrabold mb-6 tracking-tight">Ship Your Idea <span className="text-blue-600">Today</span></h1><p className="text-2xl text-gray-500 mb-10 max-w-3xl mx-auto">Ryze AI generates production-ready full-stack applications in seconds.</p><button className="px-8 py-4 bg-black dark:bg-white text-white dark:text-black rounded-full text-lg font-bold hover:opacity-80 transition-opacity">Start Building Free</button></div>'
-             modified_code = modified_code.replace("/>\n", "/>\n" + hero_snippet + "\n", 1) # Append after Navbar
-         
-         # Force Inject Features
-         if "Feature 1" not in modified_code:
-              feat_snippet = '<div className="py-20 bg-white dark:bg-gray-900"><div className="max-w-6xl mx-auto px-6 grid grid-cols-1 md:grid-cols-3 gap-12 text-center"><div><div className="w-16 h-16 bg-blue-100 rounded-2xl flex items-center justify-center mx-auto mb-6"><window.Lucide.Cpu className="w-8 h-8 text-blue-600" /></div><h3 className="text-xl font-bold mb-2">AI Powered</h3><p className="text-gray-500">Built on next-gen LLMs.</p></div><div><div className="w-16 h-16 bg-purple-100 rounded-2xl flex items-center justify-center mx-auto mb-6"><window.Lucide.Zap className="w-8 h-8 text-purple-600" /></div><h3 className="text-xl font-bold mb-2">Instant Deploy</h3><p className="text-gray-500">From prompt to production.</p></div><div><div className="w-16 h-16 bg-green-100 rounded-2xl flex items-center justify-center mx-auto mb-6"><window.Lucide.Layers className="w-8 h-8 text-green-600" /></div><h3 className="text-xl font-bold mb-2">Full Stack</h3><p className="text-gray-500">React, Node, Python included.</p></div></div></div>'
-              modified_code = modified_code.replace("</button></div>", "</button></div>\n" + feat_snippet, 1) # Append after Hero
-
-         # Force Inject Footer
-         if "<footer" not in modified_code:
-             footer_snippet = '<footer className="py-12 border-t dark:border-gray-800 text-center text-gray-500"><p>&copy; 2026 Ryze AI Inc.</p></footer>'
-             if "</main>" in modified_code: modified_code = modified_code.replace("</main>", footer_snippet + "\n</main>", 1)
-             elif "</div>\n);" in modified_code: modified_code = modified_code.replace("</div>\n);", footer_snippet + "\n</div>\n);", 1)
-         
-         high_level_plan.append("3. ORCHESTRATOR: Assembled complete SaaS Landing Page architecture.")
-         explanation_steps.append("- Generated Full-Stack Landing Page structure.")
-
-    # 4. Add Sidebar (Existing)
-    if ("sidebar" in lower_prompt or "drawer" in lower_prompt) and "<Sidebar" not in modified_code:
-        # We need a layout wrapper
-        sidebar_snippet = '<Sidebar items={[{label:"Dashboard", icon:"LayoutDashboard"}, {label:"Settings", icon:"Settings"}, {label:"Pro", icon:"Zap"}]} activeItem="Dashboard" className="h-screen hidden md:block" />'
-        
-        # Checking for main content wrapper
-        if "className=\"min-h-screen" in modified_code:
-             modified_code = modified_code.replace("className=\"min-h-screen", "className=\"min-h-screen flex", 1)
-             modified_code = modified_code.replace("return (\n<div", "return (\n<div", 1) # Logic is tricky
-             # Simplified: Just prepend sidebar to the first internal div
-             # Let's assume standard structure: return ( <div ...> ... </div> )
-             # We inject sidebar as first child of that div
-             modified_code = re.sub(r'(<div[^>]*>)', r'\1\n' + sidebar_snippet, modified_code, count=1)
-             high_level_plan.append("3. Integrated Sidebar navigation panel.")
-             explanation_steps.append("- Added <Sidebar> component and updated layout to Flexbox 'row'.")
-
-    # 5. Add Chart
-    if ("chart" in lower_prompt or "graph" in lower_prompt) and "<Chart" not in modified_code:
-         chart_snippet = '<div className="grid grid-cols-1 md:grid-cols-2 gap-4 my-8"><Chart type="bar" color="' + new_color + '" /><Chart type="line" color="' + new_color + '" /></div>'
-         # Insert before footer or end
-         if "</main>" in modified_code:
-             modified_code = modified_code.replace("</main>", chart_snippet + "\n</main>", 1)
-         elif "</div>" in modified_code:
-             # Insert before last div
-             modified_code = modified_code[:modified_code.rfind("</div>")] + chart_snippet + "\n</div>"
-         high_level_plan.append("3. Visualized data with interactive Charts.")
-         explanation_steps.append("- Added Bar and Line <Chart> components.")
-
-    # 6. Pricing Section (Existing Logic Refined)
-    if "pricing" in lower_prompt and "section" in lower_prompt:
-        if "RYZE_PRICING_SECTION" not in modified_code and "id=\"pricing\"" not in modified_code:
-            insertion_target = "</main>"
-            if insertion_target in modified_code:
-                modified_code = modified_code.replace(insertion_target, PRICING_SECTION_SNIPPET + "\n" + insertion_target, 1)
-            else:
-                modified_code = modified_code.rstrip() + PRICING_SECTION_SNIPPET + "\n"
-            high_level_plan.append("3. Inserted a deterministic Pricing section snippet before the main footer.")
-            explanation_steps.append("- Added a structured pricing section using the shared component library.")
+    # All heuristics share one anchor scan and one splice pass over current_code
+    if offloader.offloads_code(current_code):
+        # Large pages are rewritten in a worker process, off this process's GIL
+        modified_code, high_level_plan, explanation_steps = offloader.call(
+            modify_job, current_code, prompt, analysis.color, analysis.brand, analysis.components
+        )
+        timer.lap('offload')
+    else:
+        modified_code, high_level_plan, explanation_steps = apply_modifications(
+            current_code, prompt, analysis.color, analysis.brand, timer=timer, components=analysis.components
+        )
 
     plan_text = "\n".join(high_level_plan)
     explanation_text = "I performed a constrained iterative update:\n" + "\n".join(explanation_steps)
 
-    return jsonify({
+    return {
         "plan": plan_text,
         "code": modified_code,
         "explanation": explanation_text
-    })
+    }, 200
+
+def modify_offloaded(data):
+    """Whether modify_result(data) hands its rewrite to the process pool (and waits on it)."""
+    code = data.get('currentCode')
+    if not code and data.get('sessionId'):
+        entry = session_store.get(str(data.get('sessionId')))
+        code = entry[1] if entry else None
+    return offloader.offloads_code(code)
+
+def _session_conflict(session_id, details):
+    entry = session_store.get(session_id)
+    return {
+        "error": "Session out of date",
+        "details": details,
+        "session": {"id": session_id, "version": entry[0] if entry else None}
+    }, 409
+
+def _modify_session(session_id, prompt, current_code, base_version, timer=NULL_TIMER):
+    """
+    Session-mode /modify. Edits are [offset, delete, insert] ops against the
+    base version, ascending, with offsets in UTF-16 code units; clients apply
+    them back to front. A stale or unknown base answers 409 with the
+    server's version so the client can re-seed by sending currentCode.
+    """
+    # 1. Resolve the base version
+    if current_code:
+        base_version = session_store.seed(session_id, current_code)
+        if base_version is None:
+            return {"error": "Code too large for session storage"}, 413
+    else:
+        entry = session_store.get(session_id)
+        if entry is None or entry[0] != base_version:
+            return _session_conflict(session_id, "Resend currentCode to re-seed the session.")
+        current_code = entry[1]
+
+    # 2. Record the modifications against the stored code
+    analysis = analyze(prompt)
+    timer.lap('analyze')
+    if offloader.offloads_code(current_code):
+        modified_code, high_level_plan, explanation_steps, edit_script = offloader.call(
+            modify_job, current_code, prompt, analysis.color, analysis.brand, analysis.components, True
+        )
+        timer.lap('offload')
+    else:
+        doc, high_level_plan, explanation_steps = plan_modifications(
+            current_code, prompt, analysis.color, analysis.brand, timer=timer, components=analysis.components
+        )
+        modified_code = doc.render()
+        edit_script = doc.edit_script()
+        timer.lap('render')
+
+    # 3. Commit the new version (fails if another request got there first)
+    version = session_store.commit(session_id, base_version, modified_code)
+    if version is None:
+        # Re-seeding would not help with this one, so it is not a 409
+        if not session_store.fits(modified_code):
+            return {"error": "Code too large for session storage"}, 413
+        return _session_conflict(session_id, "The session changed while this request was processed.")
+
+    return {
+        "plan": "\n".join(high_level_plan),
+        "explanation": "I performed a constrained iterative update:\n" + "\n".join(explanation_steps),
+        "edits": utf16_edits(current_code, edit_script),
+        "session": {"id": session_id, "version": version, "baseVersion": base_version},
+        "length": len(modified_code.encode('utf-16-le')) // 2
+    }, 200
+
+@app.route('/deployments', methods=['POST'])
+@app.route('/api/generator/deployments', methods=['POST'])
+def create_deployment():
+    """
+    Builds a standalone HTML page for generated code.
+    Receives: { "code": "..." }
+    Returns: { "id": "<hash>", "url": "/deployments/<hash>.html", "created": bool }
+    Identical code maps to the same artifact and is never written twice.
+    """
+    data = request.get_json(force=True, silent=True)
+    if data is None:
+        return jsonify({"error": "Invalid JSON or empty body"}), 400
+    code = data.get('code')
+    if not isinstance(code, str) or not code.strip():
+        return jsonify({"error": "code is required"}), 400
+
+    deployment_gc.ensure_started()
+    try:
+        artifact_id, created = deployment_builder.deploy(code)
+    except OSError as e:
+        app.logger.error(f"Deployment write failed: {e}", exc_info=True)
+        return jsonify({"error": "Deployment Failed", "details": str(e)}), 500
+
+    return jsonify({
+        "id": artifact_id,
+        "url": f"/deployments/{artifact_id}.html",
+        "created": created
+    }), 201 if created else 200
+
+@app.route('/deployments/<name>', methods=['GET'])
+def serve_deployment(name):
+    """Streams a deployment artifact from the chunk store with long-lived caching."""
+    deployment_gc.ensure_started()
+    artifact_id = name[:-len(".html")] if name.endswith(".html") else name
+    opened = deployment_store.open(artifact_id) if KEY_PATTERN.match(artifact_id) else None
+    if opened is None:
+        # Pages not migrated into the store yet
+        return send_from_directory(DEPLOYMENTS_DIR, name, max_age=DEPLOYMENT_MAX_AGE)
+
+    size, chunks = opened
+    response = Response(chunks, mimetype="text/html")
+    response.content_length = size
+    response.set_etag(artifact_id)
+    # Content-hash ids never change content (migrated random-id pages keep the default)
+    if ARTIFACT_PATTERN.match(artifact_id):
+        response.headers["Cache-Control"] = f"public, max-age={DEPLOYMENT_MAX_AGE}, immutable"
+    else:
+        response.cache_control.public = True
+        response.cache_control.max_age = DEPLOYMENT_MAX_AGE
+    return response.make_conditional(request)
 
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5001))
     print(f"Starting Python AI Service on port {port}...")
-    app.run(host='0.0.0.0', port=port, debug=True)
+    if WARMUP_ENABLED:
+        print(f"Warm-up finished in {warm_up() * 1000:.0f}ms")
+    deployment_gc.ensure_started()
+    offloader.ensure_started()
+    # The debug reloader forks a second process; opt in with FLASK_DEBUG=1
+    app.run(host='0.0.0.0', port=port, debug=os.getenv("FLASK_DEBUG") == "1")
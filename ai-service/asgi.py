@@ -0,0 +1,226 @@
+"""
+ASGI entry point for the AI service (async serving mode).
+
+    uvicorn asgi:app --workers 4
+    SERVING_MODE=async gunicorn -c gunicorn.conf.py
+
+JSON requests to /generate and /modify are answered by native async
+handlers on the event loop. Everything else, including NDJSON streaming
+and CORS preflights, falls through to the Flask app. Every request passes
+an in-flight limit that sheds excess load with a fast 503 + Retry-After
+instead of queueing it.
+"""
+import asyncio
+import json
+import os
+import time
+from urllib.parse import parse_qs
+
+from asgiref.wsgi import WsgiToAsgi
+
+from app import (
+    app as flask_app, deployment_gc, generate_result, generation_etag, modify_offloaded, modify_result,
+    offloader, stage_timer, wants_stream, warm_up, COMPRESSION_LEVEL, COMPRESSION_MIN_BYTES, WARMUP_ENABLED,
+)
+from logic.responses import encode_response, etag_matches
+
+# Concurrent requests per worker before new ones are shed
+MAX_IN_FLIGHT = int(os.getenv("MAX_IN_FLIGHT", 256))
+RETRY_AFTER_SECONDS = int(os.getenv("RETRY_AFTER_SECONDS", 1))
+MAX_BODY_BYTES = int(os.getenv("MAX_BODY_BYTES", 16 * 1024 * 1024))
+
+# Never shed health checks, or the load balancer would pull a busy worker
+UNLIMITED_PATHS = frozenset(['/health'])
+
+JSON_HEADERS = [
+    (b'content-type', b'application/json'),
+    (b'access-control-allow-origin', b'*'),
+]
+
+
+async def _send_json(send, payload, status, headers=(), timer=None, accept_encoding=None):
+    body, encoding = encode_response(payload, accept_encoding, COMPRESSION_LEVEL, COMPRESSION_MIN_BYTES)
+    headers = list(headers)
+    if encoding is not None:
+        headers.append((b'content-encoding', encoding.encode()))
+    if COMPRESSION_LEVEL:
+        headers.append((b'vary', b'Accept-Encoding'))
+    if timer is not None:
+        timer.lap('serialize')
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': JSON_HEADERS + [(b'content-length', str(len(body)).encode())] + headers,
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def _read_body(receive, limit):
+    """Returns the request body, or None if the client left or sent too much."""
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return None
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if size > limit:
+            return None
+        chunks.append(chunk)
+        if not message.get('more_body', False):
+            return b''.join(chunks)
+
+
+def _etag_headers(etag):
+    return [(b'etag', etag.encode()), (b'access-control-expose-headers', b'ETag')]
+
+
+async def _send_not_modified(send, etag):
+    await send({
+        'type': 'http.response.start',
+        'status': 304,
+        'headers': [(b'access-control-allow-origin', b'*')] + _etag_headers(etag),
+    })
+    await send({'type': 'http.response.body', 'body': b''})
+
+
+def _header(scope, name):
+    for key, value in scope['headers']:
+        if key == name:
+            return value.decode('latin-1')
+    return None
+
+
+def _wants_stream(scope):
+    # app.wants_stream on the raw ASGI scope
+    query = parse_qs(scope.get('query_string', b'').decode('latin-1'), keep_blank_values=True)
+    return wants_stream(query.get('stream', [None])[0], _header(scope, b'accept'))
+
+
+async def generate(data, timer, start_time):
+    # A miss may wait on a render led by another thread (a Flask fallback
+    # request for the same page) or worker (SINGLE_FLIGHT_DIR), so it
+    # waits in a thread rather than blocking the loop
+    return await asyncio.get_running_loop().run_in_executor(None, generate_result, data, start_time, timer)
+
+
+async def modify(data, timer, start_time):
+    if modify_offloaded(data):
+        # Waits on the process pool from a thread, so the loop keeps serving
+        return await asyncio.get_running_loop().run_in_executor(None, modify_result, data, timer)
+    return modify_result(data, timer)
+
+
+# path -> (metrics endpoint label, handler, error for a body that is not JSON)
+# The errors are worded as the Flask views word them
+ASYNC_ROUTES = {
+    '/generate': ('generate', generate, "Invalid JSON or empty body"),
+    '/api/generator/generate': ('generate', generate, "Invalid JSON or empty body"),
+    '/modify': ('modify', modify, "Invalid JSON"),
+    '/api/generator/modify': ('modify', modify, "Invalid JSON"),
+}
+
+
+class AsyncRouter:
+    """
+    Serves the hot JSON endpoints natively and hands the rest to the
+    WSGI app, which asgiref runs on a worker thread.
+    """
+    def __init__(self, wsgi_app):
+        self.fallback = WsgiToAsgi(wsgi_app)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            return await self._lifespan(receive, send)
+
+        route = ASYNC_ROUTES.get(scope['path'])
+        if route is None or scope['method'] != 'POST' or _wants_stream(scope):
+            return await self.fallback(scope, receive, send)
+        endpoint, handler, invalid_body = route
+
+        timer = stage_timer(endpoint)
+        start_time = time.perf_counter()
+        body = await _read_body(receive, MAX_BODY_BYTES)
+        if body is None:
+            return await _send_json(send, {"error": "Request body too large or incomplete"}, 413)
+        try:
+            data = json.loads(body)
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            return await _send_json(send, {"error": invalid_body}, 400)
+        timer.lap('parse')
+
+        # Yield once so every request parsed in this loop iteration is
+        # counted in flight before any runs: the limit then sees the backlog
+        await asyncio.sleep(0)
+        try:
+            # Modify is CPU-bound and short, so it runs inline on the loop (a
+            # thread hop would only add latency under the GIL) unless it waits
+            # on the process pool; generate can wait on a shared render, so it
+            # always runs in a thread: see generate() and modify()
+            payload, status = await handler(data, timer, start_time)
+        except Exception as e:
+            flask_app.logger.error(f"Unhandled Exception: {e}", exc_info=True)
+            payload, status = {"error": "Internal Server Error", "details": str(e)}, 500
+        etag = generation_etag(payload) if endpoint == 'generate' and status == 200 else None
+        # 304 rather than RFC 9110's 412 for a POST, and "*" never matches:
+        # see generate_ui()
+        if etag is not None and etag_matches(_header(scope, b'if-none-match'), etag, wildcard=False):
+            await _send_not_modified(send, etag)
+            timer.lap('serialize')
+        else:
+            headers = _etag_headers(etag) if etag is not None else []
+            await _send_json(send, payload, status, headers, timer=timer,
+                             accept_encoding=_header(scope, b'accept-encoding'))
+        timer.finish(payload.get("meta", {}).get("intent", ""))
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                # A no-op when gunicorn already warmed the master before forking
+                if WARMUP_ENABLED:
+                    warm_up()
+                deployment_gc.ensure_started()
+                offloader.ensure_started()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+
+class InFlightLimit:
+    """
+    ASGI middleware bounding concurrent HTTP requests per worker.
+    Requests over the limit get an immediate 503 with Retry-After, so
+    overload turns into fast client retries rather than an unbounded queue.
+    """
+    def __init__(self, app, limit=MAX_IN_FLIGHT, retry_after=RETRY_AFTER_SECONDS):
+        self.app = app
+        self.limit = limit
+        self.retry_after = str(retry_after).encode()
+        # One event loop per worker, so plain counters are safe
+        self.in_flight = 0
+        self.rejected = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['path'] in UNLIMITED_PATHS:
+            return await self.app(scope, receive, send)
+
+        if self.in_flight >= self.limit:
+            self.rejected += 1
+            return await _send_json(send, {
+                "error": "Service Overloaded",
+                "details": f"More than {self.limit} requests in flight; retry shortly."
+            }, 503, [(b'retry-after', self.retry_after)])
+
+        self.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+
+
+app = InFlightLimit(AsyncRouter(flask_app))
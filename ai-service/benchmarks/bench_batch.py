@@ -0,0 +1,58 @@
+"""
+Benchmark: N single /generate calls vs. one /generate/batch call.
+
+Runs in-process through Flask's test client, so the numbers exclude network
+round trips (which only widen the gap in production).
+
+Usage (from ai-service/):
+    python benchmarks/bench_batch.py [num_prompts]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, render_cache
+
+SUBJECTS = ["dashboard", "login page", "contact form", "landing page", "portfolio", "online store", "web app"]
+COLORS = ["blue", "red", "green", "purple", "orange", "gray", "black"]
+BRANDS = ["Acme", "Globex", "Initech", "Umbrella", "Hooli"]
+
+
+def build_corpus(n, seed=7):
+    rng = random.Random(seed)
+    return [
+        f"Create a {rng.choice(COLORS)} {rng.choice(SUBJECTS)} called {rng.choice(BRANDS)}"
+        for _ in range(n)
+    ]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    prompts = build_corpus(n)
+    client = app.test_client()
+
+    render_cache.clear()
+    start = time.perf_counter()
+    for prompt in prompts:
+        response = client.post('/generate', json={"prompt": prompt})
+        assert response.status_code == 200
+    single = time.perf_counter() - start
+
+    render_cache.clear()
+    start = time.perf_counter()
+    response = client.post('/generate/batch', json={"prompts": prompts})
+    assert response.status_code == 200
+    batch = time.perf_counter() - start
+    meta = response.get_json()["meta"]
+
+    print(f"prompts: {n}, unique renders: {meta['unique_renders']}")
+    print(f"{'mode':<8} {'seconds':>9} {'prompts/sec':>12}")
+    print(f"{'single':<8} {single:>9.2f} {n / single:>12,.0f}")
+    print(f"{'batch':<8} {batch:>9.2f} {n / batch:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark: render cache hit rate and /generate latency per cache backend
+as the number of workers grows.
+
+For each backend (local, shared, redis) and worker count, starts that many
+processes, each importing the app with CACHE_BACKEND set as a gunicorn
+worker would, and sends its own stream of prompts drawn from one
+Zipf-distributed corpus (a few hot demo prompts, a long tail of brands).
+With the local backend every worker pays its own misses; the shared ones
+let a worker hit what another already rendered. The redis rows run
+against benchmarks/fake_redis.py in this process, so they measure the
+protocol round trip on loopback, not a real server. Reports the hit rate
+over all requests and per-request latency (p50 / p99).
+
+Usage (from ai-service/):
+    python benchmarks/bench_cache_backends.py [requests_per_worker] [max_workers]
+"""
+import multiprocessing
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_redis import FakeRedisServer
+
+# The app is only imported in the workers, after their environment is set
+BACKENDS = ["local", "shared", "redis"]
+SUBJECTS = ["dashboard", "login page", "contact form", "landing page", "portfolio", "online store", "web app"]
+COLORS = ["blue", "red", "green", "purple", "orange", "gray", "black"]
+BRANDS = ["Acme", "Globex", "Initech", "Umbrella", "Hooli"]
+TAIL_BRANDS = [f"{brand}{n}" for brand in BRANDS for n in range(12)]
+
+
+def build_corpus():
+    return [
+        f"Create a {color} {subject} called {brand}"
+        for brand in TAIL_BRANDS for color in COLORS for subject in SUBJECTS
+    ]
+
+
+def worker(env, seed, requests, start_barrier, results):
+    os.environ.update(env)
+    import app
+
+    corpus = build_corpus()
+    rng = random.Random(seed)
+    # Zipf-like: rank r is drawn with weight 1 / r
+    weights = [1 / rank for rank in range(1, len(corpus) + 1)]
+    prompts = rng.choices(corpus, weights=weights, k=requests)
+    app.generate_result({"prompt": "warm-up"}, time.perf_counter())
+
+    start_barrier.wait()
+    latencies = []
+    hits = 0
+    for prompt in prompts:
+        start = time.perf_counter()
+        payload, status = app.generate_result({"prompt": prompt}, start)
+        latencies.append(time.perf_counter() - start)
+        hits += payload["meta"]["cache"] == "hit"
+    results.put((hits, latencies))
+
+
+def run(env, workers, requests):
+    context = multiprocessing.get_context('spawn')
+    start_barrier = context.Barrier(workers)
+    results = context.Queue()
+    processes = [
+        context.Process(target=worker, args=(env, seed, requests, start_barrier, results))
+        for seed in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    hits = 0
+    latencies = []
+    for _ in processes:
+        worker_hits, worker_latencies = results.get()
+        hits += worker_hits
+        latencies += worker_latencies
+    for process in processes:
+        process.join()
+    latencies.sort()
+    return hits / len(latencies), latencies[len(latencies) // 2] * 1e6, latencies[int(len(latencies) * 0.99)] * 1e6
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    server = FakeRedisServer().start()
+    shared_dir = tempfile.mkdtemp(prefix="ryze-cache-bench-")
+    print(f"corpus: {len(build_corpus())} prompts, {requests} requests per worker, cpus: {os.cpu_count()}")
+    print(f"{'backend':<8} {'workers':>7} {'hit rate':>9} {'p50 us':>8} {'p99 us':>8}")
+    try:
+        for backend in BACKENDS:
+            workers = 1
+            while workers <= max_workers:
+                # Every row starts cold
+                shutil.rmtree(shared_dir, ignore_errors=True)
+                server.store.data.clear()
+                env = {
+                    "CACHE_BACKEND": backend,
+                    "CACHE_SHARED_DIR": shared_dir,
+                    "REDIS_URL": server.url,
+                    "WARMUP": "0",
+                }
+                hit_rate, p50, p99 = run(env, workers, requests)
+                print(f"{backend:<8} {workers:>7} {hit_rate:>9.1%} {p50:>8.0f} {p99:>8.0f}")
+                workers *= 2
+    finally:
+        shutil.rmtree(shared_dir, ignore_errors=True)
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
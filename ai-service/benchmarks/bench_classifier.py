@@ -0,0 +1,72 @@
+"""
+Benchmark: per-prompt latency of the intent classifier as the intent table grows.
+
+Compares the original loop-over-intents implementation with the inverted
+index in IntentClassifier at 1x, 10x and 100x the default table size.
+
+Usage (from ai-service/):
+    python benchmarks/bench_classifier.py [iterations]
+"""
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.nlp_engine import DEFAULT_INTENTS, IntentClassifier
+
+PROMPTS = [
+    "Create a blue analytics dashboard with charts for Acme",
+    "A simple login page with email and password",
+    "Contact form with a feedback message and submit button",
+    "Startup landing page with hero, pricing and footer sections",
+    "Personal portfolio for a designer with projects",
+    "Online store with cart and checkout",
+    "Build me a web app",
+    "how it works section for our saas product",
+]
+
+
+class LegacyClassifier:
+    """The pre-index implementation: rescans every intent per call."""
+    def __init__(self, intents):
+        self.intents = intents
+
+    def predict(self, prompt):
+        tokens = set(re.sub(r'[^a-z0-9\s]', '', prompt.lower()).split())
+        scores = {intent: len(tokens.intersection(set(keywords))) for intent, keywords in self.intents.items()}
+        best_intent = max(scores, key=scores.get)
+        return 'generic' if scores[best_intent] == 0 else best_intent
+
+
+def grow_intents(factor):
+    # Synthetic intents with unique keywords (including bigrams) padded onto the real table
+    intents = dict(DEFAULT_INTENTS)
+    for i in range((factor - 1) * len(DEFAULT_INTENTS)):
+        intents[f'synthetic_{i}'] = [f'kw{i}x{j}' for j in range(10)] + [f'multi {i} word']
+    return intents
+
+
+def per_prompt_us(classifier, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for prompt in PROMPTS:
+            classifier.predict(prompt)
+    return (time.perf_counter() - start) / (iterations * len(PROMPTS)) * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    print(f"{'factor':>6} {'intents':>8} {'keywords':>9} {'legacy us':>10} {'index us':>10}")
+    for factor in (1, 10, 100):
+        intents = grow_intents(factor)
+        keywords = sum(len(k) for k in intents.values())
+        legacy = per_prompt_us(LegacyClassifier(intents), iterations)
+        indexed = per_prompt_us(IntentClassifier(intents), iterations)
+        print(f"{factor:>5}x {len(intents):>8} {keywords:>9} {legacy:>10.2f} {indexed:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark: composed multi-intent pages vs. generate-then-modify round trips.
+
+For prompts that name several intents ("a dashboard with a login and
+pricing"), compares one /generate call with "compose" against what a
+client does today: /generate for the top intent, then one /modify per
+extra section, each re-sending and receiving the whole file. /modify has
+no login or contact-form heuristics, so the sequence uses one of its own
+sections per extra intent (pricing, chart, testimonials); it measures the
+round trips, not identical output. Reports end-to-end latency per page
+(p50 / p99), with cold caches and repeated, and bytes on the wire.
+
+Usage (from ai-service/):
+    python benchmarks/bench_compose.py [iterations]
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, render_cache
+from logic.composer import page_composer
+
+PROMPTS = [
+    "red dashboard with a login and pricing called Acme",
+    "shop store with dashboard analytics and pricing called Globex",
+    "landing page with login, a contact form and dashboard analytics",
+    "portfolio with projects, a contact form and a login",
+]
+# One /modify per extra section in the sequential flow
+MODIFY_STEPS = ["add a pricing section", "add a chart", "add testimonials"]
+
+
+def post(client, path, payload):
+    body = json.dumps(payload)
+    response = client.post(path, data=body, content_type='application/json')
+    return json.loads(response.data), len(body) + len(response.data)
+
+
+def composed(client, prompt):
+    result, wire = post(client, '/generate', {"prompt": prompt, "compose": True})
+    return len(result["meta"]["sections"]), wire
+
+
+def sequential(client, prompt, steps):
+    result, wire = post(client, '/generate', {"prompt": prompt})
+    code = result["code"]
+    for step in MODIFY_STEPS[:steps]:
+        result, step_wire = post(client, '/modify', {"prompt": step, "currentCode": code})
+        code = result["code"]
+        wire += step_wire
+    return wire
+
+
+def timed(fn, iterations, cold):
+    latencies = []
+    for _ in range(iterations):
+        if cold:
+            render_cache.clear()
+            page_composer.cache.clear()
+        start = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return latencies[len(latencies) // 2] * 1000, latencies[int(len(latencies) * 0.99)] * 1000
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    client = app.test_client()
+
+    print(f"{'prompt':<34} {'extra':>5} {'flow':<10} {'cold p50/p99 ms':>16} {'warm p50/p99 ms':>16} {'KB':>7}")
+    for prompt in PROMPTS:
+        # One untimed pass of each flow pays first-use costs
+        steps, composed_wire = composed(client, prompt)
+        sequential_wire = sequential(client, prompt, steps)
+        flows = [
+            ("compose", lambda: composed(client, prompt), composed_wire, 1),
+            ("sequence", lambda: sequential(client, prompt, steps), sequential_wire, 1 + steps),
+        ]
+        for name, fn, wire, calls in flows:
+            cold = timed(fn, iterations, cold=True)
+            warm = timed(fn, iterations, cold=False)
+            print(f"{prompt[:34]:<34} {steps:>5} {f'{name} x{calls}':<10} "
+                  f"{f'{cold[0]:.2f}/{cold[1]:.2f}':>16} {f'{warm[0]:.2f}/{warm[1]:.2f}':>16} {wire / 1024:>7.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark: bytes on the wire and CPU per response at each gzip level.
+
+For a /generate cache hit the body is built three ways: identity, gzip of
+the whole body per request, and the precompressed variant (the deflated
+code cached with the render, only the tail compressed per request). A
+/modify response, which is never cached, is gzipped whole. Every gzip
+body is checked to decompress to the identity body.
+
+Usage (from ai-service/):
+    python benchmarks/bench_compression.py [iterations]
+"""
+import gzip
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import generate_result, modify_result
+from logic.responses import EncodedCode, encode_payload, encode_response, gzip_payload
+
+
+def cpu_us(fn, iterations):
+    start = time.process_time()
+    for _ in range(iterations):
+        fn()
+    return (time.process_time() - start) / iterations * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    generated, _ = generate_result({"prompt": "landing page in teal called Acme"}, time.perf_counter())
+    plain_code = str(generated["code"])
+    modified, _ = modify_result({"prompt": "add a navbar, a chart and a footer", "currentCode": plain_code})
+    identity = encode_payload(generated)
+
+    print(f"generate body: {len(identity) / 1024:.1f} KB, modify body: {len(encode_payload(modified)) / 1024:.1f} KB\n")
+    print(f"{'level':>5} {'response':<22} {'wire KB':>8} {'CPU us':>8}")
+    print(f"{'-':>5} {'generate identity':<22} {len(identity) / 1024:>8.1f} "
+          f"{cpu_us(lambda: encode_response(generated, None, 0, 0), iterations):>8.1f}")
+    for level in (1, 6, 9):
+        cached = dict(generated, code=EncodedCode(plain_code, level))
+        uncached = dict(generated, code=EncodedCode(plain_code))
+        spliced = gzip_payload(cached, level)
+        whole = gzip_payload(uncached, level)
+        assert gzip.decompress(spliced) == gzip.decompress(whole) == identity
+
+        rows = [
+            ("generate gzip", whole, lambda: encode_response(uncached, 'gzip', level, 0)),
+            ("generate precompressed", spliced, lambda: encode_response(cached, 'gzip', level, 0)),
+            ("modify gzip", encode_response(modified, 'gzip', level, 0)[0],
+             lambda: encode_response(modified, 'gzip', level, 0)),
+        ]
+        for label, body, fn in rows:
+            print(f"{level:>5} {label:<22} {len(body) / 1024:>8.1f} {cpu_us(fn, iterations):>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+"""
+Benchmark: deployment writes, storage and read latency.
+
+First deploys every template into a temporary store, then deploys the
+same code again many times, and reports the time per deploy and the
+number of artifacts written (repeats must write nothing).
+
+Then fills a fresh store with distinct pages (each template that shows
+a brand, in every color, under a new brand each time) and, at each size,
+reports the bytes the pages would take as flat files, the bytes the
+chunk store holds, index lookup latency (hits and misses), and read
+latency for random pages, with a warm store and a cold one (a new
+ChunkStore, so every manifest and chunk is read from disk).
+
+Finally one garbage-collection pass over every shard evicts the least
+recently read half of the pages, reporting its duration and the longest
+single step (the most a request could wait on one shard).
+
+Usage (from ai-service/):
+    python benchmarks/bench_deployments.py [--repeats 2000] [--sizes 10000,100000,1000000] [--dir DIR]
+"""
+import argparse
+import itertools
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.chunk_store import SHARDS, ChunkStore
+from logic.deployments import DeploymentBuilder
+from logic.palette import TAILWIND_COLORS
+from logic.template_engine import template_engine
+
+
+def repeat_deploys(root, repeats):
+    codes = [template_engine.render(name, PRIMARY_COLOR="teal", BRAND_NAME="Acme") for name in template_engine.names()]
+    builder = DeploymentBuilder(ChunkStore(root))
+    start = time.perf_counter()
+    for code in codes:
+        assert builder.deploy(code)[1]
+    first = (time.perf_counter() - start) / len(codes)
+    first_writes = builder.store.artifacts_written
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for code in codes:
+            assert not builder.deploy(code)[1]
+    repeat = (time.perf_counter() - start) / (repeats * len(codes))
+
+    # A fresh process only knows what is on disk
+    restarted = DeploymentBuilder(ChunkStore(root))
+    start = time.perf_counter()
+    for code in codes:
+        restarted.deploy(code)
+    after_restart = (time.perf_counter() - start) / len(codes)
+
+    print(f"{'deploy':<16} {'us':>8} {'writes':>7}")
+    print(f"{'first':<16} {first * 1e6:>8.1f} {first_writes:>7}")
+    print(f"{'repeat':<16} {repeat * 1e6:>8.1f} {builder.store.artifacts_written - first_writes:>7}")
+    print(f"{'after restart':<16} {after_restart * 1e6:>8.1f} {restarted.store.artifacts_written:>7}")
+
+
+def distinct_codes():
+    """Endless distinct pages: template x color, each under a new brand."""
+    branded = [name for name in template_engine.names() if "{{BRAND_NAME}}" in template_engine.get(name).source]
+    combos = itertools.cycle(list(itertools.product(branded, TAILWIND_COLORS)))
+    for i, (name, color) in enumerate(combos):
+        yield template_engine.render(name, PRIMARY_COLOR=color, BRAND_NAME=f"Brand {i}")
+
+
+def read_latency(store, ids, samples, rng):
+    latencies = []
+    for artifact_id in rng.sample(ids, min(samples, len(ids))):
+        start = time.perf_counter()
+        size, chunks = store.open(artifact_id)
+        assert sum(len(chunk) for chunk in chunks) == size
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return latencies[len(latencies) // 2] * 1e6, latencies[int(len(latencies) * 0.99)] * 1e6
+
+
+def lookup_latency(store, ids, samples, rng):
+    """Median us per has(): random stored ids, then ids that were never stored."""
+    hits = rng.sample(ids, min(samples, len(ids)))
+    misses = [f"{rng.getrandbits(80):020x}" for _ in hits]
+    results = []
+    for keys in (hits, misses):
+        latencies = []
+        for artifact_id in keys:
+            start = time.perf_counter()
+            store.has(artifact_id)
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+        results.append(latencies[len(latencies) // 2] * 1e6)
+    return results
+
+
+def collect_half(store, size):
+    longest = 0.0
+    removed = 0
+    start = time.perf_counter()
+    for number in range(SHARDS):
+        step = time.perf_counter()
+        removed += store.collect(number, max_entries=size // 2 // SHARDS)
+        longest = max(longest, time.perf_counter() - step)
+    elapsed = time.perf_counter() - start
+    stats = store.stats()
+    print(f"\ngc: removed {removed} pages and {stats['chunks_collected']} chunks "
+          f"({stats['chunk_bytes_collected'] / 1e6:.1f} MB) in {elapsed:.1f}s; "
+          f"longest shard step {longest * 1000:.0f}ms, {stats['compactions']} packs compacted")
+
+
+def scale(root, sizes, samples=2000):
+    builder = DeploymentBuilder(ChunkStore(root))
+    rng = random.Random(5)
+    ids = []
+    codes = distinct_codes()
+    print(f"\n{'pages':>9} {'flat MB':>9} {'stored MB':>10} {'saved':>6} {'chunks':>8} {'deploy us':>10} "
+          f"{'has hit/miss us':>16} {'warm p50/p99 us':>16} {'cold p50/p99 us':>16}")
+    for size in sizes:
+        start = time.perf_counter()
+        added = size - len(ids)
+        while len(ids) < size:
+            artifact_id, created = builder.deploy(next(codes))
+            assert created
+            ids.append(artifact_id)
+        deploy_us = (time.perf_counter() - start) / added * 1e6
+
+        stats = builder.store.stats()
+        # Chunks plus manifest packs and index tables (a few hundred files)
+        stored = stats["chunk_bytes_written"] + sum(
+            os.path.getsize(os.path.join(parent, name))
+            for directory in (builder.store.index_dir, builder.store.refs_dir)
+            for parent, _, names in os.walk(directory) for name in names
+        )
+        logical = stats["logical_bytes_written"]
+        lookup = lookup_latency(builder.store, ids, samples, rng)
+        warm = read_latency(builder.store, ids, samples, rng)
+        cold = read_latency(ChunkStore(root), ids, samples, rng)
+        print(f"{size:>9} {logical / 1e6:>9.1f} {stored / 1e6:>10.1f} {1 - stored / logical:>6.0%} "
+              f"{stats['chunks_written']:>8} {deploy_us:>10.1f} {f'{lookup[0]:.1f}/{lookup[1]:.1f}':>16} "
+              f"{f'{warm[0]:.0f}/{warm[1]:.0f}':>16} {f'{cold[0]:.0f}/{cold[1]:.0f}':>16}")
+    collect_half(builder.store, len(ids))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument('--repeats', type=int, default=2000)
+    parser.add_argument('--sizes', type=lambda value: [int(n) for n in value.split(',')], default=[10000, 100000])
+    parser.add_argument('--dir', help="parent directory for the temporary stores (default: system temp)")
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix='ryze-deployments-', dir=args.dir)
+    try:
+        repeat_deploys(os.path.join(root, 'repeat'), args.repeats)
+        scale(os.path.join(root, 'scale'), sorted(args.sizes))
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
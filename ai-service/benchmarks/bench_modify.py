@@ -0,0 +1,263 @@
+"""
+Benchmark: legacy modify_ui rewrite chain vs. the single-pass rewrite engine.
+
+Runs every heuristic against generated code grown to ~10 KB, 100 KB and
+1 MB and reports per-call latency, plus the cost of building the JSX index
+and of a call that reuses a prebuilt one. Color-only edits must match the
+legacy output exactly; structural insertions intentionally differ (they are
+anchored on element boundaries instead of the first matching substring).
+
+Usage (from ai-service/):
+    python benchmarks/bench_modify.py [iterations]
+"""
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.jsx_index import JSXIndex
+from logic.rewrite_engine import apply_modifications
+from logic.templates import PRICING_SECTION_SNIPPET
+from logic.template_engine import template_engine
+
+PROMPTS = [
+    "make it green",
+    "make it red called Acme and add a navbar, hero and features",
+    "add a footer with testimonials and a chart",
+    "add a sidebar and a pricing section",
+    "turn this into a full app landing page with a footer",
+]
+
+
+def legacy_modify(current_code, prompt, new_color, new_brand):
+    """The original modify_ui body: ~10 sequential full-string rewrites."""
+    
+    # Replace simple color names in text/bg classes
+    # Expanded palette to catch all Tailwind colors
+    known_colors = [
+        'slate', 'gray', 'zinc', 'neutral', 'stone',
+        'red', 'orange', 'amber', 'yellow', 'lime', 'green', 'emerald', 'teal', 
+        'cyan', 'sky', 'blue', 'indigo', 'violet', 'purple', 'fuchsia', 'pink', 'rose'
+    ]
+    
+    # Regex to find existing color classes (e.g. bg-blue-500, from-indigo-600)
+    pattern = r'\b(bg|text|border|ring|from|to|via|shadow|decoration)-(' + '|'.join(known_colors) + r')-(\d+)\b'
+    
+    def replacer(match):
+        prefix = match.group(1)
+        shade = match.group(3)
+        # Construct new class with the requested color
+        return f"{prefix}-{new_color}-{shade}"
+
+    modified_code = re.sub(pattern, replacer, current_code)
+    
+    explanation_steps = [
+        f"- Updated theme color tokens across the component tree to '{new_color}'.",
+    ]
+    
+    # 2b. Content Updates (Brand Name / Title)
+    if new_brand and new_brand != "Ryze App": # If a specific brand was detected
+         # Heuristic: Replace content inside <h1> tags or specific brand placeholders
+         # We try to find the old brand name if possible, or just look for typical header patterns.
+         # For simplicity in this deterministic assignment, we'll replace the text in the Navbar brand prop if it exists.
+         if 'brand="' in modified_code:
+             modified_code = re.sub(r'brand="[^"]+"', f'brand="{new_brand}"', modified_code)
+             explanation_steps.append(f"- Renamed application brand to '{new_brand}'.")
+         
+         # Also try to replace <h1> content if it looks like a title
+         # exact logic is tricky without DOM parsing, but we can try a targeted sub for common patterns
+         # or just rely on the user asking precisely. 
+         pass
+
+    high_level_plan = [
+        f"1. Detected iterative style change request in: '{prompt}'.",
+        f"2. Swapped Tailwind color tokens to '{new_color}' while preserving layout and component structure.",
+    ]
+
+    lower_prompt = prompt.lower()
+    
+    # --- Advanced Heuristics (Simulated AI Agent) ---
+
+    # 3. Add Navbar
+    if ("navbar" in lower_prompt or "navigation" in lower_prompt) and "<Navbar" not in modified_code:
+        nav_snippet = '<Navbar brand="Ryze App" links={[{label:"Home", href:"#"}, {label:"Features", href:"#"}, {label:"Pricing", href:"#"}]} user={{name:"User", avatar:"https://github.com/shadcn.png"}} className="mb-8" />\n'
+        # Insert after opening div if possible
+        if "return (" in modified_code:
+            # Try to insert after the first div opening
+            pass # Complex to parse, let's prepend to the first <div> inside return
+            modified_code = modified_code.replace("return (", "return (\n<div className=\"min-h-screen bg-gray-50 dark:bg-black\">\n" + nav_snippet, 1)
+            modified_code = modified_code.replace(");", "</div>\n);", 1) # Close the wrapper
+        else:
+             # Fallback
+             pass
+        high_level_plan.append("3. Injected Navigation Bar component with responsive layout.")
+        explanation_steps.append("- Added <Navbar> component to the top of the view hierarchy.")
+
+    # --- BONUS INTELLIGENCE PACK (Global Launch Ready) ---
+
+    # 3b. Add Hero Section
+    if ("hero" in lower_prompt or "banner" in lower_prompt) and "<h1>" not in modified_code and "Welcome" not in modified_code:
+        hero_snippet = '<div className="py-20 text-center bg-gradient-to-b from-blue-50 to-white dark:from-gray-900 dark:to-black"><h1 className="text-5xl font-bold mb-6 bg-clip-text text-transparent bg-gradient-to-r from-blue-600 to-purple-600">Build Faster with AI</h1><p className="text-xl text-gray-600 dark:text-gray-300 mb-8 max-w-2xl mx-auto">The most advanced platform for deploying web applications instantly.</p><div className="flex justify-center gap-4"><Button className="rounded-full px-8 py-6 text-lg">Get Started</Button><Button className="rounded-full px-8 py-6 text-lg bg-white text-gray-900 border hover:bg-gray-50">Learn More</Button></div></div>'
+        # Intelligent Insertion: After Navbar if present, else top
+        if "<Navbar" in modified_code:
+             modified_code = modified_code.replace("/>", "/>\n" + hero_snippet, 1)
+        elif "return (" in modified_code:
+             # Insert inside the wrapper div we might have created for Navbar, or just after open div
+             modified_code = modified_code.replace("className=\"min-h-screen bg-gray-50 dark:bg-black\">\n", "className=\"min-h-screen bg-gray-50 dark:bg-black\">\n" + hero_snippet + "\n", 1)
+        high_level_plan.append("3. Generated conversion-optimized Hero Section.")
+        explanation_steps.append("- Added gradient Hero section with CTAs.")
+
+    # 3c. Add Features Section
+    if ("features" in lower_prompt or "benefits" in lower_prompt) and "Feature 1" not in modified_code:
+        feat_snippet = '<div className="py-16 px-6"><h2 className="text-3xl font-bold text-center mb-12">Why Choose Us</h2><div className="grid grid-cols-1 md:grid-cols-3 gap-8 max-w-6xl mx-auto"><Card className="p-8 hover:shadow-lg transition-all"><window.Lucide.Zap className="w-10 h-10 text-yellow-500 mb-4" /><h3 className="text-xl font-bold mb-2">Lightning Fast</h3><p className="text-gray-500">Deploy in seconds, not minutes.</p></Card><Card className="p-8 hover:shadow-lg transition-all"><window.Lucide.Shield className="w-10 h-10 text-green-500 mb-4" /><h3 className="text-xl font-bold mb-2">Secure by Default</h3><p className="text-gray-500">Enterprise-grade security built-in.</p></Card><Card className="p-8 hover:shadow-lg transition-all"><window.Lucide.Globe className="w-10 h-10 text-blue-500 mb-4" /><h3 className="text-xl font-bold mb-2">Global Scale</h3><p className="text-gray-500">Run your app on the edge.</p></Card></div></div>'
+        # Insert after Hero if present, else generic
+        if "Build Faster with AI" in modified_code:
+             modified_code = modified_code.replace("</div></div>", "</div></div>\n" + feat_snippet, 1)
+        elif "<Navbar" in modified_code:
+             modified_code = modified_code.replace("/>", "/>\n" + feat_snippet, 1)
+        else:
+             # Fallback: append
+             if "</main>" in modified_code:
+                 modified_code = modified_code.replace("</main>", feat_snippet + "\n</main>", 1)
+        high_level_plan.append("3. Added Features Grid with hover effects.")
+        explanation_steps.append("- Created 3-column Features section using Card components.")
+
+    # 3d. Add Footer
+    if ("footer" in lower_prompt) and "<footer" not in modified_code:
+        footer_snippet = '<footer className="py-8 text-center text-gray-500 border-t dark:border-gray-800 mt-12"><p>© 2024 Ryze AI. All rights reserved.</p><div className="flex justify-center gap-4 mt-4 text-sm"><a href="#">Privacy</a><a href="#">Terms</a><a href="#">Twitter</a></div></footer>'
+        if "</main>" in modified_code:
+             modified_code = modified_code.replace("</main>", footer_snippet + "\n</main>", 1)
+        elif "</div>\n);" in modified_code:
+             modified_code = modified_code.replace("</div>\n);", footer_snippet + "\n</div>\n);", 1)
+        high_level_plan.append("3. Appended professional Footer.")
+        explanation_steps.append("- Added clean Footer with copyright and links.")
+
+
+    # 3e. Add Testimonials (Social Proof)
+    if ("testimonials" in lower_prompt or "reviews" in lower_prompt) and "user says" not in modified_code:
+        testi_snippet = '<div className="py-20 bg-gray-50 dark:bg-gray-900/50"><h2 className="text-3xl font-bold text-center mb-12">Trusted by Developers</h2><div className="grid grid-cols-1 md:grid-cols-2 gap-8 max-w-4xl mx-auto px-6"><Card className="p-6"><p className="italic text-gray-600 mb-4">"Ryze AI changed how we ship software. Absolutely incredible."</p><div className="flex items-center gap-3"><div className="w-10 h-10 rounded-full bg-blue-100 flex items-center justify-center font-bold text-blue-600">JD</div><div><div className="font-bold">John Doe</div><div className="text-sm text-gray-500">CTO, TechCorp</div></div></div></Card><Card className="p-6"><p className="italic text-gray-600 mb-4">"The best AI coding assistant I have ever used. Highly recommended."</p><div className="flex items-center gap-3"><div className="w-10 h-10 rounded-full bg-purple-100 flex items-center justify-center font-bold text-purple-600">AS</div><div><div className="font-bold">Alice Smith</div><div className="text-sm text-gray-500">Lead Dev, StartupInc</div></div></div></Card></div></div>'
+        # Insert before footer if present
+        if "<footer" in modified_code:
+             modified_code = modified_code.replace("<footer", testi_snippet + "\n<footer", 1)
+        elif "</main>" in modified_code:
+             modified_code = modified_code.replace("</main>", testi_snippet + "\n</main>", 1)
+        high_level_plan.append("3. Added Social Proof section with user testimonials.")
+        explanation_steps.append("- Created trusted Testimonials grid.")
+
+    # --- ULTRA-ADVANCED: Full App Orchestrator ---
+    if ("full app" in lower_prompt or "complete website" in lower_prompt or "landing page" in lower_prompt) and "<Navbar" not in modified_code:
+         # Trigger all sections if not present
+         # This effectively chains the logic by appending keywords to the prompt internally? 
+         # No, prompt is fixed. We must force inject.
+         
+         # Force Inject Navbar (if not present)
+         if "<Navbar" not in modified_code:
+             # Logic same as above
+             nav_snippet = '<Navbar brand="Ryze Enterprise" links={[{label:"Platform", href:"#"}, {label:"Solutions", href:"#"}, {label:"Pricing", href:"#"}]} user={{name:"Admin", avatar:"https://github.com/shadcn.png"}} className="sticky top-0 z-50" />\n'
+             if "return (" in modified_code:
+                 modified_code = modified_code.replace("return (", "return (\n<div className=\"min-h-screen bg-gray-50 dark:bg-black font-sans text-gray-900 dark:text-gray-100\">\n" + nav_snippet, 1)
+                 # Only close if we haven't already unwrapped?
+                 # Assume standard template structure.
+                 if "</div>\n);" not in modified_code: modified_code = modified_code.replace(");", "</div>\n);", 1)
+
+         # Force Inject Hero
+         if "Welcome" not in modified_code:
+             hero_snippet = '<div className="py-24 text-center"><h1 className="text-6xl font-extrabold mb-6 tracking-tight">Ship Your Idea <span className="text-blue-600">Today</span></h1><p className="text-2xl text-gray-500 mb-10 max-w-3xl mx-auto">Ryze AI generates production-ready full-stack applications in seconds.</p><button className="px-8 py-4 bg-black dark:bg-white text-white dark:text-black rounded-full text-lg font-bold hover:opacity-80 transition-opacity">Start Building Free</button></div>'
+             modified_code = modified_code.replace("/>\n", "/>\n" + hero_snippet + "\n", 1) # Append after Navbar
+         
+         # Force Inject Features
+         if "Feature 1" not in modified_code:
+              feat_snippet = '<div className="py-20 bg-white dark:bg-gray-900"><div className="max-w-6xl mx-auto px-6 grid grid-cols-1 md:grid-cols-3 gap-12 text-center"><div><div className="w-16 h-16 bg-blue-100 rounded-2xl flex items-center justify-center mx-auto mb-6"><window.Lucide.Cpu className="w-8 h-8 text-blue-600" /></div><h3 className="text-xl font-bold mb-2">AI Powered</h3><p className="text-gray-500">Built on next-gen LLMs.</p></div><div><div className="w-16 h-16 bg-purple-100 rounded-2xl flex items-center justify-center mx-auto mb-6"><window.Lucide.Zap className="w-8 h-8 text-purple-600" /></div><h3 className="text-xl font-bold mb-2">Instant Deploy</h3><p className="text-gray-500">From prompt to production.</p></div><div><div className="w-16 h-16 bg-green-100 rounded-2xl flex items-center justify-center mx-auto mb-6"><window.Lucide.Layers className="w-8 h-8 text-green-600" /></div><h3 className="text-xl font-bold mb-2">Full Stack</h3><p className="text-gray-500">React, Node, Python included.</p></div></div></div>'
+              modified_code = modified_code.replace("</button></div>", "</button></div>\n" + feat_snippet, 1) # Append after Hero
+
+         # Force Inject Footer
+         if "<footer" not in modified_code:
+             footer_snippet = '<footer className="py-12 border-t dark:border-gray-800 text-center text-gray-500"><p>&copy; 2026 Ryze AI Inc.</p></footer>'
+             if "</main>" in modified_code: modified_code = modified_code.replace("</main>", footer_snippet + "\n</main>", 1)
+             elif "</div>\n);" in modified_code: modified_code = modified_code.replace("</div>\n);", footer_snippet + "\n</div>\n);", 1)
+         
+         high_level_plan.append("3. ORCHESTRATOR: Assembled complete SaaS Landing Page architecture.")
+         explanation_steps.append("- Generated Full-Stack Landing Page structure.")
+
+    # 4. Add Sidebar (Existing)
+    if ("sidebar" in lower_prompt or "drawer" in lower_prompt) and "<Sidebar" not in modified_code:
+        # We need a layout wrapper
+        sidebar_snippet = '<Sidebar items={[{label:"Dashboard", icon:"LayoutDashboard"}, {label:"Settings", icon:"Settings"}, {label:"Pro", icon:"Zap"}]} activeItem="Dashboard" className="h-screen hidden md:block" />'
+        
+        # Checking for main content wrapper
+        if "className=\"min-h-screen" in modified_code:
+             modified_code = modified_code.replace("className=\"min-h-screen", "className=\"min-h-screen flex", 1)
+             modified_code = modified_code.replace("return (\n<div", "return (\n<div", 1) # Logic is tricky
+             # Simplified: Just prepend sidebar to the first internal div
+             # Let's assume standard structure: return ( <div ...> ... </div> )
+             # We inject sidebar as first child of that div
+             modified_code = re.sub(r'(<div[^>]*>)', r'\1\n' + sidebar_snippet, modified_code, count=1)
+             high_level_plan.append("3. Integrated Sidebar navigation panel.")
+             explanation_steps.append("- Added <Sidebar> component and updated layout to Flexbox 'row'.")
+
+    # 5. Add Chart
+    if ("chart" in lower_prompt or "graph" in lower_prompt) and "<Chart" not in modified_code:
+         chart_snippet = '<div className="grid grid-cols-1 md:grid-cols-2 gap-4 my-8"><Chart type="bar" color="' + new_color + '" /><Chart type="line" color="' + new_color + '" /></div>'
+         # Insert before footer or end
+         if "</main>" in modified_code:
+             modified_code = modified_code.replace("</main>", chart_snippet + "\n</main>", 1)
+         elif "</div>" in modified_code:
+             # Insert before last div
+             modified_code = modified_code[:modified_code.rfind("</div>")] + chart_snippet + "\n</div>"
+         high_level_plan.append("3. Visualized data with interactive Charts.")
+         explanation_steps.append("- Added Bar and Line <Chart> components.")
+
+    # 6. Pricing Section (Existing Logic Refined)
+    if "pricing" in lower_prompt and "section" in lower_prompt:
+        if "RYZE_PRICING_SECTION" not in modified_code and "id=\"pricing\"" not in modified_code:
+            insertion_target = "</main>"
+            if insertion_target in modified_code:
+                modified_code = modified_code.replace(insertion_target, PRICING_SECTION_SNIPPET + "\n" + insertion_target, 1)
+            else:
+                modified_code = modified_code.rstrip() + PRICING_SECTION_SNIPPET + "\n"
+            high_level_plan.append("3. Inserted a deterministic Pricing section snippet before the main footer.")
+            explanation_steps.append("- Added a structured pricing section using the shared component library.")
+
+    return modified_code, high_level_plan, explanation_steps
+
+
+def build_code(size):
+    # Concatenate rendered templates until the code reaches the requested size
+    base = "\n".join(template_engine.render(name, PRIMARY_COLOR="blue", BRAND_NAME="Acme")
+                     for name in template_engine.names())
+    return (base * (size // len(base) + 1))[:size]
+
+
+def per_call_ms(fn, code, iterations, **kwargs):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for prompt in PROMPTS:
+            fn(code, prompt, "green", "Acme", **kwargs)
+    return (time.perf_counter() - start) / (iterations * len(PROMPTS)) * 1000
+
+
+def index_ms(code, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        JSXIndex(code)
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print(f"{'size':>8} {'legacy ms':>10} {'engine ms':>10} {'index ms':>9} {'reuse ms':>9}")
+    for size in (10_000, 100_000, 1_000_000):
+        code = build_code(size)
+        assert legacy_modify(code, PROMPTS[0], "green", "Acme") == apply_modifications(code, PROMPTS[0], "green", "Acme")
+        jsx = JSXIndex(code)
+        legacy = per_call_ms(legacy_modify, code, iterations)
+        engine = per_call_ms(apply_modifications, code, iterations)
+        reuse = per_call_ms(apply_modifications, code, iterations, jsx=jsx)
+        print(f"{size:>8} {legacy:>10.2f} {engine:>10.2f} {index_ms(code, iterations):>9.2f} {reuse:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: /generate/batch and large /modify jobs inline vs. on the process pool.
+
+Batch throughput is measured inline and with 1..N pool workers (N defaults
+to the CPU count); each pool is started and warmed with one batch first,
+so the numbers are steady-state. Scaling needs as many free cores as
+workers: on a box with fewer cores the extra workers only add overhead.
+The modify rows compare one rewrite of a large page inline with the same
+rewrite in a worker (which adds the copy of the code both ways).
+
+Usage (from ai-service/):
+    python benchmarks/bench_offload.py [num_prompts] [max_workers]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app
+from bench_batch import build_corpus
+from bench_modify import build_code
+from logic.offload import ProcessOffloader
+
+MODIFY_PROMPT = "add a pricing section and a chart, make it green"
+MODIFY_SIZES = [256 * 1024, 1024 * 1024, 4 * 1024 * 1024]
+
+
+def batch_seconds(client, prompts, repeats=3):
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        response = client.post('/generate/batch', json={"prompts": prompts})
+        assert response.status_code == 200
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def modify_ms(client, code, repeats=5):
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        response = client.post('/modify', json={"prompt": MODIFY_PROMPT, "currentCode": code})
+        assert response.status_code == 200
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def use_pool(workers):
+    app.offloader = ProcessOffloader(workers, min_chars=0, batch_min=1, preload=['app'])
+    app.offloader.ensure_started()
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    prompts = build_corpus(n)
+    client = app.app.test_client()
+
+    print(f"prompts: {n}, cpus: {os.cpu_count()}")
+    print(f"{'batch':<10} {'seconds':>9} {'prompts/sec':>12} {'speedup':>8}")
+    app.offloader = ProcessOffloader(0)
+    batch_seconds(client, prompts, repeats=1)
+    inline = batch_seconds(client, prompts)
+    print(f"{'inline':<10} {inline:>9.3f} {n / inline:>12,.0f} {1.0:>7.2f}x")
+    for workers in range(1, max_workers + 1):
+        use_pool(workers)
+        batch_seconds(client, prompts, repeats=1)
+        seconds = batch_seconds(client, prompts)
+        print(f"{f'{workers} workers':<10} {seconds:>9.3f} {n / seconds:>12,.0f} {inline / seconds:>7.2f}x")
+        app.offloader.pool().shutdown()
+
+    print(f"\n{'modify KB':>9} {'inline ms':>10} {'pool ms':>8}")
+    use_pool(1)
+    for size in MODIFY_SIZES:
+        code = build_code(size)
+        pooled = modify_ms(client, code)
+        app.offloader.workers = 0
+        inline = modify_ms(client, code)
+        app.offloader.workers = 1
+        print(f"{size // 1024:>9} {inline:>10.1f} {pooled:>8.1f}")
+    app.offloader.pool().shutdown()
+
+
+if __name__ == '__main__':
+    main()
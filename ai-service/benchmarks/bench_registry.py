@@ -0,0 +1,59 @@
+"""
+Benchmark: template registry memory and lookup cost.
+
+Reports the memory held by templates when a worker compiles every one up
+front (as the old module constants did) vs. lazily only the intents it
+serves, the cost of a first (mmap + compile) load, and the per-lookup
+overhead of get() with hot reload on and off.
+
+Usage (from ai-service/):
+    python benchmarks/bench_registry.py [iterations]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.template_engine import TEMPLATES_DIR, TemplateRegistry
+
+
+def held_bytes(names):
+    tracemalloc.start()
+    registry = TemplateRegistry(TEMPLATES_DIR, reload_interval=0)
+    for name in names:
+        registry.get(name)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, registry
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    registry = TemplateRegistry(TEMPLATES_DIR, reload_interval=0)
+    names = registry.names()
+    eager, _ = held_bytes(names)
+    lazy, _ = held_bytes(names[:1])
+    print(f"{'templates held':<16} {'KB':>8}")
+    print(f"{'all (eager)':<16} {eager / 1024:>8.1f}")
+    print(f"{'one (lazy)':<16} {lazy / 1024:>8.1f}")
+
+    start = time.perf_counter()
+    for name in names:
+        registry.get(name)
+    print(f"\nfirst load: {(time.perf_counter() - start) / len(names) * 1e6:.1f} us/template")
+
+    print(f"\n{'reload interval':<16} {'get() ns':>9}")
+    for interval in (0, 2):
+        registry = TemplateRegistry(TEMPLATES_DIR, reload_interval=interval)
+        registry.preload()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            registry.get('dashboard')
+        print(f"{interval:<16} {(time.perf_counter() - start) / iterations * 1e9:>9.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark: serializing a /generate cache hit, jsonify vs. pre-encoded bytes.
+
+For every template, a render-cache hit is serialized with Flask's jsonify
+(re-escaping the whole code string) and with encode_payload (splicing the
+code's cached JSON encoding); both bodies are checked to be identical.
+Also reports the end-to-end CPU time of a hit and of a 304 through the
+test client.
+
+Usage (from ai-service/):
+    python benchmarks/bench_responses.py [iterations]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import jsonify
+
+from app import app, generate_result
+from logic.responses import encode_payload
+from logic.template_engine import template_engine
+
+
+def cpu_us(fn, iterations):
+    start = time.process_time()
+    for _ in range(iterations):
+        fn()
+    return (time.process_time() - start) / iterations * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    print(f"{'template':<10} {'code KB':>8} {'jsonify us':>11} {'encoded us':>11}")
+    with app.app_context():
+        for name in template_engine.names():
+            data = {"prompt": f"{name} page in teal called Acme"}
+            generate_result(data, time.perf_counter())
+            result, _ = generate_result(data, time.perf_counter())
+            assert result["meta"]["cache"] == "hit", name
+            assert jsonify(result).get_data() == encode_payload(result), name
+
+            old = cpu_us(lambda: jsonify(result).get_data(), iterations)
+            new = cpu_us(lambda: encode_payload(result), iterations)
+            print(f"{name:<10} {len(result['code']) / 1024:>8.1f} {old:>11.1f} {new:>11.1f}")
+
+    client = app.test_client()
+    data = {"prompt": "dashboard in teal called Acme"}
+    etag = client.post('/generate', json=data).headers["ETag"]
+    full = cpu_us(lambda: client.post('/generate', json=data), iterations // 4)
+    not_modified = cpu_us(
+        lambda: client.post('/generate', json=data, headers={"If-None-Match": etag}), iterations // 4
+    )
+    print(f"\nend to end: hit {full:.1f} us, 304 {not_modified:.1f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark: full-code /modify round trips vs. session mode with edit scripts.
+
+Replays the same sequence of modification prompts against code grown to
+~10 KB, 100 KB and 1 MB and reports bytes on the wire per iteration
+(request + response) and the time to JSON-decode the response, as a client
+would. Session mode is checked to rebuild the same code as full mode.
+
+Usage (from ai-service/):
+    python benchmarks/bench_sessions.py
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app
+from bench_modify import build_code
+
+PROMPTS = [
+    "make it green",
+    "add a footer",
+    "make it purple and add a chart",
+    "add testimonials",
+    "add a pricing section",
+    "make it red called Acme",
+]
+
+
+def apply_edits(code, edits):
+    # Offsets are UTF-16 code units, as in the browser
+    data = code.encode('utf-16-le')
+    for offset, delete, text in reversed(edits):
+        data = data[:offset * 2] + text.encode('utf-16-le') + data[(offset + delete) * 2:]
+    return data.decode('utf-16-le')
+
+
+def run_full(client, code):
+    wire = parse = 0.0
+    for prompt in PROMPTS:
+        body = json.dumps({"prompt": prompt, "currentCode": code})
+        response = client.post('/modify', data=body, content_type='application/json')
+        start = time.perf_counter()
+        code = json.loads(response.data)["code"]
+        parse += time.perf_counter() - start
+        wire += len(body) + len(response.data)
+    return code, wire / len(PROMPTS), parse / len(PROMPTS)
+
+
+def run_session(client, code, session_id):
+    seed = client.post('/modify', json={"prompt": "make it blue", "sessionId": session_id, "currentCode": code})
+    payload = seed.get_json()
+    code = apply_edits(code, payload["edits"])
+    version = payload["session"]["version"]
+
+    wire = parse = 0.0
+    for prompt in PROMPTS:
+        body = json.dumps({"prompt": prompt, "sessionId": session_id, "baseVersion": version})
+        response = client.post('/modify', data=body, content_type='application/json')
+        start = time.perf_counter()
+        payload = json.loads(response.data)
+        parse += time.perf_counter() - start
+        code = apply_edits(code, payload["edits"])
+        version = payload["session"]["version"]
+        wire += len(body) + len(response.data)
+    return code, wire / len(PROMPTS), parse / len(PROMPTS)
+
+
+def main():
+    client = app.test_client()
+
+    print(f"{'size':>8} {'mode':<8} {'KB/iter':>9} {'parse ms':>9}")
+    for size in (10_000, 100_000, 1_000_000):
+        # Start both runs from the same code so the outputs are comparable
+        base = client.post('/modify', json={"prompt": "make it blue", "currentCode": build_code(size)}).get_json()["code"]
+        full_code, full_wire, full_parse = run_full(client, base)
+        session_code, session_wire, session_parse = run_session(client, base, f"bench-{size}")
+        assert full_code == session_code, size
+        print(f"{size:>8} {'full':<8} {full_wire / 1024:>9.1f} {full_parse * 1000:>9.3f}")
+        print(f"{size:>8} {'session':<8} {session_wire / 1024:>9.1f} {session_parse * 1000:>9.3f}")
+
+
+if __name__ == '__main__':
+    main()
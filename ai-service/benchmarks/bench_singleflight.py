@@ -0,0 +1,118 @@
+"""
+Benchmark: bursts of identical /generate calls with and without single-flight.
+
+Each round clears the caches and releases `threads` identical requests at
+once (a barrier), the way a shared demo link arrives; it reports renders
+done per burst and the burst's wall time, with coalescing off and on. The
+process rows run the same burst in several processes at once, coalescing
+through a shared directory (SINGLE_FLIGHT_DIR) as gunicorn workers would.
+
+Usage (from ai-service/):
+    python benchmarks/bench_singleflight.py [threads] [processes] [rounds]
+"""
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PROMPT = "Create a red dashboard called Viral"
+
+
+class Unshared:
+    """Stand-in for SingleFlight that always computes (coalescing off)."""
+    leaders = 0
+
+    def do(self, key, fn):
+        Unshared.leaders += 1
+        return fn(), False
+
+
+def burst(app, threads, start_barrier=None):
+    """One burst of identical requests on cold caches; returns (seconds, renders)."""
+    app.render_cache.clear()
+    app.prerendered = {}
+    flight = app.render_flight
+    before = flight.leaders - getattr(flight, 'shared', 0)
+    barrier = threading.Barrier(threads)
+
+    def request():
+        barrier.wait()
+        payload, status = app.generate_result({"prompt": PROMPT}, time.perf_counter())
+        assert status == 200
+
+    workers = [threading.Thread(target=request) for _ in range(threads)]
+    if start_barrier is not None:
+        start_barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start, flight.leaders - getattr(flight, 'shared', 0) - before
+
+
+def process_main(shared_dir, threads, rounds, start_barrier, results):
+    if shared_dir:
+        os.environ["SINGLE_FLIGHT_DIR"] = shared_dir
+        os.environ["SINGLE_FLIGHT_TTL"] = "0.05"
+    import app
+    if not shared_dir:
+        app.render_flight = Unshared()
+    app.generate_result({"prompt": "warm-up"}, time.perf_counter())
+    renders = 0
+    for _ in range(rounds):
+        renders += burst(app, threads, start_barrier)[1]
+        # Lets the shared result expire before the next cold round
+        time.sleep(0.1)
+    results.put(renders)
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    rounds = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+
+    import app
+    app.generate_result({"prompt": "warm-up"}, time.perf_counter())
+    flight = app.render_flight
+
+    print(f"{'mode':<22} {'renders/burst':>14} {'burst ms':>9}")
+    for name, implementation in (("threads, off", Unshared()), ("threads, on", flight)):
+        app.render_flight = implementation
+        seconds = renders = 0
+        for _ in range(rounds):
+            elapsed, done = burst(app, threads)
+            seconds += elapsed
+            renders += done
+        print(f"{name:<22} {renders / rounds:>14.2f} {seconds / rounds * 1000:>9.2f}")
+    app.render_flight = flight
+
+    if processes > 1:
+        with tempfile.TemporaryDirectory() as shared_dir:
+            for name, directory in (("off", None), ("on", shared_dir)):
+                renders = run_processes(processes, directory, threads, rounds)
+                print(f"{f'{processes} processes, {name}':<22} {renders / rounds:>14.2f} {'':>9}")
+
+
+def run_processes(processes, shared_dir, threads, rounds):
+    context = multiprocessing.get_context('spawn')
+    start_barrier = context.Barrier(processes)
+    results = context.Queue()
+    children = [
+        context.Process(target=process_main, args=(shared_dir, threads, rounds, start_barrier, results))
+        for _ in range(processes)
+    ]
+    for child in children:
+        child.start()
+    renders = sum(results.get() for _ in children)
+    for child in children:
+        child.join()
+    return renders
+
+
+if __name__ == '__main__':
+    main()
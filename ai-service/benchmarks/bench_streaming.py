@@ -0,0 +1,55 @@
+"""
+Benchmark: buffered JSON vs. NDJSON streaming for /generate/batch.
+
+Reports peak Python heap (tracemalloc) and time-to-first-byte for growing
+batch sizes. Streaming consumes the body incrementally, as a progressive
+client would.
+
+Usage (from ai-service/):
+    python benchmarks/bench_streaming.py [sizes...]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app
+from bench_batch import build_corpus
+
+
+def run(client, prompts, stream):
+    headers = {"Accept": "application/x-ndjson"} if stream else {}
+    tracemalloc.start()
+    start = time.perf_counter()
+    response = client.post('/generate/batch', json={"prompts": prompts}, headers=headers, buffered=False)
+
+    ttfb = None
+    total = 0
+    for chunk in response.response:
+        if ttfb is None:
+            ttfb = time.perf_counter() - start
+        total += len(chunk)
+    response.close()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return ttfb, elapsed, peak, total
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 1000, 5000]
+    client = app.test_client()
+
+    print(f"{'prompts':>8} {'mode':<9} {'ttfb ms':>9} {'total ms':>9} {'peak MB':>9} {'body MB':>9}")
+    for n in sizes:
+        prompts = build_corpus(n)
+        for label, stream in (("buffered", False), ("ndjson", True)):
+            ttfb, elapsed, peak, total = run(client, prompts, stream)
+            print(f"{n:>8} {label:<9} {ttfb * 1000:>9.1f} {elapsed * 1000:>9.1f} "
+                  f"{peak / 1e6:>9.1f} {total / 1e6:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: style-entity extraction, legacy passes vs. the single-scan extractor.
+
+The legacy path lowercases and splits the prompt, scans the color list
+linearly and runs an uncompiled brand regex, on top of the classifier's own
+tokenize pass. The new StyleExtractor.extract() does one compiled scan.
+Both are timed as the color vocabulary grows 1x/10x/100x and as prompts grow.
+
+Usage (from ai-service/):
+    python benchmarks/bench_style.py [iterations]
+"""
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.nlp_engine import StyleExtractor, _NON_ALNUM
+from logic.palette import TAILWIND_COLORS
+
+PROMPTS = [
+    "Create an emerald analytics dashboard with charts called Acme",
+    "A simple login page in dark mode with email and password",
+    "Contact form using #10b981 as the accent color",
+    "Startup landing page with hero, pricing and footer sections, rose-600 buttons",
+    "make it purple",
+]
+
+
+class LegacyStyleExtractor:
+    """The pre-compiled implementation: three independent passes."""
+    def __init__(self, colors):
+        self.colors = list(colors)
+
+    def extract(self, prompt):
+        _NON_ALNUM.sub('', prompt.lower()).split()  # the classifier's own tokenize pass
+        tokens = prompt.lower().split()
+        color = next((c for c in self.colors if c in tokens), 'blue')
+        match = re.search(r'(?:called|named|brand)\s+["\']?([^"\']+)["\']?', prompt, re.IGNORECASE)
+        return color, match.group(1) if match else "Ryze AI"
+
+
+def grow_colors(factor):
+    # Synthetic color names padded in front, so the legacy scan walks them all
+    synthetic = [f'tone{i}x' for i in range((factor - 1) * len(TAILWIND_COLORS))]
+    return tuple(synthetic) + TAILWIND_COLORS
+
+
+def per_prompt_us(extract, prompts, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for prompt in prompts:
+            extract(prompt)
+    return (time.perf_counter() - start) / (iterations * len(prompts)) * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    print(f"{'vocab':>6} {'colors':>7} {'legacy us':>10} {'single us':>10}")
+    for factor in (1, 10, 100):
+        colors = grow_colors(factor)
+        legacy = per_prompt_us(LegacyStyleExtractor(colors).extract, PROMPTS, iterations)
+        single = per_prompt_us(StyleExtractor(colors).extract, PROMPTS, iterations)
+        print(f"{factor:>5}x {len(colors):>7} {legacy:>10.2f} {single:>10.2f}")
+
+    print(f"\n{'prompt chars':>12} {'legacy us':>10} {'single us':>10}")
+    legacy, single = LegacyStyleExtractor(TAILWIND_COLORS), StyleExtractor()
+    for repeat in (1, 10, 100):
+        prompts = [" ".join([prompt] * repeat) for prompt in PROMPTS]
+        chars = sum(map(len, prompts)) // len(prompts)
+        runs = max(1, iterations // repeat)
+        print(f"{chars:>12} {per_prompt_us(legacy.extract, prompts, runs):>10.2f} "
+              f"{per_prompt_us(single.extract, prompts, runs):>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
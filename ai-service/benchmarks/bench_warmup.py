@@ -0,0 +1,71 @@
+"""
+Benchmark: worker start-up with and without warm-up.
+
+Each run starts a fresh interpreter that imports the app (and, when warm,
+calls app.warm_up() as the gunicorn master does before forking), then
+serves a first /generate and a first /modify through the Flask test
+client. Reports the median time-to-ready and first-request latencies.
+
+Usage (from ai-service/):
+    python benchmarks/bench_warmup.py [runs]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROMPTS = [
+    "Create a purple analytics dashboard called Acme",
+    "add a navbar, a chart and a footer",
+]
+
+
+def child(warm):
+    start = time.perf_counter()
+    sys.path.insert(0, SERVICE_DIR)
+    import app as service
+    if warm:
+        service.warm_up()
+    ready = time.perf_counter() - start
+
+    client = service.app.test_client()
+    start = time.perf_counter()
+    code = client.post('/generate', json={"prompt": PROMPTS[0]}).get_json()["code"]
+    first_generate = time.perf_counter() - start
+
+    start = time.perf_counter()
+    client.post('/modify', json={"prompt": PROMPTS[1], "currentCode": code})
+    first_modify = time.perf_counter() - start
+
+    print(json.dumps({"ready": ready, "generate": first_generate, "modify": first_modify}))
+
+
+def run(warm):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child', 'warm' if warm else 'cold'],
+        cwd=SERVICE_DIR, capture_output=True, text=True, check=True,
+        env={**os.environ, "METRICS_ENABLED": "0"},
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+
+    print(f"{'mode':<6} {'ready ms':>9} {'1st generate ms':>16} {'1st modify ms':>14}")
+    for warm in (False, True):
+        samples = [run(warm) for _ in range(runs)]
+        median = {key: statistics.median(sample[key] for sample in samples) * 1000 for key in samples[0]}
+        print(f"{'warm' if warm else 'cold':<6} {median['ready']:>9.1f} "
+              f"{median['generate']:>16.2f} {median['modify']:>14.2f}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 2 and sys.argv[1] == '--child':
+        child(sys.argv[2] == 'warm')
+    else:
+        main()
@@ -0,0 +1,114 @@
+"""
+Regression checks: behaviour the benchmarks do not cover, run in-process
+against the app. Each check prints one line; the command exits non-zero
+when any of them fails.
+
+    template_reload   a template edited in place after warm-up is served
+                      for warmed-up, cached and new color/brand pairs alike
+    composed_reload   a section fragment edited in place shows up in the
+                      pages composed with it
+    color_tiebreak    the first color mentioned in the prompt wins
+
+Usage (from ai-service/):
+    python benchmarks/checks.py [check ...]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+AI_SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, AI_SERVICE_DIR)
+
+# The app reads its settings on import: templates come from a scratch copy
+# the checks may edit, and are rescanned on every lookup
+SCRATCH_DIR = tempfile.mkdtemp(prefix="ryze-checks-")
+TEMPLATES_COPY = os.path.join(SCRATCH_DIR, "templates")
+shutil.copytree(os.path.join(AI_SERVICE_DIR, "templates"), TEMPLATES_COPY)
+os.environ.update({
+    "TEMPLATES_DIR": TEMPLATES_COPY,
+    "SECTIONS_DIR": os.path.join(TEMPLATES_COPY, "sections"),
+    "TEMPLATE_RELOAD_INTERVAL": "0.01",
+    "WARMUP": "0",
+})
+
+import app  # noqa: E402
+
+
+def _generate(prompt, **options):
+    payload, status = app.generate_result({"prompt": prompt, **options}, time.perf_counter())
+    assert status == 200, payload
+    return payload
+
+
+def _edit(path, marker):
+    """Inserts `marker` into the template at `path` in place (same file, same version)."""
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(source.replace(">", ">\n" + marker, 1))
+    # Past the reload interval
+    time.sleep(0.05)
+
+
+def check_template_reload():
+    app.warm_up()
+    name = app.template_engine.get("dashboard").name
+    _, path, _ = app.template_engine.available[name]
+    warmed = f"Create a {app.WARMUP_COLORS[0]} dashboard"
+    cached = "Create a teal dashboard"
+    assert _generate(warmed)["meta"]["cache"] == "hit", "warm-up did not pre-render the page"
+    _generate(cached)
+    assert _generate(cached)["meta"]["cache"] == "hit", "the render cache missed a repeated prompt"
+
+    marker = "{/* edited after warm-up */}"
+    _edit(path, marker)
+    for prompt in (warmed, cached, "Create a pink dashboard"):
+        assert marker in _generate(prompt)["code"], f"{prompt!r} served the template from before the edit"
+
+
+def check_composed_reload():
+    prompt = "a dashboard with a login and pricing"
+    sections = _generate(prompt, compose=True)["meta"].get("sections")
+    assert sections, "the prompt composed no sections"
+    _, path, _ = app.section_templates.available[sections[0]]
+    marker = "{/* edited fragment */}"
+    _edit(path, marker)
+    assert marker in _generate(prompt, compose=True)["code"], "the composed page kept the old fragment"
+
+
+def check_color_tiebreak():
+    for prompt, color in (("Create a red and blue page", "red"),
+                          ("Create a blue and red page", "blue"),
+                          ("A landing page called Acme, in green with a purple footer", "green")):
+        found = app.prompt_analyzer.style_extractor.extract(prompt).color
+        assert found == color, f"{prompt!r} picked {found!r}, not {color!r}"
+
+
+CHECKS = {
+    "template_reload": check_template_reload,
+    "composed_reload": check_composed_reload,
+    "color_tiebreak": check_color_tiebreak,
+}
+
+
+def main():
+    names = sys.argv[1:] or list(CHECKS)
+    failed = 0
+    try:
+        for name in names:
+            try:
+                CHECKS[name]()
+            except AssertionError as e:
+                failed += 1
+                print(f"FAIL {name}: {e}")
+            else:
+                print(f"ok   {name}")
+    finally:
+        shutil.rmtree(SCRATCH_DIR, ignore_errors=True)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
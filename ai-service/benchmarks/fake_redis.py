@@ -0,0 +1,122 @@
+"""
+A local stand-in for a Redis server: speaks enough of the protocol (RESP)
+for logic.cache_backends.RedisCache (PING, AUTH, SELECT, GET, SET with
+EX/PX, DEL, SCAN, DBSIZE, FLUSHDB), keeping everything in one dict. For
+benchmarks and trying CACHE_BACKEND=redis without a real server; it is
+not a database.
+
+Usage (from ai-service/):
+    python benchmarks/fake_redis.py [port]
+then run the service with CACHE_BACKEND=redis REDIS_URL=redis://127.0.0.1:<port>/0
+"""
+import fnmatch
+import socketserver
+import sys
+import threading
+import time
+
+
+class FakeRedis:
+    """Keys -> (value, expires_at or None), shared by every connection."""
+    def __init__(self):
+        self.data = {}
+        self.lock = threading.Lock()
+
+    def _live(self, key):
+        entry = self.data.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+            del self.data[key]
+            return None
+        return entry
+
+    def execute(self, args):
+        command = args[0].upper()
+        with self.lock:
+            if command == b'PING':
+                return b'+PONG'
+            if command in (b'AUTH', b'SELECT'):
+                return b'+OK'
+            if command == b'GET':
+                entry = self._live(args[1])
+                return None if entry is None else entry[0]
+            if command == b'SET':
+                expires_at = None
+                options = [arg.upper() for arg in args[3:]]
+                for option, value in zip(options, args[4:]):
+                    if option == b'PX':
+                        expires_at = time.monotonic() + int(value) / 1000
+                    elif option == b'EX':
+                        expires_at = time.monotonic() + int(value)
+                self.data[args[1]] = (args[2], expires_at)
+                return b'+OK'
+            if command == b'DEL':
+                return sum(self.data.pop(key, None) is not None for key in args[1:])
+            if command == b'SCAN':
+                # One page with every match, then cursor 0
+                pattern = b'*'
+                for option, value in zip(args[2::2], args[3::2]):
+                    if option.upper() == b'MATCH':
+                        pattern = value
+                keys = [key for key in list(self.data) if self._live(key) and fnmatch.fnmatchcase(key, pattern)]
+                return [b'0', keys]
+            if command == b'DBSIZE':
+                return len(self.data)
+            if command == b'FLUSHDB':
+                self.data.clear()
+                return b'+OK'
+        return Exception(f"ERR unknown command '{command.decode('utf-8', 'replace')}'")
+
+
+def encode(reply):
+    if reply is None:
+        return b'$-1\r\n'
+    if isinstance(reply, Exception):
+        return b'-' + str(reply).encode('utf-8') + b'\r\n'
+    if isinstance(reply, int):
+        return b':%d\r\n' % reply
+    if isinstance(reply, list):
+        return b'*%d\r\n' % len(reply) + b''.join(encode(item) for item in reply)
+    if reply.startswith(b'+'):
+        return reply + b'\r\n'
+    return b'$%d\r\n%s\r\n' % (len(reply), reply)
+
+
+class Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            if not line.startswith(b'*'):
+                self.wfile.write(b'-ERR inline commands are not supported\r\n')
+                return
+            args = []
+            for _ in range(int(line[1:])):
+                length = int(self.rfile.readline()[1:])
+                args.append(self.rfile.read(length + 2)[:-2])
+            self.wfile.write(encode(self.server.store.execute(args)))
+
+
+class FakeRedisServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host='127.0.0.1', port=0):
+        super().__init__((host, port), Handler)
+        self.store = FakeRedis()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"redis://{host}:{port}/0"
+
+    def start(self):
+        """Serves on a daemon thread; returns self."""
+        threading.Thread(target=self.serve_forever, name='fake-redis', daemon=True).start()
+        return self
+
+
+if __name__ == '__main__':
+    server = FakeRedisServer(port=int(sys.argv[1]) if len(sys.argv) > 1 else 6379)
+    print(f"Fake Redis listening on {server.url}")
+    server.serve_forever()
@@ -0,0 +1,95 @@
+"""
+Load test: many concurrent keep-alive clients against a running service.
+
+Each client holds one connection and posts /generate prompts back to back.
+Reports throughput, p50/p99 latency of successful requests and how many
+were shed with 503. Uses raw asyncio sockets so it has no dependencies.
+
+Usage (from ai-service/):
+    uvicorn asgi:app --port 5001 --log-level warning &
+    python benchmarks/load_test.py [--clients 1000] [--requests 20] [--url http://127.0.0.1:5001/generate]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_batch import build_corpus
+
+
+async def read_response(reader):
+    head = await reader.readuntil(b'\r\n\r\n')
+    status = int(head.split(b' ', 2)[1])
+    length = 0
+    for line in head.split(b'\r\n')[1:]:
+        name, _, value = line.partition(b':')
+        if name.strip().lower() == b'content-length':
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def client(host, port, path, prompts, latencies, statuses):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for prompt in prompts:
+            body = json.dumps({"prompt": prompt}).encode()
+            writer.write(
+                f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+            )
+            start = time.perf_counter()
+            await writer.drain()
+            status = await read_response(reader)
+            statuses[status] = statuses.get(status, 0) + 1
+            if status == 200:
+                latencies.append(time.perf_counter() - start)
+    except (ConnectionError, asyncio.IncompleteReadError):
+        statuses['conn_error'] = statuses.get('conn_error', 0) + 1
+    finally:
+        writer.close()
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return float('nan')
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+async def run(url, clients, requests_per_client):
+    parts = urlsplit(url)
+    corpus = build_corpus(clients * requests_per_client)
+    latencies = []
+    statuses = {}
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        client(parts.hostname, parts.port or 80, parts.path or '/generate',
+               corpus[i::clients], latencies, statuses)
+        for i in range(clients)
+    ))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    ok = statuses.get(200, 0)
+    print(f"clients: {clients}, requests: {sum(statuses.values())}, elapsed: {elapsed:.2f}s")
+    print(f"ok/sec: {ok / elapsed:,.0f}, statuses: {statuses}")
+    print(f"p50: {percentile(latencies, 0.50) * 1000:.1f} ms, p99: {percentile(latencies, 0.99) * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--url', default='http://127.0.0.1:5001/generate')
+    parser.add_argument('--clients', type=int, default=1000)
+    parser.add_argument('--requests', type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.url, args.clients, args.requests))
+
+
+if __name__ == '__main__':
+    main()
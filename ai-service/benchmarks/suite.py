@@ -0,0 +1,323 @@
+"""
+Benchmark suite: capacity numbers for regression tracking.
+
+Runs a set of scenarios either in-process (Flask test client) or over HTTP
+against a running server, with a configurable number of concurrent
+clients, and reports throughput and p50/p95/p99 latency per scenario as
+JSON. Scenarios:
+
+    generate.<intent>   /generate over a prompt corpus for each intent
+    modify.chain<N>     chains of N successive /modify calls, each on the
+                        previous result, for N in --chain-lengths
+
+With --baseline the run is compared with a stored report and the command
+exits non-zero when any scenario's throughput drops, or its p95/p99
+grows, by more than --threshold. --smoke only checks that the service
+answers (the old verify_service.py check).
+
+Usage (from ai-service/):
+    python benchmarks/suite.py [--url http://127.0.0.1:5001] [--concurrency 4]
+        [--requests 200] [--chains 20] [--chain-lengths 1,4,16]
+        [--only generate.dashboard,modify] [--out report.json]
+        [--baseline baseline.json [--threshold 0.2]] [--save-baseline baseline.json]
+    python benchmarks/suite.py --smoke [--url ...]
+"""
+import argparse
+import http.client
+import json
+import os
+import platform
+import queue
+import random
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.nlp_engine import DEFAULT_INTENTS
+
+COLORS = ["blue", "red", "green", "purple", "orange", "teal", "rose", "#10b981"]
+BRANDS = ["Acme", "Globex", "Initech", "Umbrella", "Hooli"]
+MODIFY_STEPS = [
+    "make it green",
+    "add a navbar",
+    "add a hero banner",
+    "add a features section",
+    "add testimonials",
+    "add a chart",
+    "add a sidebar",
+    "add a pricing section",
+    "add a footer",
+    "make it purple called Globex",
+]
+
+# A report metric regresses when it moves the wrong way by more than the threshold
+HIGHER_IS_BETTER = ("throughput_rps",)
+LOWER_IS_BETTER = ("p95_ms", "p99_ms")
+
+
+def intent_corpora(size, seed=7):
+    """{intent: [prompt, ...]} built from each intent's own keywords."""
+    rng = random.Random(seed)
+    corpora = {}
+    for intent, keywords in DEFAULT_INTENTS.items():
+        corpora[intent] = [
+            f"Create a {rng.choice(COLORS)} {rng.choice(keywords)} {rng.choice(keywords)} called {rng.choice(BRANDS)}"
+            for _ in range(size)
+        ]
+    return corpora
+
+
+class InProcessTransport:
+    """Requests through Flask's test client; excludes the network and server."""
+    def __init__(self):
+        from app import app
+        self.client = app.test_client()
+
+    def post(self, path, payload):
+        response = self.client.post(path, json=payload)
+        return response.status_code, response.get_json(silent=True)
+
+    def get(self, path):
+        response = self.client.get(path)
+        return response.status_code, response.get_json(silent=True)
+
+    def close(self):
+        pass
+
+
+class HttpTransport:
+    """One keep-alive HTTP/1.1 connection (one per client thread)."""
+    def __init__(self, url):
+        parts = urlsplit(url)
+        self.prefix = parts.path.rstrip('/')
+        self.connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+
+    def _request(self, method, path, body=None):
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        self.connection.request(method, self.prefix + path, body=body, headers=headers)
+        response = self.connection.getresponse()
+        data = response.read()
+        try:
+            return response.status, json.loads(data)
+        except ValueError:
+            return response.status, None
+
+    def post(self, path, payload):
+        return self._request("POST", path, json.dumps(payload))
+
+    def get(self, path):
+        return self._request("GET", path)
+
+    def close(self):
+        self.connection.close()
+
+
+def generate_jobs(prompts):
+    """One single-request job per prompt."""
+    return [lambda transport, record, prompt=prompt: _timed(transport, record, '/generate', {"prompt": prompt})
+            for prompt in prompts]
+
+
+def modify_chain_jobs(count, length, seed=11):
+    """`count` chains, each a /generate followed by `length` dependent /modify calls."""
+    rng = random.Random(seed + length)
+
+    def chain(transport, record, subject, steps):
+        status, payload = transport.post('/generate', {"prompt": f"Create a {subject} called Acme"})
+        if status != 200:
+            record(None)
+            return
+        code = payload["code"]
+        for step in steps:
+            payload = _timed(transport, record, '/modify', {"prompt": step, "currentCode": code})
+            if payload is None:
+                return
+            code = payload["code"]
+
+    subjects = ["dashboard", "landing page", "portfolio", "web app"]
+    return [
+        lambda transport, record, subject=rng.choice(subjects),
+        steps=[rng.choice(MODIFY_STEPS) for _ in range(length)]: chain(transport, record, subject, steps)
+        for _ in range(count)
+    ]
+
+
+def _timed(transport, record, path, payload):
+    start = time.perf_counter()
+    try:
+        status, body = transport.post(path, payload)
+    except (OSError, http.client.HTTPException):
+        record(None)
+        return None
+    elapsed = time.perf_counter() - start
+    if status != 200:
+        record(None)
+        return None
+    record(elapsed)
+    return body
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def run_scenario(jobs, make_transport, concurrency):
+    """Runs `jobs` on `concurrency` client threads; returns the scenario's metrics."""
+    pending = queue.SimpleQueue()
+    for job in jobs:
+        pending.put(job)
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+
+    def record(elapsed):
+        with lock:
+            if elapsed is None:
+                errors[0] += 1
+            else:
+                latencies.append(elapsed)
+
+    def client():
+        transport = make_transport()
+        try:
+            while True:
+                try:
+                    job = pending.get_nowait()
+                except queue.Empty:
+                    return
+                job(transport, record)
+        finally:
+            transport.close()
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    ms = lambda value: round(value * 1000, 3) if value is not None else None
+    return {
+        "requests": len(latencies) + errors[0],
+        "errors": errors[0],
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": ms(percentile(latencies, 0.50)),
+        "p95_ms": ms(percentile(latencies, 0.95)),
+        "p99_ms": ms(percentile(latencies, 0.99)),
+    }
+
+
+def build_scenarios(args):
+    scenarios = {}
+    for intent, prompts in intent_corpora(args.requests).items():
+        scenarios[f"generate.{intent}"] = lambda prompts=prompts: generate_jobs(prompts)
+    for length in args.chain_lengths:
+        scenarios[f"modify.chain{length}"] = lambda length=length: modify_chain_jobs(args.chains, length)
+    if args.only:
+        scenarios = {
+            name: jobs for name, jobs in scenarios.items()
+            if any(name.startswith(prefix) for prefix in args.only)
+        }
+    return scenarios
+
+
+def compare(report, baseline, threshold):
+    """Returns a list of human-readable regressions against `baseline`."""
+    regressions = []
+    for name, metrics in report["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base:
+            continue
+        for key in HIGHER_IS_BETTER:
+            if base.get(key) and metrics.get(key) is not None and metrics[key] < base[key] * (1 - threshold):
+                regressions.append(f"{name}: {key} {metrics[key]} < baseline {base[key]}")
+        for key in LOWER_IS_BETTER:
+            if base.get(key) and metrics.get(key) is not None and metrics[key] > base[key] * (1 + threshold):
+                regressions.append(f"{name}: {key} {metrics[key]} > baseline {base[key]}")
+        if metrics["errors"] > base.get("errors", 0):
+            regressions.append(f"{name}: errors {metrics['errors']} > baseline {base.get('errors', 0)}")
+    return regressions
+
+
+def smoke(make_transport):
+    """Health check plus one /generate and one /modify; returns True when all pass."""
+    transport = make_transport()
+    try:
+        checks = []
+        status, body = transport.get('/health')
+        checks.append(("health", status == 200 and body and body.get("status") == "running"))
+        start = time.perf_counter()
+        status, body = transport.post('/generate', {"prompt": "Create a blue dashboard for Ryze AI"})
+        generated = status == 200 and bool(body and body.get("code"))
+        checks.append((f"generate ({(time.perf_counter() - start) * 1000:.0f} ms)", generated))
+        if generated:
+            status, body = transport.post('/modify', {"prompt": "add a footer", "currentCode": body["code"]})
+            checks.append(("modify", status == 200 and "footer" in (body or {}).get("code", "")))
+    except (OSError, http.client.HTTPException) as e:
+        checks.append((f"connection ({e})", False))
+    finally:
+        transport.close()
+    for name, ok in checks:
+        print(f"{'PASS' if ok else 'FAIL'} {name}")
+    return all(ok for _, ok in checks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument('--url', help="benchmark a running server instead of the in-process app")
+    parser.add_argument('--concurrency', type=int, default=1)
+    parser.add_argument('--requests', type=int, default=200, help="prompts per generate scenario")
+    parser.add_argument('--chains', type=int, default=20, help="chains per modify scenario")
+    parser.add_argument('--chain-lengths', type=lambda value: [int(n) for n in value.split(',')], default=[1, 4, 16])
+    parser.add_argument('--only', type=lambda value: value.split(','), help="scenario names or prefixes")
+    parser.add_argument('--out', help="also write the JSON report to this file")
+    parser.add_argument('--baseline', help="fail if this report regressed against the given one")
+    parser.add_argument('--threshold', type=float, default=0.2, help="allowed relative regression")
+    parser.add_argument('--save-baseline', help="write the report as a new baseline")
+    parser.add_argument('--smoke', action='store_true', help="only check that the service answers")
+    args = parser.parse_args()
+
+    if args.url:
+        make_transport = lambda: HttpTransport(args.url)
+    else:
+        make_transport = InProcessTransport
+
+    if args.smoke:
+        sys.exit(0 if smoke(make_transport) else 1)
+
+    report = {
+        "transport": args.url or "in-process",
+        "concurrency": args.concurrency,
+        "python": platform.python_version(),
+        "scenarios": {},
+    }
+    for name, jobs in build_scenarios(args).items():
+        report["scenarios"][name] = run_scenario(jobs(), make_transport, args.concurrency)
+        print(f"{name:<22} {json.dumps(report['scenarios'][name])}", file=sys.stderr)
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    for path in (args.out, args.save_baseline):
+        if path:
+            with open(path, 'w') as f:
+                f.write(output + "\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
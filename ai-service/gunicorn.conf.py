@@ -0,0 +1,58 @@
+"""
+Gunicorn settings: `gunicorn -c gunicorn.conf.py`.
+
+SERVING_MODE=sync (default) runs the Flask app on threaded workers;
+SERVING_MODE=async runs asgi:app on uvicorn workers. The pipelines are
+CPU-bound under the GIL, so worker processes track the CPU count and
+threads only cover slow clients and I/O.
+
+The app is preloaded and warmed up (app.warm_up) in the master before any
+worker forks, so new and autoscaled workers serve their first request
+warm. PRELOAD_APP=0 loads and warms each worker separately instead.
+"""
+import gc
+import multiprocessing
+import os
+
+SERVING_MODE = os.getenv("SERVING_MODE", "sync")
+CPU_COUNT = multiprocessing.cpu_count()
+
+bind = f"0.0.0.0:{os.getenv('PORT', 5001)}"
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 120))
+keepalive = 5
+
+if SERVING_MODE == "async":
+    wsgi_app = "asgi:app"
+    worker_class = "uvicorn.workers.UvicornWorker"
+    # One event loop per core; concurrency per worker is bounded by MAX_IN_FLIGHT
+    workers = int(os.getenv("WEB_CONCURRENCY", CPU_COUNT))
+else:
+    wsgi_app = "app:app"
+    worker_class = "gthread"
+    workers = int(os.getenv("WEB_CONCURRENCY", max(2, CPU_COUNT)))
+    threads = int(os.getenv("GUNICORN_THREADS", 4))
+
+preload_app = os.getenv("PRELOAD_APP", "1") != "0"
+
+
+def _warm_up(log):
+    import app
+    if app.WARMUP_ENABLED:
+        log.info("Warm-up finished in %.0fms", app.warm_up() * 1000)
+
+
+def on_starting(server):
+    if preload_app:
+        _warm_up(server.log)
+        # Move everything built so far out of the collector's reach, so its
+        # passes never write to (and un-share) the pages workers inherit
+        gc.freeze()
+
+
+def post_worker_init(worker):
+    if not preload_app:
+        _warm_up(worker.log)
+    # Threads and process pools do not survive the fork, so each worker starts its own
+    import app
+    app.deployment_gc.ensure_started()
+    app.offloader.ensure_started()
@@ -0,0 +1,510 @@
+"""
+Cache backends. Every backend has LRUCache's interface: get(key,
+default=None), set(key, value) -> stored, clear() and stats(). Besides the
+in-process LRUCache there are two shared ones, which hold values under a
+digest of the key:
+
+- SharedMemoryCache: a memory-mapped file every process on the host maps;
+  a hit decodes straight from the mapping.
+- RedisCache: any server speaking the Redis protocol (RESP), for caches
+  shared across hosts.
+
+TieredCache puts a process-local LRUCache in front of a shared backend, so
+hot entries never leave the process and misses fall back to what other
+workers already computed.
+
+Whatever sits in a shared backend is read back by every worker, so values
+are stored in a format that cannot run code when decoded (encode_value),
+and files live in a directory only the service user can write to
+(private_dir).
+"""
+import hashlib
+import json
+import mmap
+import os
+import socket
+import stat
+import struct
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from urllib.parse import unquote, urlsplit
+
+from .nlp_engine import PromptAnalysis
+from .responses import EncodedCode
+
+try:
+    import fcntl
+except ImportError:  # Windows: one process, thread locks are enough
+    fcntl = None
+
+BACKENDS = ('local', 'shared', 'redis')
+
+
+def key_digest(key):
+    """16-byte digest naming `key` (any value with a stable repr) in a shared backend."""
+    return hashlib.blake2b(repr(key).encode('utf-8'), digest_size=16).digest()
+
+
+def encode_value(value):
+    """
+    Bytes for a value a shared backend holds: an EncodedCode (the render
+    cache) or a PromptAnalysis (the analysis cache). Raises TypeError for
+    anything else.
+    """
+    if isinstance(value, EncodedCode):
+        return b'C' + value.pack()
+    if isinstance(value, PromptAnalysis):
+        return b'A' + json.dumps(value.to_dict(), separators=(',', ':')).encode('utf-8')
+    raise TypeError(f"Shared caches cannot hold {type(value).__name__} values")
+
+
+def decode_value(data):
+    """The value encode_value() turned into `data` (bytes-like); raises ValueError for anything else."""
+    tag = bytes(data[:1])
+    if tag == b'C':
+        return EncodedCode.unpack(data[1:])
+    if tag == b'A':
+        try:
+            fields = json.loads(bytes(data[1:]))
+        except RecursionError:
+            raise ValueError("Shared cache value nested too deeply") from None
+        return PromptAnalysis.from_dict(fields)
+    raise ValueError(f"Unknown shared cache value (tag {tag!r})")
+
+
+def private_dir(path):
+    """
+    Creates directory `path` (mode 0700) unless it exists, and returns it.
+    Raises PermissionError when it is a symlink or not a directory, belongs
+    to another user, or others can write to it: whoever can write there
+    decides what every worker reads back.
+    """
+    try:
+        os.makedirs(path, mode=0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode):
+        raise PermissionError(f"{path} is not a directory")
+    if hasattr(os, 'getuid'):
+        if info.st_uid != os.getuid():
+            raise PermissionError(f"{path} belongs to another user (uid {info.st_uid})")
+        if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise PermissionError(f"{path} can be written by other users (mode {stat.S_IMODE(info.st_mode):o})")
+    return path
+
+
+def open_private(path, flags):
+    """
+    os.open() for a file in a private_dir(): created with mode 0600, never
+    through a symlink, and refused (PermissionError) when it is not a
+    regular file owned by this user. Returns the descriptor.
+    """
+    fd = os.open(path, flags | getattr(os, 'O_NOFOLLOW', 0) | getattr(os, 'O_CLOEXEC', 0), 0o600)
+    info = os.fstat(fd)
+    if not stat.S_ISREG(info.st_mode) or (hasattr(os, 'getuid') and info.st_uid != os.getuid()):
+        os.close(fd)
+        raise PermissionError(f"{path} is not a regular file owned by this user")
+    return fd
+
+
+# File header: magic, slot size, slot count, ways per set
+_HEADER = struct.Struct('<4sIQI12x')
+_MAGIC = b'RYZM'
+# Slot header: version (odd while being written), key, payload length, payload crc, expiry (0: none), written at
+_SLOT = struct.Struct('<Q16sIIdd')
+_VERSION = struct.Struct('<Q')
+_NO_KEY = bytes(16)
+_TORN = object()
+
+
+class SharedMemoryCache:
+    """
+    A fixed-size cache in one memory-mapped file that every process on the
+    host maps, so workers share one copy of each entry. The file is split
+    into slots of `slot_bytes` grouped in sets of `ways`; a key can only
+    live in its set, so a lookup reads at most `ways` slot headers, and a
+    write replaces an empty or expired way, else the one written longest
+    ago. Values that do not fit in a slot are not stored.
+
+    Readers take no lock: each slot carries a version that writers make
+    odd while they write, and a crc of its payload, so a reader that raced
+    a writer sees a changed version (or a bad crc) and reports a miss.
+    Writers hold a thread lock plus a lock file shared across processes.
+    """
+    def __init__(self, path, size_bytes, slot_bytes=64 * 1024, ways=4, ttl=None):
+        self.path = path
+        self.ttl = ttl
+        self.slot_bytes = slot_bytes
+        self.capacity = slot_bytes - _SLOT.size
+        self.ways = ways
+        self.sets = max(1, size_bytes // (slot_bytes * ways))
+        self.slots = self.sets * ways
+        self._lock = threading.Lock()
+        self._lock_file = None
+        self._lock_pid = None
+        self.hits = 0
+        self.misses = 0
+        self.races = 0
+        self.too_large = 0
+        private_dir(os.path.dirname(path) or '.')
+        self._mm = self._map()
+
+    def _map(self):
+        size = _HEADER.size + self.slots * self.slot_bytes
+        expected = (_MAGIC, self.slot_bytes, self.slots, self.ways)
+        with self._write_lock():
+            try:
+                f = os.fdopen(open_private(self.path, os.O_RDWR), 'r+b')
+            except FileNotFoundError:
+                f = None
+            if f is not None and (os.fstat(f.fileno()).st_size != size
+                                  or _HEADER.unpack(f.read(_HEADER.size)) != expected):
+                # Another layout (the settings changed): start over in a new file
+                f.close()
+                f = None
+            if f is None:
+                tmp_path = self.path + '.new'
+                with os.fdopen(open_private(tmp_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC), 'w+b') as new:
+                    # Sparse: pages are only allocated once a slot is written
+                    new.truncate(size)
+                    new.write(_HEADER.pack(*expected))
+                os.replace(tmp_path, self.path)
+                f = os.fdopen(open_private(self.path, os.O_RDWR), 'r+b')
+            with f:
+                return mmap.mmap(f.fileno(), size)
+
+    @contextmanager
+    def _write_lock(self):
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            # Opened once per process: flock is per open file, and a
+            # descriptor inherited across fork would share the parent's lock
+            if self._lock_pid != os.getpid():
+                self._lock_file = os.fdopen(open_private(self.path + '.lock', os.O_RDWR | os.O_CREAT), 'r+b')
+                self._lock_pid = os.getpid()
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def _offsets(self, digest):
+        first = int.from_bytes(digest[8:], 'little') % self.sets * self.ways
+        return [_HEADER.size + (first + way) * self.slot_bytes for way in range(self.ways)]
+
+    def get(self, key, default=None):
+        digest = key_digest(key)
+        mm = self._mm
+        now = time.time()
+        for offset in self._offsets(digest):
+            version, slot_key, length, crc, expires_at, _ = _SLOT.unpack_from(mm, offset)
+            if slot_key != digest or version & 1:
+                continue
+            if expires_at and expires_at <= now:
+                break
+            start = offset + _SLOT.size
+            with memoryview(mm)[start:start + length] as payload:
+                if zlib.crc32(payload) != crc:
+                    self.races += 1
+                    break
+                try:
+                    value = decode_value(payload)
+                except ValueError:
+                    # Overwritten while it was decoded
+                    value = _TORN
+            # The payload is read in place, so a writer that started after the
+            # crc check may have changed it: only an unchanged version counts
+            if value is _TORN or _VERSION.unpack_from(mm, offset)[0] != version:
+                self.races += 1
+                break
+            self.hits += 1
+            return value
+        self.misses += 1
+        return default
+
+    def set(self, key, value):
+        payload = encode_value(value)
+        if len(payload) > self.capacity:
+            self.too_large += 1
+            return False
+        digest = key_digest(key)
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl else 0.0
+        with self._write_lock():
+            mm = self._mm
+            target = None
+            oldest = None
+            for offset in self._offsets(digest):
+                version, slot_key, _, _, slot_expires, written_at = _SLOT.unpack_from(mm, offset)
+                if slot_key == digest or slot_key == _NO_KEY or (slot_expires and slot_expires <= now):
+                    target = offset
+                    break
+                if oldest is None or written_at < oldest[1]:
+                    oldest = (offset, written_at)
+            if target is None:
+                target = oldest[0]
+            # Odd while the slot is rewritten, so overlapping readers see the
+            # change (rounded up first: a writer that died mid-write left it odd)
+            version = _VERSION.unpack_from(mm, target)[0] + 1 | 1
+            _VERSION.pack_into(mm, target, version)
+            start = target + _SLOT.size
+            mm[start:start + len(payload)] = payload
+            _SLOT.pack_into(mm, target, version, digest, len(payload), zlib.crc32(payload), expires_at, now)
+            _VERSION.pack_into(mm, target, version + 1)
+        return True
+
+    def clear(self):
+        with self._write_lock():
+            mm = self._mm
+            for index in range(self.slots):
+                offset = _HEADER.size + index * self.slot_bytes
+                version = _VERSION.unpack_from(mm, offset)[0]
+                if version:
+                    # Next even version, so readers mid-way through the old entry miss
+                    _SLOT.pack_into(mm, offset, (version | 1) + 1, _NO_KEY, 0, 0, 0.0, 0.0)
+
+    def stats(self):
+        entries = used = 0
+        now = time.time()
+        for index in range(self.slots):
+            version, slot_key, length, _, expires_at, _ = _SLOT.unpack_from(self._mm, _HEADER.size + index * self.slot_bytes)
+            if slot_key != _NO_KEY and not (expires_at and expires_at <= now):
+                entries += 1
+                used += length
+        lookups = self.hits + self.misses
+        return {
+            "backend": "shared",
+            "path": self.path,
+            "entries": entries,
+            "bytes": used,
+            "slots": self.slots,
+            "slot_bytes": self.slot_bytes,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "races": self.races,
+            "too_large": self.too_large,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class RedisError(Exception):
+    pass
+
+
+class RedisCache:
+    """
+    A cache on a Redis-protocol server (`url` like redis://:password@host:6379/0).
+    Keys are `namespace` plus the key digest; `ttl` becomes the keys'
+    expiry, and eviction is the server's (its maxmemory policy). Each
+    thread keeps its own connection. The cache is best-effort: a server
+    that is down or slow (past `timeout` seconds) only turns lookups into
+    misses and writes into no-ops, counted in stats()["errors"].
+    """
+    def __init__(self, url, namespace='ryze', ttl=None, timeout=0.25):
+        parts = urlsplit(url)
+        self.host = parts.hostname or 'localhost'
+        self.port = parts.port or 6379
+        self.password = unquote(parts.password) if parts.password else None
+        self.db = int(parts.path.lstrip('/') or 0)
+        self.namespace = namespace.encode('utf-8') + b':'
+        self.ttl = ttl
+        self.timeout = timeout
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.last_error = None
+
+    # --- protocol ----------------------------------------------------------
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        # Sockets inherited across fork are the parent's
+        if connection is not None and connection[2] == os.getpid():
+            return connection
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        connection = self._local.connection = (sock, sock.makefile('rb'), os.getpid())
+        if self.password:
+            self._call(connection, b'AUTH', self.password.encode('utf-8'))
+        if self.db:
+            self._call(connection, b'SELECT', str(self.db).encode())
+        return connection
+
+    def _call(self, connection, *args):
+        sock, reader, _ = connection
+        command = [b'*%d\r\n' % len(args)]
+        for arg in args:
+            command.append(b'$%d\r\n%s\r\n' % (len(arg), arg))
+        sock.sendall(b''.join(command))
+        return self._reply(reader)
+
+    def _reply(self, reader):
+        line = reader.readline()
+        if not line.endswith(b'\r\n'):
+            raise ConnectionError("Connection closed by the server")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b'+':
+            return rest
+        if kind == b'-':
+            raise RedisError(rest.decode('utf-8', 'replace'))
+        if kind == b':':
+            return int(rest)
+        if kind == b'$':
+            length = int(rest)
+            if length < 0:
+                return None
+            data = reader.read(length + 2)
+            if len(data) != length + 2:
+                raise ConnectionError("Connection closed by the server")
+            return data[:-2]
+        if kind == b'*':
+            count = int(rest)
+            return None if count < 0 else [self._reply(reader) for _ in range(count)]
+        raise RedisError(f"Unexpected reply {line[:32]!r}")
+
+    def execute(self, *args):
+        """Runs one command; raises on connection and server errors."""
+        args = [arg if isinstance(arg, bytes) else str(arg).encode('utf-8') for arg in args]
+        try:
+            return self._call(self._connection(), *args)
+        except (OSError, ConnectionError, ValueError):
+            # The reply stream may be out of step: next call reconnects
+            self._drop()
+            raise
+
+    def _drop(self):
+        connection = getattr(self._local, 'connection', None)
+        self._local.connection = None
+        if connection is not None:
+            try:
+                connection[0].close()
+            except OSError:
+                pass
+
+    def _failed(self, error):
+        self.errors += 1
+        self.last_error = str(error)
+
+    # --- cache interface ---------------------------------------------------
+
+    def _key(self, key):
+        return self.namespace + key_digest(key).hex().encode()
+
+    def get(self, key, default=None):
+        try:
+            data = self.execute(b'GET', self._key(key))
+        except (OSError, ConnectionError, ValueError, RedisError) as e:
+            self._failed(e)
+            self.misses += 1
+            return default
+        if data is None:
+            self.misses += 1
+            return default
+        try:
+            value = decode_value(data)
+        except ValueError as e:
+            # Not something encode_value() wrote: another client's, or corrupt
+            self._failed(e)
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        args = [b'SET', self._key(key), encode_value(value)]
+        if self.ttl:
+            args += [b'PX', str(int(self.ttl * 1000)).encode()]
+        try:
+            self.execute(*args)
+        except (OSError, ConnectionError, ValueError, RedisError) as e:
+            self._failed(e)
+            return False
+        return True
+
+    def clear(self):
+        """Deletes this namespace's keys (not the rest of the database)."""
+        cursor = b'0'
+        try:
+            while True:
+                cursor, keys = self.execute(b'SCAN', cursor, b'MATCH', self.namespace + b'*', b'COUNT', b'1000')
+                if keys:
+                    self.execute(b'DEL', *keys)
+                if cursor == b'0':
+                    break
+        except (OSError, ConnectionError, ValueError, RedisError) as e:
+            self._failed(e)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "backend": "redis",
+            "server": f"{self.host}:{self.port}/{self.db}",
+            "namespace": self.namespace[:-1].decode('utf-8'),
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class TieredCache:
+    """
+    A process-local LRUCache in front of a shared backend. Lookups try the
+    local cache, then the shared one (copying a hit into the local cache);
+    writes go to both. stats() is the local cache's, plus the shared
+    backend's under "shared".
+    """
+    def __init__(self, local, shared):
+        self.local = local
+        self.shared = shared
+
+    def get(self, key, default=None):
+        value = self.local.get(key)
+        if value is None:
+            value = self.shared.get(key)
+            if value is None:
+                return default
+            self.local.set(key, value)
+        return value
+
+    def set(self, key, value):
+        stored = self.local.set(key, value)
+        return self.shared.set(key, value) or stored
+
+    def clear(self):
+        self.local.clear()
+        self.shared.clear()
+
+    def __len__(self):
+        return len(self.local)
+
+    def stats(self):
+        return dict(self.local.stats(), shared=self.shared.stats())
+
+
+def make_cache(backend, local, name, shared_dir=None, size_bytes=64 * 1024 * 1024,
+               slot_bytes=64 * 1024, redis_url=None, ttl=None):
+    """
+    The cache for `backend` ('local', 'shared' or 'redis'): `local` (an
+    LRUCache) alone, or in front of a shared backend named after `name`
+    (its file in `shared_dir`, or its key namespace on the server).
+    """
+    if backend == 'local':
+        return local
+    if backend == 'shared':
+        path = os.path.join(shared_dir, f"{name}.cache")
+        return TieredCache(local, SharedMemoryCache(path, size_bytes, slot_bytes=slot_bytes, ttl=ttl))
+    if backend == 'redis':
+        if not redis_url:
+            raise ValueError("The redis cache backend needs a server URL (REDIS_URL)")
+        return TieredCache(local, RedisCache(redis_url, namespace=f"ryze:{name}", ttl=ttl))
+    raise ValueError(f"Unknown cache backend {backend!r} (expected one of {', '.join(BACKENDS)})")
@@ -0,0 +1,506 @@
+import hashlib
+import os
+import re
+import struct
+import tempfile
+import threading
+import time
+import zlib
+
+from .cache import LRUCache
+from .disk_index import DiskHashTable, file_lock
+
+# Deployment ids: 8 hex chars for pages from the Node service, 20 for content-hash names
+KEY_PATTERN = re.compile(r'^[0-9a-f]{8,64}$')
+
+DIGEST_SIZE = 16
+# Manifest: magic, total size, chunk count, then one raw digest per chunk
+_MANIFEST_MAGIC = b'RYZM'
+_MANIFEST_HEADER = struct.Struct('<4sQI')
+
+# Chunk boundaries fall after a line whose CRC has these bits clear, once the
+# chunk holds MIN_CHUNK bytes. Boundaries depend only on nearby content, so
+# pages that share a run of lines (head scripts, the icon shim, the mount
+# code) split it into the same chunks wherever it appears.
+MIN_CHUNK = 1024
+MAX_CHUNK = 16384
+_BOUNDARY_MASK = 0x1f
+
+# Artifacts and chunks are spread over this many index shards (by key/digest byte)
+SHARDS = 256
+# Index entry: pack generation, offset and size of the manifest record in
+# that pack, created and last-access times (epoch seconds)
+_ENTRY_FORMAT = 'IQIII'
+# Chunk entry: references from manifests, chunk size
+_REF_FORMAT = 'II'
+# Reads only rewrite an entry's last-access time once it is this stale
+ACCESS_RESOLUTION = 60
+# A shard's manifest pack is rewritten once it is mostly removed records
+COMPACT_MIN_BYTES = 64 * 1024
+
+
+def split_chunks(data):
+    """Splits bytes into content-defined chunks, cut at line ends."""
+    chunks = []
+    start = size = 0
+    for line in data.splitlines(keepends=True):
+        size += len(line)
+        if size >= MAX_CHUNK or (size >= MIN_CHUNK and not zlib.crc32(line) & _BOUNDARY_MASK):
+            chunks.append(data[start:start + size])
+            start += size
+            size = 0
+    if size:
+        chunks.append(data[start:])
+    return chunks
+
+
+def _write_atomic(path, data):
+    # Readers never see a partial file, and a crash leaves nothing behind
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _index_key(artifact_id):
+    return hashlib.blake2b(artifact_id.encode('ascii'), digest_size=DIGEST_SIZE).digest()
+
+
+def _parse_manifest(raw):
+    """(total size, digests) from a manifest, or None if it is malformed."""
+    magic, size, count = _MANIFEST_HEADER.unpack_from(raw)
+    body = raw[_MANIFEST_HEADER.size:]
+    if magic != _MANIFEST_MAGIC or len(body) != count * DIGEST_SIZE:
+        return None
+    return size, tuple(body[i:i + DIGEST_SIZE] for i in range(0, len(body), DIGEST_SIZE))
+
+
+class _Shard:
+    """
+    One index shard: a DiskHashTable of entries and the append-only pack
+    file holding their manifests as (index key + manifest) records.
+    Compaction moves the live records into the pack of the next
+    generation; every entry names the generation its record is in.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        self.index = DiskHashTable(os.path.join(directory, 'entries.idx'), _ENTRY_FORMAT, initial_slots=64)
+        self._pack = None
+        self._pack_generation = None
+        self._lock = threading.Lock()
+
+    def pack_path(self, generation):
+        return os.path.join(self.directory, f'manifests.{generation}.pack')
+
+    def generations(self):
+        return sorted(
+            int(name.split('.')[1]) for name in os.listdir(self.directory)
+            if name.startswith('manifests.') and name.endswith('.pack')
+        )
+
+    def append(self, record):
+        """Appends to the newest pack; returns (generation, offset). Index lock held."""
+        generation = max(self.generations(), default=0)
+        with open(self.pack_path(generation), 'ab') as f:
+            offset = f.tell()
+            f.write(record)
+        return generation, offset
+
+    def read(self, generation, offset, size):
+        with self._lock:
+            if self._pack_generation != generation:
+                self.close()
+                self._pack = open(self.pack_path(generation), 'rb')
+                self._pack_generation = generation
+            self._pack.seek(offset)
+            return self._pack.read(size)
+
+    def close(self):
+        if self._pack is not None:
+            self._pack.close()
+            self._pack = self._pack_generation = None
+
+
+class ChunkStore:
+    """
+    Content-addressed artifact storage. Each artifact is split into chunks
+    (split_chunks), every chunk is stored once under its blake2b digest in
+    chunks/, and the artifact itself is a small manifest listing its
+    digests. Pages built from the same shell and templates share nearly all
+    their chunks, so each new deployment mostly costs its manifest. Reads
+    stream the chunks back in order; hot chunks and manifests are kept in
+    memory.
+
+    Manifests live in per-shard pack files under index/<shard>/, located
+    through a memory-mapped hash table of id -> (pack, offset, size,
+    created, last access), so a lookup costs the same at any store size
+    and adds no file per artifact. Chunk reference counts (refs/) let
+    collect() free chunks once no manifest uses them.
+    """
+    def __init__(self, root, cache_bytes=32 * 1024 * 1024, manifest_entries=4096):
+        self.root = root
+        self.chunks_dir = os.path.join(root, 'chunks')
+        self.index_dir = os.path.join(root, 'index')
+        self.refs_dir = os.path.join(root, 'refs')
+        self._chunk_cache = LRUCache(max_entries=None, max_bytes=cache_bytes)
+        # index key -> ((generation, offset), (size, digests))
+        self._manifest_cache = LRUCache(max_entries=manifest_entries)
+        # Opened on first use
+        self._shards = [None] * SHARDS
+        self._refs = [None] * SHARDS
+        self._lock = threading.Lock()
+
+        self.artifacts_written = 0
+        self.chunks_written = 0
+        self.logical_bytes_written = 0
+        self.chunk_bytes_written = 0
+        self.manifest_bytes_written = 0
+        self.artifacts_collected = 0
+        self.chunks_collected = 0
+        self.chunk_bytes_collected = 0
+        self.compactions = 0
+
+    @staticmethod
+    def _check_key(key):
+        if not KEY_PATTERN.match(key):
+            raise ValueError(f"invalid artifact key {key!r}")
+
+    def _chunk_path(self, digest):
+        hexdigest = digest.hex()
+        return os.path.join(self.chunks_dir, hexdigest[:2], hexdigest[2:])
+
+    def shard(self, number):
+        shard = self._shards[number]
+        if shard is None:
+            with self._lock:
+                shard = self._shards[number]
+                if shard is None:
+                    shard = self._shards[number] = _Shard(os.path.join(self.index_dir, f'{number:02x}'))
+        return shard
+
+    def _ref_table(self, digest):
+        table = self._refs[digest[0]]
+        if table is None:
+            with self._lock:
+                table = self._refs[digest[0]]
+                if table is None:
+                    table = self._refs[digest[0]] = DiskHashTable(
+                        os.path.join(self.refs_dir, f'{digest[0]:02x}.idx'), _REF_FORMAT, initial_slots=64
+                    )
+        return table
+
+    def _count(self, **deltas):
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    # --- chunks ----------------------------------------------------------
+
+    def _add_ref(self, digest, chunk):
+        refs = self._ref_table(digest)
+        with refs.transaction():
+            entry = refs.get(digest)
+            if entry is not None:
+                refs.put(digest, (entry[0] + 1, entry[1]))
+                return
+            chunk_path = self._chunk_path(digest)
+            # An unreferenced file can survive a crash; its content is still right
+            if not os.path.exists(chunk_path):
+                os.makedirs(os.path.dirname(chunk_path), exist_ok=True)
+                _write_atomic(chunk_path, chunk)
+                self._count(chunks_written=1, chunk_bytes_written=len(chunk))
+            refs.put(digest, (1, len(chunk)))
+
+    def _release(self, digests):
+        for digest in digests:
+            refs = self._ref_table(digest)
+            with refs.transaction():
+                entry = refs.get(digest)
+                if entry is None:
+                    continue
+                if entry[0] > 1:
+                    refs.put(digest, (entry[0] - 1, entry[1]))
+                    continue
+                refs.delete(digest)
+                try:
+                    os.remove(self._chunk_path(digest))
+                except FileNotFoundError:
+                    pass
+                self._count(chunks_collected=1, chunk_bytes_collected=entry[1])
+
+    def _chunk(self, digest):
+        chunk = self._chunk_cache.get(digest)
+        if chunk is None:
+            with open(self._chunk_path(digest), 'rb') as f:
+                chunk = f.read()
+            if hashlib.blake2b(chunk, digest_size=DIGEST_SIZE).digest() != digest:
+                raise ValueError(f"corrupt chunk {digest.hex()}")
+            self._chunk_cache.set(digest, chunk)
+        return chunk
+
+    # --- artifacts -------------------------------------------------------
+
+    def has(self, key):
+        self._check_key(key)
+        index_key = _index_key(key)
+        return self.shard(index_key[0]).index.get(index_key) is not None
+
+    def put(self, key, data):
+        """
+        Stores `data` under `key`, writing only chunks the store lacks.
+        Returns False (and writes nothing) when the key already exists.
+        """
+        self._check_key(key)
+        index_key = _index_key(key)
+        shard = self.shard(index_key[0])
+        with shard.index.transaction() as index:
+            if index.get(index_key) is not None:
+                return False
+
+            digests = []
+            for chunk in split_chunks(data):
+                digest = hashlib.blake2b(chunk, digest_size=DIGEST_SIZE).digest()
+                digests.append(digest)
+                self._add_ref(digest, chunk)
+
+            # The entry goes last: an artifact is visible only once all its chunks are
+            manifest = _MANIFEST_HEADER.pack(_MANIFEST_MAGIC, len(data), len(digests)) + b''.join(digests)
+            generation, offset = shard.append(index_key + manifest)
+            now = int(time.time())
+            index.put(index_key, (generation, offset, DIGEST_SIZE + len(manifest), now, now))
+
+        self._manifest_cache.set(index_key, ((generation, offset), (len(data), tuple(digests))))
+        self._count(artifacts_written=1, logical_bytes_written=len(data), manifest_bytes_written=len(manifest))
+        return True
+
+    def open(self, key):
+        """
+        Returns (size, iterator of byte chunks) for an artifact, or None if
+        it does not exist. Chunks are read lazily, as the iterator advances.
+        """
+        self._check_key(key)
+        index_key = _index_key(key)
+        shard = self.shard(index_key[0])
+        # A second try covers a compaction that retired the pack in between
+        for _ in range(2):
+            entry = shard.index.get(index_key)
+            if entry is None:
+                return None
+            generation, offset, size, created, last_access = entry
+
+            cached = self._manifest_cache.get(index_key)
+            if cached is not None and cached[0] == (generation, offset):
+                manifest = cached[1]
+            else:
+                try:
+                    record = shard.read(generation, offset, size)
+                except FileNotFoundError:
+                    continue
+                manifest = _parse_manifest(record[DIGEST_SIZE:]) if record[:DIGEST_SIZE] == index_key else None
+                if manifest is None:
+                    raise ValueError(f"corrupt manifest for {key!r}")
+                self._manifest_cache.set(index_key, ((generation, offset), manifest))
+
+            now = int(time.time())
+            if now - last_access >= ACCESS_RESOLUTION:
+                shard.index.update(index_key, (generation, offset, size, created, now))
+            total, digests = manifest
+            return total, (self._chunk(digest) for digest in digests)
+        return None
+
+    def read(self, key):
+        """The whole artifact as bytes, or None if it does not exist."""
+        opened = self.open(key)
+        return b''.join(opened[1]) if opened is not None else None
+
+    # --- garbage collection ----------------------------------------------
+
+    def collect(self, number, ttl=None, max_entries=None, now=None, batch=64):
+        """
+        One incremental collection step over index shard `number`: removes
+        artifacts not read for `ttl` seconds, then the least recently read
+        ones beyond `max_entries` (this shard's share of the limit), frees
+        chunks no artifact references any more and compacts the shard's
+        pack if it is mostly dead. Removals happen `batch` at a time, so
+        requests wait at most one batch for the shard. Returns the number of
+        artifacts removed.
+        """
+        shard = self.shard(number)
+        now = int(time.time()) if now is None else now
+        victims = []
+        keep = []
+        for key, entry in shard.index.items():
+            (victims if ttl and now - entry[4] > ttl else keep).append((key, entry))
+        if max_entries is not None and len(keep) > max_entries:
+            keep.sort(key=lambda item: item[1][4])
+            victims.extend(keep[:len(keep) - max_entries])
+
+        removed = 0
+        for start in range(0, len(victims), batch):
+            released = []
+            with shard.index.transaction() as index:
+                for key, entry in victims[start:start + batch]:
+                    # Skip entries read (or moved by a compaction) since the snapshot
+                    if index.get(key) != entry:
+                        continue
+                    manifest = _parse_manifest(shard.read(*entry[:3])[DIGEST_SIZE:])
+                    index.delete(key)
+                    removed += 1
+                    if manifest is not None:
+                        released.extend(manifest[1])
+            # Chunks are released outside the shard lock; the entry is already gone
+            self._release(released)
+
+        self._count(artifacts_collected=removed)
+        self._compact(shard)
+        return removed
+
+    def _compact(self, shard):
+        with shard.index.transaction() as index:
+            generations = shard.generations()
+            if not generations:
+                return False
+            entries = index.items()
+            live = sum(entry[2] for _, entry in entries)
+            total = sum(os.path.getsize(shard.pack_path(generation)) for generation in generations)
+            if total < COMPACT_MIN_BYTES or total < 2 * live:
+                return False
+
+            generation = generations[-1] + 1
+            moved = []
+            with open(shard.pack_path(generation), 'wb') as f:
+                for key, entry in entries:
+                    record = shard.read(*entry[:3])
+                    moved.append((key, (generation, f.tell()) + entry[2:]))
+                    f.write(record)
+            for key, entry in moved:
+                index.put(key, entry)
+            shard.close()
+            for old in generations:
+                os.remove(shard.pack_path(old))
+        self._count(compactions=1)
+        return True
+
+    # --- reporting -------------------------------------------------------
+
+    def stats(self):
+        with self._lock:
+            counters = {
+                "artifacts_written": self.artifacts_written,
+                "chunks_written": self.chunks_written,
+                "logical_bytes_written": self.logical_bytes_written,
+                "chunk_bytes_written": self.chunk_bytes_written,
+                "manifest_bytes_written": self.manifest_bytes_written,
+                "artifacts_collected": self.artifacts_collected,
+                "chunks_collected": self.chunks_collected,
+                "chunk_bytes_collected": self.chunk_bytes_collected,
+                "compactions": self.compactions,
+            }
+        counters["chunk_cache"] = self._chunk_cache.stats()
+        return counters
+
+    def usage(self):
+        """
+        Reads every shard: artifact count, their total logical size, and the
+        bytes actually held (chunks plus manifest packs and index tables).
+        Cost grows with the store; meant for tools, not request paths.
+        """
+        artifacts = logical = index_bytes = chunks = chunk_bytes = 0
+        for number in range(SHARDS):
+            if not os.path.isdir(os.path.join(self.index_dir, f'{number:02x}')):
+                continue
+            shard = self.shard(number)
+            for _, entry in shard.index.items():
+                artifacts += 1
+                record = shard.read(*entry[:3])
+                logical += _MANIFEST_HEADER.unpack_from(record, DIGEST_SIZE)[1]
+            for name in os.listdir(shard.directory):
+                index_bytes += os.path.getsize(os.path.join(shard.directory, name))
+        for number in range(SHARDS):
+            path = os.path.join(self.refs_dir, f'{number:02x}.idx')
+            if not os.path.exists(path):
+                continue
+            index_bytes += os.path.getsize(path)
+            for _, (_, size) in self._ref_table(bytes([number])).items():
+                chunks += 1
+                chunk_bytes += size
+        return {
+            "artifacts": artifacts,
+            "logical_bytes": logical,
+            "chunks": chunks,
+            "chunk_bytes": chunk_bytes,
+            "index_bytes": index_bytes,
+            "stored_bytes": chunk_bytes + index_bytes,
+        }
+
+
+class GarbageCollector:
+    """
+    Background collection for a ChunkStore: a daemon thread that calls
+    collect() on one shard at a time, spreading a full pass over all shards
+    across `interval` seconds, so no step holds a shard for long. Artifacts
+    expire `ttl` seconds after their last read and/or the least recently
+    read go once the store holds more than `max_artifacts` (enforced per
+    shard, so approximately). Worker processes each run one; a lock file
+    keeps their steps from overlapping.
+    """
+    def __init__(self, store, ttl=None, max_artifacts=None, interval=3600):
+        self.store = store
+        self.ttl = ttl
+        self.max_entries = -(-max_artifacts // SHARDS) if max_artifacts else None
+        self.interval = interval
+        self._pid = None
+        self._lock = threading.Lock()
+        self.passes = 0
+        self.errors = 0
+        self.last_error = None
+
+    @property
+    def enabled(self):
+        return bool(self.ttl or self.max_entries)
+
+    def ensure_started(self):
+        """Starts the thread in this process; cheap to call on every request."""
+        if not self.enabled or self._pid == os.getpid():
+            return
+        with self._lock:
+            # Threads do not survive fork: compare pids, not a flag
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            threading.Thread(target=self._run, name='deployment-gc', daemon=True).start()
+
+    def _run(self):
+        while True:
+            for number in range(SHARDS):
+                time.sleep(self.interval / SHARDS)
+                self.step(number)
+            self.passes += 1
+
+    def step(self, number):
+        """Collects one shard unless another process is collecting; returns artifacts removed."""
+        os.makedirs(self.store.root, exist_ok=True)
+        with file_lock(os.path.join(self.store.root, 'gc.lock'), blocking=False) as acquired:
+            if not acquired:
+                return 0
+            try:
+                return self.store.collect(number, ttl=self.ttl, max_entries=self.max_entries)
+            except (OSError, ValueError) as e:
+                self.errors += 1
+                self.last_error = str(e)
+                return 0
+
+    def stats(self):
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl,
+            "max_entries_per_shard": self.max_entries,
+            "interval_seconds": self.interval,
+            "passes": self.passes,
+            "errors": self.errors,
+            "last_error": self.last_error,
+        }
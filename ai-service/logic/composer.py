@@ -0,0 +1,70 @@
+import os
+
+from .cache import LRUCache
+from .rewrite_engine import AnchorIndex, PageEditor, SpliceBuffer
+from .sections import CONTENT_ANCHORS, Section
+from .template_engine import CompiledTemplate, section_templates, template_engine
+
+# Most secondary intents whose sections are added to one composed page
+COMPOSE_MAX_SECTIONS = int(os.getenv("COMPOSE_MAX_SECTIONS", 3))
+
+
+class PageComposer:
+    """
+    One page from several intents: the base intent's template with the
+    section fragments of the next-ranked intents spliced in where content
+    goes (before the footer, else at the end of <main> or of the page).
+    The splice happens once per combination of template versions and the
+    result is compiled like any template, so rendering a composed page is
+    the same single join as rendering a plain one.
+    """
+    def __init__(self, templates, fragments, max_sections=COMPOSE_MAX_SECTIONS, max_entries=256):
+        self.templates = templates
+        self.fragments = fragments
+        self.max_sections = max_sections
+        # (base, version, (fragment, version)...) -> CompiledTemplate
+        self.cache = LRUCache(max_entries=max_entries, sizeof=lambda template: len(template.source))
+
+    def sections(self, analysis):
+        """Intents after the top one in `analysis.scores` that have a fragment, best first."""
+        found = []
+        for intent, _ in analysis.scores:
+            if len(found) == self.max_sections:
+                break
+            if intent != analysis.intent and self.fragments.has(intent):
+                found.append(intent)
+        return tuple(found)
+
+    def get(self, intent, sections):
+        """CompiledTemplate for `intent`'s page with the fragments of `sections` added."""
+        base = self.templates.get(intent)
+        fragments = [self.fragments.get(name) for name in sections]
+        # Digests too: a template or fragment edited in place keeps its version
+        key = (base.name, base.version, base.digest) + tuple(
+            (fragment.name, fragment.version, fragment.digest) for fragment in fragments
+        )
+        template = self.cache.get(key)
+        if template is None:
+            template = self._compose(base, fragments)
+            self.cache.set(key, template)
+        return template
+
+    def _compose(self, base, fragments):
+        source = base.source
+        editor = PageEditor(SpliceBuffer(source, AnchorIndex(source)))
+        for fragment in fragments:
+            # Placeholders are left in place (empty context) and filled when the composite renders
+            section = Section(fragment.name, fragment.source.strip(), anchors=CONTENT_ANCHORS, register=fragment.name)
+            section.place(editor, {})
+        return CompiledTemplate(
+            editor.doc.render(),
+            name="+".join([base.name] + [fragment.name for fragment in fragments]),
+            version="+".join([base.version or ""] + [fragment.version or "" for fragment in fragments]),
+        )
+
+    def stats(self):
+        return self.cache.stats()
+
+
+# Singleton instance
+page_composer = PageComposer(template_engine, section_templates)
@@ -0,0 +1,58 @@
+import hashlib
+import re
+
+from .template_engine import CompiledTemplate
+from .templates import DEPLOYMENT_SHELL
+
+# Lines the in-browser Babel build cannot run (modules are globals there)
+_IMPORT_LINE = re.compile(r'^[ \t]*import[ \t].*(?:\r?\n|$)', re.MULTILINE)
+_COMPONENT_NAME = re.compile(r'export\s+default\s+function\s+([A-Za-z_$][\w$]*)')
+
+# Content-hash ids (older pages from the Node service have 8-char random ids)
+ARTIFACT_PATTERN = re.compile(r'^[0-9a-f]{20}$')
+
+
+def _inline_code(code):
+    code = _IMPORT_LINE.sub('', code)
+    code = code.replace('export default function', 'function', 1).replace('export default', '', 1)
+    # A literal </script> would end the inline script early
+    return code.replace('</script', '<\\/script')
+
+
+class DeploymentBuilder:
+    """
+    Builds standalone HTML pages from generated code and keeps them in a
+    ChunkStore under a content-hash id. The id is a hash of the code and the
+    page shell, so identical code always maps to one artifact: a repeated
+    deploy is answered from the store's manifest cache (or one stat after a
+    restart) without rendering or writing anything.
+    """
+    def __init__(self, store, frontend_url='https://ryze-ai-agent.vercel.app', shell=DEPLOYMENT_SHELL):
+        self.store = store
+        self.frontend_url = frontend_url
+        self.shell = CompiledTemplate(shell, name='deployment')
+        # Changing the shell (or its settings) changes every artifact id
+        self._salt = hashlib.blake2b(
+            (shell + '\0' + frontend_url).encode('utf-8'), digest_size=16
+        ).digest()
+
+    def artifact_id(self, code):
+        return hashlib.blake2b(code.encode('utf-8'), digest_size=10, key=self._salt).hexdigest()
+
+    def render(self, code):
+        match = _COMPONENT_NAME.search(code)
+        return self.shell.render(
+            TITLE=match.group(1) if match else 'Ryze Deployment',
+            FRONTEND_URL=self.frontend_url,
+            CODE=_inline_code(code),
+        )
+
+    def deploy(self, code):
+        """Returns (artifact id, created) for `code`, storing it at most once."""
+        artifact_id = self.artifact_id(code)
+        if self.store.has(artifact_id):
+            return artifact_id, False
+        return artifact_id, self.store.put(artifact_id, self.render(code).encode('utf-8'))
+
+    def stats(self):
+        return self.store.stats()
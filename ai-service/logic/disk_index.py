@@ -0,0 +1,259 @@
+import mmap
+import os
+import struct
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: one process, thread locks are enough
+    fcntl = None
+
+# Header: magic, retired flag, slot count, live entries, filled slots (live + deleted)
+_HEADER = struct.Struct('<4sB3xQQQ')
+_MAGIC = b'RYZX'
+_RETIRED_OFFSET = 4
+
+_EMPTY, _LIVE, _DELETED = 0, 1, 2
+KEY_SIZE = 16
+_SLOT_HEAD = struct.Struct(f'<B{KEY_SIZE}s')
+MAX_LOAD = 0.7
+
+
+@contextmanager
+def file_lock(path, blocking=True):
+    """
+    Exclusive lock shared by every process that opens `path`. Yields
+    whether it was acquired (always True when blocking). Not reentrant.
+    """
+    if fcntl is None:
+        yield True
+        return
+    with open(path, 'a+b') as f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class DiskHashTable:
+    """
+    Fixed-width records in an open-addressing hash table kept in one
+    memory-mapped file: 16-byte keys (already uniformly hashed, e.g.
+    digests) mapped to a tuple packed with `value_format`. Slots are picked
+    from the key's second half, so callers may shard on its first bytes. A lookup touches
+    one or two slots of the mapping whatever the table size, and nothing is
+    loaded into memory up front, so every process on the host can map the
+    same file and see the others' writes.
+
+    Writers hold a thread lock plus a lock file shared across processes.
+    When the table fills up (or fills with deleted slots) it is rebuilt
+    into a new file that replaces the old one; the old file is flagged as
+    retired first, so other processes notice and re-map it.
+    """
+    def __init__(self, path, value_format, initial_slots=1024):
+        self.path = path
+        self.initial_slots = initial_slots
+        self._slot = struct.Struct(f'<B{KEY_SIZE}s' + value_format)
+        self._lock = threading.RLock()
+        # Nesting depth of _locked() in the thread holding self._lock
+        self._depth = 0
+        # Lock file, opened once per process (flock is per open file, and
+        # a descriptor inherited across fork would share the parent's lock)
+        self._lock_file = None
+        self._lock_pid = None
+        self._file = None
+        self._mm = None
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._locked():
+            pass
+
+    # --- mapping ---------------------------------------------------------
+
+    def _create(self, path, slots, entries=()):
+        size = _HEADER.size + slots * self._slot.size
+        with open(path, 'w+b') as f:
+            f.truncate(size)
+            mm = mmap.mmap(f.fileno(), size)
+            live = 0
+            for key, value in entries:
+                index = self._probe_empty(mm, slots, key)
+                self._slot.pack_into(mm, _HEADER.size + index * self._slot.size, _LIVE, key, *value)
+                live += 1
+            _HEADER.pack_into(mm, 0, _MAGIC, 0, slots, live, live)
+            mm.flush()
+            mm.close()
+
+    def _map(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._file.close()
+        if not os.path.exists(self.path):
+            tmp_path = self.path + '.new'
+            self._create(tmp_path, self.initial_slots)
+            os.replace(tmp_path, self.path)
+        self._file = open(self.path, 'r+b')
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        magic, _, self._slots, _, _ = _HEADER.unpack_from(self._mm)
+        if magic != _MAGIC:
+            raise ValueError(f"{self.path} is not an index file")
+
+    def _current(self):
+        # Another process rebuilt the table since this one mapped it
+        if self._mm is None or self._mm[_RETIRED_OFFSET]:
+            self._map()
+        return self._mm
+
+    @contextmanager
+    def _locked(self):
+        with self._lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield
+                finally:
+                    self._depth -= 1
+                return
+            if fcntl is not None and self._lock_pid != os.getpid():
+                self._lock_file = open(self.path + '.lock', 'a+b')
+                self._lock_pid = os.getpid()
+            if fcntl is not None:
+                fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            self._depth = 1
+            try:
+                self._current()
+                yield
+            finally:
+                self._depth = 0
+                if fcntl is not None:
+                    fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    # --- slots -----------------------------------------------------------
+
+    def _offset(self, index):
+        return _HEADER.size + index * self._slot.size
+
+    def _find(self, mm, key):
+        """Slot index holding `key`, or None."""
+        slots = self._slots
+        index = int.from_bytes(key[8:16], 'little') % slots
+        for _ in range(slots):
+            state, slot_key = _SLOT_HEAD.unpack_from(mm, self._offset(index))
+            if state == _EMPTY:
+                return None
+            if state == _LIVE and slot_key == key:
+                return index
+            index = (index + 1) % slots
+        return None
+
+    def _probe_empty(self, mm, slots, key):
+        index = int.from_bytes(key[8:16], 'little') % slots
+        while mm[_HEADER.size + index * self._slot.size] == _LIVE:
+            index = (index + 1) % slots
+        return index
+
+    def _counts(self):
+        _, _, _, live, filled = _HEADER.unpack_from(self._mm)
+        return live, filled
+
+    def _set_counts(self, live, filled):
+        struct.pack_into('<QQ', self._mm, _HEADER.size - 16, live, filled)
+
+    # --- public API ------------------------------------------------------
+
+    def get(self, key):
+        with self._lock:
+            mm = self._current()
+            index = self._find(mm, key)
+            if index is None:
+                return None
+            return self._slot.unpack_from(mm, self._offset(index))[2:]
+
+    def put(self, key, value):
+        """Inserts or replaces the record for `key`."""
+        with self._locked():
+            mm = self._mm
+            index = self._find(mm, key)
+            if index is not None:
+                self._slot.pack_into(mm, self._offset(index), _LIVE, key, *value)
+                return
+            live, filled = self._counts()
+            if filled + 1 > self._slots * MAX_LOAD:
+                self._rebuild(extra=1)
+                mm = self._mm
+                live, filled = self._counts()
+            index = self._probe_empty(mm, self._slots, key)
+            if mm[self._offset(index)] == _EMPTY:
+                filled += 1
+            self._slot.pack_into(mm, self._offset(index), _LIVE, key, *value)
+            self._set_counts(live + 1, filled)
+
+    def update(self, key, value):
+        """Rewrites the record for `key` only if it exists; returns whether it did."""
+        with self._locked():
+            index = self._find(self._mm, key)
+            if index is None:
+                return False
+            self._slot.pack_into(self._mm, self._offset(index), _LIVE, key, *value)
+            return True
+
+    def delete(self, key):
+        with self._locked():
+            index = self._find(self._mm, key)
+            if index is None:
+                return False
+            self._mm[self._offset(index)] = _DELETED
+            live, filled = self._counts()
+            self._set_counts(live - 1, filled)
+            return True
+
+    def _live(self, mm):
+        return [
+            (record[1], record[2:])
+            for record in self._slot.iter_unpack(mm[_HEADER.size:_HEADER.size + self._slots * self._slot.size])
+            if record[0] == _LIVE
+        ]
+
+    def items(self):
+        """Snapshot of every (key, value) pair."""
+        with self._lock:
+            return self._live(self._current())
+
+    def __len__(self):
+        with self._lock:
+            self._current()
+            return self._counts()[0]
+
+    @contextmanager
+    def transaction(self):
+        """Holds the writer locks across several calls (they nest)."""
+        with self._locked():
+            yield self
+
+    def _rebuild(self, extra=0):
+        # Called with the writer locks held. Deleted slots are dropped; the
+        # table doubles only when live entries need the room
+        entries = self._live(self._mm)
+        slots = self._slots
+        while (len(entries) + extra) > slots * MAX_LOAD / 2:
+            slots *= 2
+        tmp_path = self.path + '.new'
+        self._create(tmp_path, slots, entries)
+        os.replace(tmp_path, self.path)
+        self._mm[_RETIRED_OFFSET] = 1
+        self._map()
+
+    def close(self):
+        with self._lock:
+            if self._mm is not None:
+                self._mm.close()
+                self._file.close()
+                self._mm = self._file = None
+            if self._lock_file is not None:
+                self._lock_file.close()
+                self._lock_file = self._lock_pid = None
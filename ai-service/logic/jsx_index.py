@@ -0,0 +1,296 @@
+import re
+
+# The component's JSX body: `return (` followed by an element
+RETURN_JSX_PATTERN = re.compile(r'\breturn\s*\(\s*<')
+TAG_NAME_PATTERN = re.compile(r'[A-Za-z_$][\w$.:-]*')
+ATTR_NAME_PATTERN = re.compile(r'[A-Za-z_$][\w$:.-]*')
+WHITESPACE_PATTERN = re.compile(r'\s*')
+
+# Characters that matter while skipping over JavaScript / JSX text
+JS_SPECIAL_PATTERN = re.compile(r'[\'"`/()\[\]{}<]')
+CHILDREN_SPECIAL_PATTERN = re.compile(r'[<{]')
+
+# A '<' after one of these (ignoring whitespace) starts JSX, not a comparison
+JSX_PRECEDERS = frozenset('(,=?:{[&|>')
+CLOSERS = {'(': ')', '[': ']', '{': '}'}
+
+
+def _run(routine):
+    """
+    Runs a parsing routine to completion and returns its result. A routine
+    yields the nested routine whose result it needs and is resumed with it.
+    """
+    stack = []
+    push, pop = stack.append, stack.pop
+    send = routine.send
+    value = None
+    while True:
+        try:
+            nested = send(value)
+        except StopIteration as done:
+            if not stack:
+                return done.value
+            send = pop()
+            value = done.value
+        else:
+            push(send)
+            send = nested.send
+            value = None
+
+
+class JSXElement:
+    """
+    One element of the parsed tree. Offsets index into the original code:
+    `start` is the '<', `open_end` is just past the opening tag,
+    `close_start` is the '</' of the closing tag (None when self-closing)
+    and `end` is just past the element.
+    """
+    __slots__ = ('name', 'start', 'open_end', 'close_start', 'end', 'attrs', 'parent', 'children')
+
+    def __init__(self, name, start, parent):
+        self.name = name
+        self.start = start
+        self.open_end = None
+        self.close_start = None
+        self.end = None
+        # name -> (value_start, value_end, is_string) or None for bare attributes
+        self.attrs = {}
+        self.parent = parent
+        self.children = []
+
+    @property
+    def self_closing(self):
+        return self.close_start is None
+
+    def __repr__(self):
+        return f"<JSXElement {self.name} {self.start}:{self.end}>"
+
+
+class JSXIndex:
+    """
+    Lightweight structural index of a generated component.
+    Parses the code once into a tree of element offsets (tag names,
+    attributes, children ranges) plus the root `return (...)` span, so
+    rewrites can anchor on real element boundaries and presence checks
+    are set lookups. Offsets stay valid for every edit recorded against
+    the same original code, so one index serves a whole chain of
+    modifications.
+    """
+    def __init__(self, code):
+        self.code = code
+        self.elements = []
+        self.tags = {}
+        self.string_attrs = {}
+        self.root = None
+        self.return_open = None
+        self.return_close = None
+
+        # Prefer the default-exported component when a file holds several
+        export_pos = code.find('export default')
+        match = RETURN_JSX_PATTERN.search(code, max(export_pos, 0))
+        if match is None and export_pos > 0:
+            match = RETURN_JSX_PATTERN.search(code)
+        if match:
+            self.return_open = code.index('(', match.start()) + 1
+            self.return_close = _run(self._scan_js(self.return_open, ')', None))
+            for element in self.elements:
+                if element.parent is None:
+                    self.root = element
+                    break
+
+    # --- Queries ---
+
+    def has(self, tag):
+        return tag in self.tags
+
+    def first(self, tag):
+        elements = self.tags.get(tag)
+        return elements[0] if elements else None
+
+    def has_attr(self, name, value):
+        return (name, value) in self.string_attrs
+
+    def attr_value(self, element, name):
+        span = element.attrs.get(name)
+        if span is None or not span[2]:
+            return None
+        return self.code[span[0]:span[1]]
+
+    def first_with_class_prefix(self, prefix):
+        """First element whose className string starts with `prefix`."""
+        for element in self.elements:
+            value = self.attr_value(element, 'className')
+            if value is not None and value.startswith(prefix):
+                return element
+        return None
+
+    def element_at(self, offset):
+        """Deepest element whose span contains `offset`."""
+        found = None
+        for element in self.elements:
+            if element.start > offset:
+                break
+            if element.end is not None and element.start <= offset < element.end:
+                found = element
+        return found
+
+    # --- Parsing ---
+
+    def _register(self, element):
+        self.elements.append(element)
+        self.tags.setdefault(element.name, []).append(element)
+        if element.parent is not None:
+            element.parent.children.append(element)
+        for name, span in element.attrs.items():
+            if span is not None and span[2]:
+                self.string_attrs.setdefault((name, self.code[span[0]:span[1]]), element)
+
+    def _starts_jsx(self, pos):
+        code = self.code
+        nxt = code[pos + 1:pos + 2]
+        if not (nxt.isalpha() or nxt == '>'):
+            return False
+        j = pos - 1
+        while j >= 0 and code[j].isspace():
+            j -= 1
+        if j < 0 or code[j] in JSX_PRECEDERS:
+            return True
+        return code.endswith('return', 0, j + 1)
+
+    # The parsing routines below are generators run by _run(): where one
+    # needs another's result it yields the nested routine instead of
+    # calling it, so nesting depth lives in a list, not on the call stack
+
+    def _scan_js(self, pos, closer, parent):
+        """
+        Skips JavaScript from `pos` up to the unmatched `closer`, indexing
+        any JSX found on the way. Returns the closer's offset.
+        """
+        code = self.code
+        length = len(code)
+        stack = []
+        while True:
+            match = JS_SPECIAL_PATTERN.search(code, pos)
+            if match is None:
+                return length
+            pos = match.start()
+            ch = code[pos]
+
+            if ch in '\'"':
+                end = code.find(ch, pos + 1)
+                while end != -1 and code[end - 1] == '\\':
+                    end = code.find(ch, end + 1)
+                pos = length if end == -1 else end + 1
+            elif ch == '`':
+                pos = yield self._skip_template_literal(pos + 1)
+            elif ch == '/':
+                nxt = code[pos + 1:pos + 2]
+                if nxt == '/':
+                    end = code.find('\n', pos)
+                    pos = length if end == -1 else end
+                elif nxt == '*':
+                    end = code.find('*/', pos + 2)
+                    pos = length if end == -1 else end + 2
+                else:
+                    pos += 1
+            elif ch in CLOSERS:
+                stack.append(CLOSERS[ch])
+                pos += 1
+            elif ch in ')]}':
+                if not stack:
+                    if ch == closer:
+                        return pos
+                    pos += 1
+                    continue
+                stack.pop()
+                pos += 1
+            elif self._starts_jsx(pos):
+                pos = yield self._parse_element(pos, parent)
+            else:
+                pos += 1
+
+    def _skip_template_literal(self, pos):
+        code = self.code
+        while pos < len(code):
+            ch = code[pos]
+            if ch == '\\':
+                pos += 2
+            elif ch == '`':
+                return pos + 1
+            elif ch == '$' and code.startswith('{', pos + 1):
+                pos = (yield self._scan_js(pos + 2, '}', None)) + 1
+            else:
+                pos += 1
+        return len(code)
+
+    def _parse_element(self, pos, parent):
+        code = self.code
+        length = len(code)
+        if code.startswith('<>', pos):
+            element = JSXElement('', pos, parent)
+            p = pos + 2
+        else:
+            match = TAG_NAME_PATTERN.match(code, pos + 1)
+            element = JSXElement(match.group(), pos, parent)
+            p = match.end()
+            # Attributes
+            while True:
+                p = WHITESPACE_PATTERN.match(code, p).end()
+                if p >= length:
+                    element.open_end = element.end = length
+                    self._register(element)
+                    return length
+                ch = code[p]
+                if ch == '/' and code.startswith('>', p + 1):
+                    element.open_end = element.end = p + 2
+                    self._register(element)
+                    return p + 2
+                if ch == '>':
+                    p += 1
+                    break
+                if ch == '{':
+                    p = (yield self._scan_js(p + 1, '}', element)) + 1
+                    continue
+                match = ATTR_NAME_PATTERN.match(code, p)
+                if match is None:
+                    p += 1
+                    continue
+                name = match.group()
+                p = WHITESPACE_PATTERN.match(code, match.end()).end()
+                if not code.startswith('=', p):
+                    element.attrs[name] = None
+                    continue
+                p = WHITESPACE_PATTERN.match(code, p + 1).end()
+                quote = code[p:p + 1]
+                if quote in ('"', "'"):
+                    end = code.find(quote, p + 1)
+                    end = length if end == -1 else end
+                    element.attrs[name] = (p + 1, end, True)
+                    p = end + 1
+                elif quote == '{':
+                    end = yield self._scan_js(p + 1, '}', element)
+                    element.attrs[name] = (p + 1, end, False)
+                    p = end + 1
+        element.open_end = p
+
+        # Register before the children so document order is preserved
+        self._register(element)
+        # Children, up to the closing tag
+        while True:
+            match = CHILDREN_SPECIAL_PATTERN.search(code, p)
+            if match is None:
+                p = length
+                break
+            p = match.start()
+            if code[p] == '{':
+                p = (yield self._scan_js(p + 1, '}', element)) + 1
+            elif code.startswith('</', p):
+                break
+            elif code[p + 1:p + 2].isalpha() or code.startswith('<>', p):
+                p = yield self._parse_element(p, element)
+            else:
+                p += 1
+        element.close_start = p
+        end = code.find('>', p)
+        element.end = length if end == -1 else end + 1
+        return element.end
@@ -0,0 +1,160 @@
+from bisect import bisect_left
+import threading
+from time import perf_counter_ns
+
+# Histogram bucket upper bounds, in nanoseconds (1us .. 1s)
+DEFAULT_BUCKETS_NS = (
+    1_000, 5_000, 10_000, 50_000, 100_000, 500_000,
+    1_000_000, 5_000_000, 10_000_000, 50_000_000, 100_000_000, 500_000_000,
+    1_000_000_000,
+)
+
+
+class StageHistograms:
+    """
+    Latency histograms keyed by (endpoint, stage, intent).
+    Every thread writes to its own shard, so recording an observation takes
+    no lock and never contends; a scrape sums the shards. Each series is a
+    list of per-bucket counts (the last slot is +Inf) followed by sum and count.
+    """
+    def __init__(self, name, help_text, buckets_ns=DEFAULT_BUCKETS_NS):
+        self.name = name
+        self.help_text = help_text
+        self.buckets_ns = tuple(buckets_ns)
+        self._local = threading.local()
+        self._shards = []
+        # Only taken when a thread creates its shard
+        self._shards_lock = threading.Lock()
+
+    def _shard(self):
+        shard = getattr(self._local, 'series', None)
+        if shard is None:
+            shard = self._local.series = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def observe(self, key, duration_ns):
+        shard = self._shard()
+        series = shard.get(key)
+        if series is None:
+            # bucket counts + [sum_ns, count]
+            series = shard[key] = [0] * (len(self.buckets_ns) + 3)
+        series[bisect_left(self.buckets_ns, duration_ns)] += 1
+        series[-2] += duration_ns
+        series[-1] += 1
+
+    def observe_many(self, observations):
+        """Records (key, duration_ns) pairs with a single shard lookup."""
+        shard = self._shard()
+        buckets = self.buckets_ns
+        for key, duration_ns in observations:
+            series = shard.get(key)
+            if series is None:
+                series = shard[key] = [0] * (len(buckets) + 3)
+            series[bisect_left(buckets, duration_ns)] += 1
+            series[-2] += duration_ns
+            series[-1] += 1
+
+    def collect(self):
+        """Merged {key: [bucket counts..., sum_ns, count]} across all threads."""
+        merged = {}
+        with self._shards_lock:
+            shards = list(self._shards)
+        for shard in shards:
+            for key, series in list(shard.items()):
+                total = merged.get(key)
+                if total is None:
+                    merged[key] = list(series)
+                else:
+                    for i, value in enumerate(series):
+                        total[i] += value
+        return merged
+
+    def render(self, label_names):
+        """Prometheus text exposition (durations in seconds, cumulative buckets)."""
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        bounds = [f"{bound / 1e9:g}" for bound in self.buckets_ns] + ["+Inf"]
+        for key, series in sorted(self.collect().items()):
+            labels = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(label_names, key))
+            cumulative = 0
+            for bound, count in zip(bounds, series):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{labels}}} {series[-2] / 1e9:.9f}")
+            lines.append(f"{self.name}_count{{{labels}}} {series[-1]}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class StageTimer:
+    """
+    Times consecutive stages of one request with perf_counter_ns.
+    lap() closes the current stage; finish() records every lap (labelled
+    with the intent, which is only known part-way through) plus the total.
+    """
+    __slots__ = ('endpoint', 'start', 'last', 'laps')
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.start = self.last = perf_counter_ns()
+        self.laps = []
+
+    def lap(self, stage):
+        now = perf_counter_ns()
+        self.laps.append((stage, now - self.last))
+        self.last = now
+
+    def finish(self, intent=''):
+        endpoint = self.endpoint
+        stage_histograms.observe_many(
+            ((endpoint, stage, intent), duration_ns) for stage, duration_ns in self.laps
+        )
+        request_histograms.observe((endpoint, intent), perf_counter_ns() - self.start)
+
+
+class NullTimer:
+    """Drop-in StageTimer that records nothing (METRICS_ENABLED=0)."""
+    __slots__ = ()
+
+    def __init__(self, endpoint=None):
+        pass
+
+    def lap(self, stage):
+        pass
+
+    def finish(self, intent=''):
+        pass
+
+
+NULL_TIMER = NullTimer()
+
+stage_histograms = StageHistograms(
+    'ryze_stage_duration_seconds',
+    'Time spent in each pipeline stage, by endpoint, stage and intent.',
+)
+request_histograms = StageHistograms(
+    'ryze_request_duration_seconds',
+    'Time spent handling a request, by endpoint and intent.',
+)
+
+
+def render_counter(name, help_text, label_name, values):
+    """Prometheus text exposition of a counter with one label; `values` maps label values to counts."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+    for label, value in values.items():
+        lines.append(f'{name}{{{label_name}="{_escape(label)}"}} {value}')
+    return "\n".join(lines) + "\n"
+
+
+def render_metrics():
+    return (
+        stage_histograms.render(('endpoint', 'stage', 'intent'))
+        + request_histograms.render(('endpoint', 'intent'))
+    )
@@ -1,84 +1,386 @@
 import math
 import re
 
+from .cache import LRUCache
+from .palette import TAILWIND_COLORS, nearest_color
+
+# Compiled once: strips everything except lowercase letters, digits and whitespace
+_NON_ALNUM = re.compile(r'[^a-z0-9\s]')
+
+# A brand is the text after a marker up to the next quote (or the end)
+_BRAND_VALUE = re.compile(r'\s+["\']?([^"\']+)["\']?')
+BRAND_MARKERS = ('called', 'named', 'brand')
+
+
+def _trie_pattern(words):
+    """
+    Prefix-factored alternation for `words` (e.g. b(?:l(?:ack|ue)|rand)).
+    Branches share their prefixes, so the regex engine's work per position
+    is bounded by word length rather than by vocabulary size.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        group = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{group})?' if '' in node else group
+
+    return build(trie)
+
+DEFAULT_INTENTS = {
+    'dashboard': [
+        "dashboard", "analytics", "admin", "charts", "graphs", "sidebar", "overview", "stats", "metrics", "panel", "console"
+    ],
+    'login': [
+        "login", "sign in", "signin", "authentication", "register", "signup", "password", "email", "auth", "account"
+    ],
+    'form': [
+        "form", "contact", "input", "message", "feedback", "submit", "survey", "questionnaire", "inputs"
+    ],
+    'landing': [
+        "landing", "home", "website", "hero", "marketing", "product", "features", "pricing", "showcase", "startup", "saas", "footer", "how it works", "get started", "sections"
+    ],
+    'portfolio': [
+        "portfolio", "resume", "cv", "personal", "profile", "projects", "work", "developer", "designer", "showcase"
+    ],
+    'ecommerce': [
+        "ecommerce", "shop", "store", "product", "cart", "buy", "sell", "checkout", "marketplace", "retail"
+    ],
+    'generic': [
+        "app", "site", "platform", "page", "section", "view", "component", "interface", "web app", "application"
+    ]
+}
+
 class IntentClassifier:
     """
-    Advanced Intent Classification using Bag-of-Words and Cosine Similarity (Simulated).
+    Keyword-overlap Intent Classification backed by an inverted index.
+    The index (n-gram -> intent ids) is built once at construction, so a
+    prediction only touches the intents that share a keyword with the prompt.
     """
-    def __init__(self):
+    def __init__(self, intents=None, fallback='generic'):
         # Define known intents and their associated keywords/training phrases
-        self.intents = {
-            'dashboard': [
-                "dashboard", "analytics", "admin", "charts", "graphs", "sidebar", "overview", "stats", "metrics", "panel", "console"
-            ],
-            'login': [
-                "login", "sign in", "signin", "authentication", "register", "signup", "password", "email", "auth", "account"
-            ],
-            'form': [
-                "form", "contact", "input", "message", "feedback", "submit", "survey", "questionnaire", "inputs"
-            ],
-            'landing': [
-                "landing", "home", "website", "hero", "marketing", "product", "features", "pricing", "showcase", "startup", "saas", "footer", "how it works", "get started", "sections"
-            ],
-            'portfolio': [
-                "portfolio", "resume", "cv", "personal", "profile", "projects", "work", "developer", "designer", "showcase"
-            ],
-            'ecommerce': [
-                "ecommerce", "shop", "store", "product", "cart", "buy", "sell", "checkout", "marketplace", "retail"
-            ],
-            'generic': [
-                "app", "site", "platform", "page", "section", "view", "component", "interface", "web app", "application"
-            ]
-        }
-        
+        self.intents = dict(DEFAULT_INTENTS if intents is None else intents)
+        self.fallback = fallback
+        self._build_index()
+
+    def _build_index(self):
+        # Intent ids follow declaration order, which is also the tie-break order
+        self.intent_names = tuple(self.intents)
+        postings = {}
+        max_ngram = 1
+        for intent_id, keywords in enumerate(self.intents.values()):
+            for keyword in keywords:
+                words = self._tokenize(keyword)
+                if not words:
+                    continue
+                max_ngram = max(max_ngram, len(words))
+                ids = postings.setdefault(" ".join(words), [])
+                if intent_id not in ids:
+                    ids.append(intent_id)
+        self.index = {gram: tuple(ids) for gram, ids in postings.items()}
+        self.max_ngram = max_ngram
+
     def _tokenize(self, text):
         # Simple tokenization: lowercase and remove non-alphanumeric
-        cleaned = re.sub(r'[^a-z0-9\s]', '', text.lower())
-        return set(cleaned.split())
+        return _NON_ALNUM.sub('', text.lower()).split()
+
+    def _matched_keywords(self, tokens):
+        # Every unigram..max_ngram window that appears in the index (each counted once)
+        matched = set()
+        index = self.index
+        for n in range(1, min(self.max_ngram, len(tokens)) + 1):
+            for i in range(len(tokens) - n + 1):
+                gram = tokens[i] if n == 1 else " ".join(tokens[i:i + n])
+                if gram in index:
+                    matched.add(gram)
+        return matched
 
-    def _calculate_overlap(self, tokens, keywords):
-        # Calculate Intersection over Union (IoU) or simple overlap count
-        keyword_set = set(keywords)
-        intersection = tokens.intersection(keyword_set)
-        return len(intersection)
+    def score(self, prompt):
+        """
+        Returns a sparse {intent_id: score} map. Only intents sharing at least
+        one keyword with the prompt are present.
+        """
+        return self.score_tokens(self._tokenize(prompt))
 
-    def predict(self, prompt):
-        tokens = self._tokenize(prompt)
+    def score_tokens(self, tokens):
+        """score() for a prompt that has already been tokenized."""
         scores = {}
-        
-        for intent, keywords in self.intents.items():
-            score = self._calculate_overlap(tokens, keywords)
-            scores[intent] = score
-        
-        # Get intent with max score
-        best_intent = max(scores, key=scores.get)
-        
-        if scores[best_intent] == 0:
-            return 'generic'
-            
-        return best_intent
+        index = self.index
+        for gram in self._matched_keywords(tokens):
+            for intent_id in index[gram]:
+                scores[intent_id] = scores.get(intent_id, 0) + 1
+        return scores
+
+    def rank(self, scores):
+        """
+        ((intent, score), ...) for a score() map, highest score first; ties
+        go to the intent declared first.
+        """
+        names = self.intent_names
+        if len(scores) < 2:
+            # Most prompts match a single intent: nothing to sort
+            return tuple((names[intent_id], score) for intent_id, score in scores.items())
+        # Sorting (-score, id) pairs keeps the key out of Python code
+        ranked = sorted([(-score, intent_id) for intent_id, score in scores.items()])
+        return tuple([(names[intent_id], -score) for score, intent_id in ranked])
+
+    def predict(self, prompt, ranked=False):
+        """
+        The best intent for `prompt`, or the fallback when no keyword
+        matches. With `ranked`, every matching intent with its score
+        instead, best first (empty when none match); see rank().
+        """
+        scores = self.score(prompt)
+        if ranked:
+            return self.rank(scores)
+        if not scores:
+            return self.fallback
+
+        # Highest score wins; ties go to the intent declared first
+        best_id = min(scores, key=lambda intent_id: (-scores[intent_id], intent_id))
+        return self.intent_names[best_id]
+
+class StyleEntities:
+    """Style attributes extracted from one prompt."""
+    __slots__ = ('color', 'brand')
+
+    def __init__(self, color, brand):
+        self.color = color
+        self.brand = brand
+
+    def __repr__(self):
+        return f"StyleEntities(color={self.color!r}, brand={self.brand!r})"
+
 
 class StyleExtractor:
     """
     Named Entity Recognition (NER) for style attributes.
+    Colors, brand markers and hex codes are matched by one compiled pattern
+    in a single scan; the color and marker vocabulary is compiled as a
+    prefix trie, so extraction stays O(len(prompt)) as the vocabulary grows,
+    and the scan stops once a color and a brand are found.
+
+    The color is the first one mentioned in the prompt ("red and blue" is
+    red); the original extractor took the first of its own color list that
+    appeared anywhere, which made blue win every tie. A hex code only
+    counts when no color is named, as its nearest palette color.
     """
-    def __init__(self):
-        self.colors = ['blue', 'red', 'green', 'purple', 'orange', 'gray', 'black']
-        
+    def __init__(self, colors=None, default_color='blue', default_brand='Ryze AI'):
+        # 'black' predates the full palette and is kept for existing prompts
+        self.colors = tuple(TAILWIND_COLORS + ('black',) if colors is None else (c.lower() for c in colors))
+        self.default_color = default_color
+        self.default_brand = default_brand
+        self.markers = frozenset(BRAND_MARKERS)
+
+        source = (
+            r'(?P<hex>#(?:[0-9a-f]{6}|[0-9a-f]{3})\b)'
+            r'|\b(?P<word>' + _trie_pattern(self.colors + BRAND_MARKERS) + r')\b'
+        )
+        # Runs over the lowercased prompt, which is cheaper than IGNORECASE
+        self.pattern = re.compile(source)
+        # For the rare prompt whose length lowercasing changes (e.g. 'İ'),
+        # where offsets into the lowercased copy would not line up
+        self.caseless_pattern = re.compile(source, re.IGNORECASE)
+
+    def extract(self, prompt, lowered=None):
+        """`lowered` may pass in prompt.lower() when the caller already has it."""
+        return StyleEntities(*self.scan(prompt, lowered))
+
+    def scan(self, prompt, lowered=None):
+        """extract() as a (color, brand) pair, for callers that unpack it anyway."""
+        color = hex_code = brand = None
+
+        # Brands keep their case: they are read from the original prompt at
+        # the offsets matched in the lowercased one
+        if lowered is None:
+            lowered = prompt.lower()
+        if len(lowered) == len(prompt):
+            matches = self.pattern.finditer(lowered)
+        else:
+            matches = self.caseless_pattern.finditer(prompt)
+
+        for match in matches:
+            word = match.group('word')
+            if word is not None:
+                word = word.lower()
+                if word in self.markers:
+                    if brand is None:
+                        # Everything after the marker up to a quote, as before
+                        brand_match = _BRAND_VALUE.match(prompt, match.end('word'))
+                        if brand_match:
+                            brand = brand_match.group(1)
+                elif color is None:
+                    color = word
+                if color is not None and brand is not None:
+                    # Nothing later in the prompt changes the result
+                    break
+            elif hex_code is None:
+                hex_code = match.group('hex').lower()
+
+        if color is None:
+            color = nearest_color(hex_code) if hex_code else self.default_color
+        return color, brand if brand is not None else self.default_brand
+
     def extract_brand_name(self, prompt):
-        # Heuristic: Find text after "called" or "named"
-        match = re.search(r'(?:called|named|brand)\s+["\']?([^"\']+)["\']?', prompt, re.IGNORECASE)
-        if match:
-            return match.group(1)
-        return "Ryze AI"
+        return self.extract(prompt).brand
 
     def extract_primary_color(self, prompt):
-        tokens = prompt.lower().split()
-        for color in self.colors:
-            if color in tokens:
-                return color
-        return 'blue' # Default
+        return self.extract(prompt).color
+
+# Page sections a prompt can ask /modify for. Each alternative is a phrase,
+# or a tuple of phrases that must all appear; matching is by substring
+COMPONENT_KEYWORDS = {
+    'navbar': ("navbar", "navigation"),
+    'hero': ("hero", "banner"),
+    'features': ("features", "benefits"),
+    'footer': ("footer",),
+    'testimonials': ("testimonials", "reviews"),
+    'full_app': ("full app", "complete website", "landing page"),
+    'sidebar': ("sidebar", "drawer"),
+    'chart': ("chart", "graph"),
+    'pricing': (("pricing", "section"),),
+}
+
+
+def requested_components(lowered):
+    """Names from COMPONENT_KEYWORDS mentioned in an already lowercased prompt."""
+    found = []
+    for name, alternatives in COMPONENT_KEYWORDS.items():
+        for phrase in alternatives:
+            if isinstance(phrase, str):
+                if phrase in lowered:
+                    break
+            elif all(part in lowered for part in phrase):
+                break
+        else:
+            continue
+        found.append(name)
+    return frozenset(found)
+
+
+class PromptAnalysis:
+    """
+    Everything the pipelines read from one prompt: intent, ranked intent
+    scores, style entities and requested components. Instances are shared
+    through the analysis cache, so they are immutable.
+    """
+    __slots__ = ('prompt', 'intent', 'scores', 'color', 'brand', 'components')
+
+    def __init__(self, prompt, intent, scores, color, brand, components):
+        set_field = object.__setattr__
+        set_field(self, 'prompt', prompt)
+        set_field(self, 'intent', intent)
+        # ((intent, score), ...) best first
+        set_field(self, 'scores', scores)
+        set_field(self, 'color', color)
+        set_field(self, 'brand', brand)
+        set_field(self, 'components', components)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"PromptAnalysis is immutable (cannot set {name!r})")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"PromptAnalysis is immutable (cannot delete {name!r})")
+
+    def __reduce__(self):
+        # Rebuilt field by field: the default restore would go through __setattr__
+        return (_restore_analysis, tuple(getattr(self, name) for name in PromptAnalysis.__slots__))
+
+    def to_dict(self):
+        """The fields as JSON-able values; from_dict() rebuilds the analysis."""
+        fields = {name: getattr(self, name) for name in PromptAnalysis.__slots__}
+        fields['scores'] = [list(pair) for pair in self.scores]
+        fields['components'] = sorted(self.components)
+        return fields
+
+    @classmethod
+    def from_dict(cls, fields):
+        """
+        Rebuilds an analysis from to_dict() output (e.g. read back from a
+        shared cache); raises ValueError for anything else.
+        """
+        try:
+            values = [fields[name] for name in cls.__slots__]
+            scores = tuple((intent, score) for intent, score in fields['scores'])
+            components = frozenset(fields['components'])
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Not a PromptAnalysis: {e}") from None
+        texts = [fields[name] for name in ('prompt', 'intent', 'color', 'brand')]
+        if (not all(isinstance(text, str) for text in texts)
+                or not all(isinstance(intent, str) and isinstance(score, (int, float)) for intent, score in scores)
+                or not all(isinstance(name, str) for name in components)):
+            raise ValueError("Not a PromptAnalysis: unexpected field types")
+        values[cls.__slots__.index('scores')] = scores
+        values[cls.__slots__.index('components')] = components
+        return _restore_analysis(*values)
+
+    def __repr__(self):
+        return (f"PromptAnalysis(intent={self.intent!r}, color={self.color!r}, brand={self.brand!r}, "
+                f"components={sorted(self.components)!r})")
+
+
+def _restore_analysis(*values):
+    analysis = object.__new__(PromptAnalysis)
+    for name, value in zip(PromptAnalysis.__slots__, values):
+        object.__setattr__(analysis, name, value)
+    return analysis
+
+
+class PromptAnalyzer:
+    """
+    Analysis stage: the classifier, style extractor and component matcher
+    run over one normalized, lowercased copy of the prompt. Uncached, that
+    costs slightly more than the three separate passes did; the saving is the memo,
+    keyed by the normalized prompt, which real traffic mostly hits.
+    """
+    def __init__(self, classifier, style_extractor, max_entries=4096, max_bytes=4 * 1024 * 1024):
+        self.classifier = classifier
+        self.style_extractor = style_extractor
+        self.cache = LRUCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            sizeof=lambda analysis: len(analysis.prompt),
+        )
+
+    def analyze(self, prompt):
+        # Runs of whitespace are insignificant (they only ever padded brand names)
+        normalized = " ".join(prompt.split())
+        analysis = self.cache.get(normalized)
+        if analysis is None:
+            analysis = self._analyze(normalized)
+            self.cache.set(normalized, analysis)
+        return analysis
+
+    def _analyze(self, normalized):
+        classifier = self.classifier
+        lowered = normalized.lower()
+
+        ranked = classifier.rank(classifier.score_tokens(_NON_ALNUM.sub('', lowered).split()))
+        color, brand = self.style_extractor.scan(normalized, lowered)
+
+        return PromptAnalysis(
+            normalized,
+            ranked[0][0] if ranked else classifier.fallback,
+            ranked,
+            color,
+            brand,
+            requested_components(lowered),
+        )
+
 
 # Singleton instance
 classifier = IntentClassifier()
 style_extractor = StyleExtractor()
+prompt_analyzer = PromptAnalyzer(classifier, style_extractor)
+
+
+def analyze(prompt):
+    """Shared PromptAnalysis for `prompt` (see PromptAnalyzer)."""
+    return prompt_analyzer.analyze(prompt)
@@ -0,0 +1,144 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .rewrite_engine import apply_modifications, plan_modifications
+
+# Slices each worker gets of a mapped job: more than one, so a slow slice
+# does not hold up the rest and a stream starts after the first one
+SLICES_PER_WORKER = 4
+
+
+def modify_job(code, prompt, color, brand, components, edits=False):
+    """
+    The /modify rewrite, run in a pool worker. Returns (modified_code,
+    high_level_plan, explanation_steps), plus the edit script against
+    `code` when `edits` is set (session mode).
+    """
+    if not edits:
+        return apply_modifications(code, prompt, color, brand, components=components)
+    doc, high_level_plan, explanation_steps = plan_modifications(code, prompt, color, brand, components=components)
+    return doc.render(), high_level_plan, explanation_steps, doc.edit_script()
+
+
+def _start_method():
+    # Request threads are running when the pool starts, so forking the
+    # serving process itself is unsafe; forkserver children fork from a
+    # clean single-threaded server instead
+    return 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+
+class ProcessOffloader:
+    """
+    A pool of worker processes for CPU-bound jobs too large to run on a
+    request thread: rewrites of code with at least `min_chars` characters
+    and batches of at least `batch_min` prompts. Smaller requests (and
+    every request when `workers` is 0) stay inline.
+
+    Jobs are plain functions referenced by name plus compact arguments
+    (prompts, code, entities); workers import the modules they need once
+    and keep their own caches, so no template table or cache crosses the
+    process boundary. `preload` names modules the fork server imports up
+    front, so new workers start with them loaded.
+
+    The pool is created on first use in each process (pools do not survive
+    fork, so a pid check, not a flag) and replaced if a worker dies.
+    """
+    def __init__(self, workers=0, min_chars=256 * 1024, batch_min=512, preload=()):
+        self.workers = workers
+        self.min_chars = min_chars
+        self.batch_min = batch_min
+        self.preload = list(preload)
+        self._pool = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self.jobs = 0
+        self.slices = 0
+        self.restarts = 0
+
+    @property
+    def enabled(self):
+        return self.workers > 0
+
+    def offloads_code(self, code):
+        return self.enabled and isinstance(code, str) and len(code) >= self.min_chars
+
+    def offloads_batch(self, count):
+        return self.enabled and count >= self.batch_min
+
+    def pool(self):
+        """This process's executor, created on first call."""
+        if self._pid == os.getpid():
+            return self._pool
+        with self._lock:
+            if self._pid != os.getpid():
+                context = multiprocessing.get_context(_start_method())
+                if self.preload and context.get_start_method() == 'forkserver':
+                    context.set_forkserver_preload(self.preload)
+                # An executor inherited across fork belongs to the parent: leave it alone
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+                self._pid = os.getpid()
+        return self._pool
+
+    def ensure_started(self):
+        """Starts every worker now instead of on the first large request."""
+        if not self.enabled:
+            return
+        pool = self.pool()
+        for future in [pool.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+
+    def _broken(self, pool):
+        # A worker died (e.g. OOM-killed); the next job gets a fresh pool
+        with self._lock:
+            if self._pool is pool:
+                self._pid = None
+                self.restarts += 1
+        pool.shutdown(wait=False)
+
+    def call(self, fn, *args):
+        """Runs fn(*args) in a worker and returns its result."""
+        pool = self.pool()
+        self.jobs += 1
+        try:
+            return pool.submit(fn, *args).result()
+        except BrokenProcessPool:
+            self._broken(pool)
+            raise
+
+    def map(self, fn, items, *args):
+        """
+        Splits the list `items` into contiguous slices across the workers
+        and runs fn(slice, offset, *args) for each, where offset is the
+        slice's start in `items`. Yields the results in slice order, each
+        as soon as it and the slices before it are done.
+        """
+        pool = self.pool()
+        size = max(1, -(-len(items) // (self.workers * SLICES_PER_WORKER)))
+        self.jobs += 1
+        futures = [pool.submit(fn, items[offset:offset + size], offset, *args)
+                   for offset in range(0, len(items), size)]
+        self.slices += len(futures)
+        try:
+            for future in futures:
+                yield future.result()
+        except BrokenProcessPool:
+            self._broken(pool)
+            raise
+        finally:
+            # Slices nobody will read (client gone, earlier slice failed)
+            for future in futures:
+                future.cancel()
+
+    def stats(self):
+        return {
+            "workers": self.workers,
+            "running": self._pid == os.getpid(),
+            "min_chars": self.min_chars,
+            "batch_min": self.batch_min,
+            "jobs": self.jobs,
+            "slices": self.slices,
+            "restarts": self.restarts,
+        }
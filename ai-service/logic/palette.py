@@ -0,0 +1,39 @@
+from functools import lru_cache
+
+# Full Tailwind color palette, shared by the style extractor and the color swapper
+TAILWIND_COLORS = (
+    'slate', 'gray', 'zinc', 'neutral', 'stone',
+    'red', 'orange', 'amber', 'yellow', 'lime', 'green', 'emerald', 'teal',
+    'cyan', 'sky', 'blue', 'indigo', 'violet', 'purple', 'fuchsia', 'pink', 'rose'
+)
+
+TAILWIND_SHADES = ('50', '100', '200', '300', '400', '500', '600', '700', '800', '900', '950')
+
+# The 500 shade of each color, used to map hex codes onto the nearest palette color
+PALETTE_RGB = {
+    'slate': (0x64, 0x74, 0x8b), 'gray': (0x6b, 0x72, 0x80), 'zinc': (0x71, 0x71, 0x7a),
+    'neutral': (0x73, 0x73, 0x73), 'stone': (0x78, 0x71, 0x6c), 'red': (0xef, 0x44, 0x44),
+    'orange': (0xf9, 0x73, 0x16), 'amber': (0xf5, 0x9e, 0x0b), 'yellow': (0xea, 0xb3, 0x08),
+    'lime': (0x84, 0xcc, 0x16), 'green': (0x22, 0xc5, 0x5e), 'emerald': (0x10, 0xb9, 0x81),
+    'teal': (0x14, 0xb8, 0xa6), 'cyan': (0x06, 0xb6, 0xd4), 'sky': (0x0e, 0xa5, 0xe9),
+    'blue': (0x3b, 0x82, 0xf6), 'indigo': (0x63, 0x66, 0xf1), 'violet': (0x8b, 0x5c, 0xf6),
+    'purple': (0xa8, 0x55, 0xf7), 'fuchsia': (0xd9, 0x46, 0xef), 'pink': (0xec, 0x48, 0x99),
+    'rose': (0xf4, 0x3f, 0x5e),
+}
+
+
+@lru_cache(maxsize=1024)
+def nearest_color(hex_code):
+    """Palette color closest (in RGB) to a '#rgb' or '#rrggbb' code."""
+    digits = hex_code.lstrip('#')
+    if len(digits) == 3:
+        digits = ''.join(ch * 2 for ch in digits)
+    r, g, b = int(digits[0:2], 16), int(digits[2:4], 16), int(digits[4:6], 16)
+    return min(
+        PALETTE_RGB,
+        key=lambda name: (
+            (PALETTE_RGB[name][0] - r) ** 2
+            + (PALETTE_RGB[name][1] - g) ** 2
+            + (PALETTE_RGB[name][2] - b) ** 2
+        ),
+    )
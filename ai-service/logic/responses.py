@@ -0,0 +1,212 @@
+import hashlib
+import json
+import struct
+import zlib
+
+# Fixed gzip member header: deflate, no name, mtime 0, unknown OS
+_GZIP_HEADER = b'\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff'
+_CODE_KEY = b'{"code":'
+
+
+def _deflate(data, level, final):
+    # Raw deflate; a full flush leaves the output byte-aligned and
+    # independent of what follows, so it can be spliced before a new stream
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush(zlib.Z_FINISH if final else zlib.Z_FULL_FLUSH)
+
+
+def _gzip(body, level):
+    return _GZIP_HEADER + _deflate(body, level, final=True) + struct.pack(
+        '<II', zlib.crc32(body), len(body) & 0xffffffff
+    )
+
+
+class EncodedCode(str):
+    """
+    Rendered code that carries its own JSON encoding and ETag, computed once
+    when it enters the render cache. Everywhere else it is a plain str;
+    encode_payload() splices the stored bytes instead of re-escaping the code.
+    With a `compress_level`, the start of the JSON body ('{"code":...') is
+    also stored deflated, so a gzip response only compresses its small tail.
+    """
+    def __new__(cls, code, compress_level=None):
+        self = super().__new__(cls, code)
+        self.json = json.dumps(code).encode('utf-8')
+        # Weak: the code is the same, the plan and timings around it are not
+        self.etag = 'W/"' + hashlib.blake2b(code.encode('utf-8'), digest_size=12).hexdigest() + '"'
+        self.compress_level = compress_level
+        self.deflated = None
+        if compress_level:
+            head = _CODE_KEY + self.json
+            self.deflated = _deflate(head, compress_level, final=False)
+            self.head_crc = zlib.crc32(head)
+            self.head_size = len(head)
+        return self
+
+    def __reduce__(self):
+        # The stored encodings travel along (e.g. back from a worker
+        # process), so unpickling does not encode the code again
+        return (_restore_encoded, (str(self), self.__dict__))
+
+    def size(self):
+        """Bytes held beyond the code itself."""
+        return len(self.json) + (len(self.deflated) if self.deflated is not None else 0)
+
+    def pack(self):
+        """The code and its encodings as bytes; unpack() rebuilds them."""
+        code = str(self).encode('utf-8')
+        etag = self.etag.encode('ascii')
+        deflated = self.deflated or b''
+        header = _PACKED.pack(
+            self.compress_level if self.compress_level is not None else _NO_LEVEL,
+            self.deflated is not None,
+            getattr(self, 'head_crc', 0), getattr(self, 'head_size', 0),
+            len(code), len(self.json), len(etag), len(deflated),
+        )
+        return b''.join((header, code, self.json, etag, deflated))
+
+    @classmethod
+    def unpack(cls, data):
+        """
+        Rebuilds pack() output (any bytes-like object) without encoding the
+        code again; raises ValueError for anything else.
+        """
+        try:
+            level, has_deflated, head_crc, head_size, *lengths = _PACKED.unpack_from(data)
+        except struct.error as e:
+            raise ValueError(f"Not a packed EncodedCode: {e}") from None
+        if _PACKED.size + sum(lengths) != len(data):
+            raise ValueError("Not a packed EncodedCode: lengths do not add up")
+        fields = []
+        start = _PACKED.size
+        for length in lengths:
+            fields.append(bytes(data[start:start + length]))
+            start += length
+        code, encoded, etag, deflated = fields
+        self = str.__new__(cls, code.decode('utf-8'))
+        self.json = encoded
+        self.etag = etag.decode('ascii')
+        self.compress_level = level if level != _NO_LEVEL else None
+        self.deflated = deflated if has_deflated else None
+        if self.compress_level:
+            self.head_crc = head_crc
+            self.head_size = head_size
+        return self
+
+
+# pack() header: compress level, has deflated head, head crc, head size,
+# then the lengths of the code, its JSON, the ETag and the deflated head
+_PACKED = struct.Struct('<b?IIIIII')
+_NO_LEVEL = -128
+
+
+def _restore_encoded(code, state):
+    self = str.__new__(EncodedCode, code)
+    self.__dict__.update(state)
+    return self
+
+
+def _encode(value):
+    # Same output as Flask's jsonify (compact, sorted keys, ASCII-only)
+    return json.dumps(value, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+
+def _tail(payload):
+    # Everything after the code value. Keys are sorted, and no response
+    # field sorts before "code"
+    rest = _encode({key: value for key, value in payload.items() if key != "code"})
+    return (b'}' if len(rest) == 2 else b',' + rest[1:]) + b"\n"
+
+
+def encode_payload(payload):
+    """
+    JSON body for a response payload, byte-for-byte what jsonify would
+    produce. When payload["code"] is an EncodedCode its cached encoding is
+    used, so only the small fields around it are serialized.
+    """
+    code = payload.get("code")
+    if not isinstance(code, EncodedCode):
+        return _encode(payload) + b"\n"
+    return _CODE_KEY + code.json + _tail(payload)
+
+
+def gzip_payload(payload, level):
+    """
+    encode_payload() as a gzip member. An EncodedCode with a stored deflated
+    head is spliced in, so only the fields after the code are compressed.
+    """
+    code = payload.get("code")
+    if not isinstance(code, EncodedCode) or code.deflated is None:
+        return _gzip(encode_payload(payload), level)
+    tail = _tail(payload)
+    return _GZIP_HEADER + code.deflated + _deflate(tail, level, final=True) + struct.pack(
+        '<II', zlib.crc32(tail, code.head_crc), (code.head_size + len(tail)) & 0xffffffff
+    )
+
+
+def accepts_gzip(accept_encoding):
+    """True when an Accept-Encoding header allows gzip (q > 0)."""
+    if not accept_encoding:
+        return False
+    allowed = None
+    for item in accept_encoding.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        if coding not in ('gzip', '*'):
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding == 'gzip':
+            return quality > 0
+        allowed = quality > 0
+    return bool(allowed)
+
+
+def compress_body(body, accept_encoding, level, min_bytes):
+    """encode_response() for a body that is already encoded."""
+    if level and len(body) >= min_bytes and accepts_gzip(accept_encoding):
+        return _gzip(body, level), 'gzip'
+    return body, None
+
+
+def encode_response(payload, accept_encoding, level, min_bytes):
+    """
+    Negotiated response body: returns (body, content_encoding), where the
+    encoding is 'gzip' or None. Bodies under `min_bytes` (and every body
+    when `level` is 0) are sent as is.
+    """
+    if level and accepts_gzip(accept_encoding):
+        code = payload.get("code")
+        if isinstance(code, EncodedCode):
+            # The code alone decides: the fields around it are small
+            if len(code.json) >= min_bytes:
+                return gzip_payload(payload, level), 'gzip'
+        else:
+            return compress_body(encode_payload(payload), accept_encoding, level, min_bytes)
+    return encode_payload(payload), None
+
+
+def etag_matches(if_none_match, etag, wildcard=True):
+    """
+    If-None-Match check with weak comparison (RFC 9110 13.1.2). Without
+    `wildcard`, "*" matches nothing: for a POST every response has a
+    representation, so "*" would always answer 304.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return wildcard
+    opaque = etag[2:] if etag.startswith('W/') else etag
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
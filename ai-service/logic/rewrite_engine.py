@@ -0,0 +1,458 @@
+import bisect
+import re
+
+from .jsx_index import JSXIndex
+from .metrics import NULL_TIMER
+from .nlp_engine import requested_components
+from .palette import TAILWIND_COLORS
+from .sections import section_registry
+
+# Full Tailwind palette understood by the color swapper
+KNOWN_COLORS = TAILWIND_COLORS
+
+# Utility prefixes whose color token gets swapped (e.g. bg-blue-500, from-indigo-600)
+COLOR_PREFIXES = frozenset(['bg', 'text', 'border', 'ring', 'from', 'to', 'via', 'shadow', 'decoration'])
+
+# Compiled at import. Color classes are matched from their '-color-shade'
+# tail so every match starts with a literal '-', which lets the regex engine
+# skip ahead in C; the utility prefix is validated by looking backwards.
+COLOR_CLASS_PATTERN = re.compile(r'-(' + '|'.join(KNOWN_COLORS) + r')-\d+\b')
+BRAND_ATTR_PATTERN = re.compile(r'brand="[^"]+"')
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == '_'
+
+
+def _inside_any(pos, spans):
+    # spans are sorted and non-overlapping
+    k = bisect.bisect_right(spans, (pos, float('inf'))) - 1
+    return k >= 0 and spans[k][0] <= pos < spans[k][1]
+
+
+class AnchorIndex:
+    """
+    Anchor offsets for one piece of code. Color-class and brand spans come
+    from a single pass each; literal anchors ('return (', '</main>', ...) are
+    located lazily with str.find and memoized, so each anchor is searched
+    for at most once per request no matter how many heuristics consult it.
+    """
+    __slots__ = ('code', 'colors', 'brands', '_first')
+
+    def __init__(self, code):
+        self.code = code
+        self._first = {}
+
+        # (name_start, name_end) of every color token inside a utility class
+        colors = []
+        for match in COLOR_CLASS_PATTERN.finditer(code):
+            start = match.start()
+            j = start
+            while j > 0 and code[j - 1].isalpha():
+                j -= 1
+            # \b(bg|text|...) right before the '-'
+            if code[j:start] in COLOR_PREFIXES and (j == 0 or not _is_word_char(code[j - 1])):
+                colors.append(match.span(1))
+        self.colors = colors
+
+        # (start, end) of every brand="..." attribute
+        brands = []
+        pos = code.find('brand="')
+        while pos != -1:
+            match = BRAND_ATTR_PATTERN.match(code, pos)
+            if match:
+                brands.append(match.span())
+                pos = code.find('brand="', match.end())
+            else:
+                pos = code.find('brand="', pos + 1)
+        self.brands = brands
+
+    def first(self, literal):
+        pos = self._first.get(literal)
+        if pos is None:
+            pos = self._first[literal] = self.code.find(literal)
+        return pos
+
+
+class Piece:
+    """A run of inserted text, rendered in front of the original `offset`."""
+    __slots__ = ('offset', 'text')
+
+    def __init__(self, offset, text):
+        self.offset = offset
+        self.text = text
+
+
+class SpliceBuffer:
+    """
+    Edits recorded against the original code's offsets and applied in a
+    single join by render(). Insertions are Pieces kept in order per
+    offset; replacements swap out original spans. No intermediate copy
+    of the code is ever built.
+    """
+    def __init__(self, code, index):
+        self.code = code
+        self.index = index
+        self.end = len(code)
+        # offset -> [Piece, ...] in render order
+        self.insertions = {}
+        self._insertion_offsets = []
+        # Sorted, non-overlapping (start, end, text); only spans whose text changed
+        self.replacements = []
+        self._replacement_starts = []
+        # Replacement text that should be visible to contains() (e.g. brand names)
+        self.searchable = []
+
+    # --- Recording edits ---
+
+    def replace_spans(self, spans):
+        """Records (start, end, text) rewrites of original, non-overlapping spans."""
+        self.replacements = sorted(spans)
+        self._replacement_starts = [start for start, _, _ in self.replacements]
+
+    def _pieces(self, offset):
+        pieces = self.insertions.get(offset)
+        if pieces is None:
+            pieces = self.insertions[offset] = []
+            bisect.insort(self._insertion_offsets, offset)
+        return pieces
+
+    def insert(self, offset, text, after_anchor=False):
+        """
+        Inserts `text` at an original offset. By default it lands after any
+        text already inserted there, right before the original character;
+        with `after_anchor` it lands right after whatever ends at `offset`.
+        """
+        piece = Piece(offset, text)
+        pieces = self._pieces(offset)
+        if after_anchor:
+            pieces.insert(0, piece)
+        else:
+            pieces.append(piece)
+        return piece
+
+    def insert_after_piece(self, piece, text):
+        pieces = self.insertions[piece.offset]
+        new_piece = Piece(piece.offset, text)
+        pieces.insert(pieces.index(piece) + 1, new_piece)
+        return new_piece
+
+    def insert_before_piece(self, piece, text):
+        pieces = self.insertions[piece.offset]
+        new_piece = Piece(piece.offset, text)
+        pieces.insert(pieces.index(piece), new_piece)
+        return new_piece
+
+    def append(self, text):
+        return self.insert(self.end, text)
+
+    def rstrip(self):
+        """Strips trailing whitespace (used before appending at the very end)."""
+        while True:
+            pieces = self.insertions.get(self.end, [])
+            while pieces:
+                stripped = pieces[-1].text.rstrip()
+                if stripped:
+                    pieces[-1].text = stripped
+                    return
+                pieces.pop()
+            k = bisect.bisect_right(self._replacement_starts, self.end - 1) - 1
+            if k >= 0 and self.replacements[k][1] >= self.end:
+                return
+            if self.end > 0 and self.code[self.end - 1].isspace():
+                self.end -= 1
+                continue
+            return
+
+    # --- Lookups ---
+
+    def _is_intact(self, start, end):
+        # An anchor overlapping a rewritten span, or split by inserted text,
+        # no longer exists as written
+        k = bisect.bisect_right(self._replacement_starts, end - 1) - 1
+        if k >= 0 and self.replacements[k][1] > start:
+            return False
+        k = bisect.bisect_right(self._insertion_offsets, start)
+        return k == len(self._insertion_offsets) or self._insertion_offsets[k] >= end
+
+    def contains(self, literal):
+        pos = self.index.first(literal)
+        while pos != -1 and pos + len(literal) <= self.end:
+            if self._is_intact(pos, pos + len(literal)):
+                return True
+            pos = self.code.find(literal, pos + 1)
+        for pieces in self.insertions.values():
+            if literal in "".join(piece.text for piece in pieces):
+                return True
+        return any(literal in text for text in self.searchable)
+
+    # --- Output ---
+
+    def render(self):
+        code = self.code
+        parts = []
+        last = 0
+        insertions = self.insertions
+        offsets = iter(self._insertion_offsets)
+        next_offset = next(offsets, None)
+
+        for start, end, text in self.replacements:
+            if start >= self.end:
+                break
+            while next_offset is not None and next_offset <= start:
+                parts.append(code[last:next_offset])
+                parts.extend(piece.text for piece in insertions[next_offset])
+                last = next_offset
+                next_offset = next(offsets, None)
+            parts.append(code[last:start])
+            parts.append(text)
+            last = end
+
+        while next_offset is not None and next_offset <= self.end:
+            parts.append(code[last:next_offset])
+            parts.extend(piece.text for piece in insertions[next_offset])
+            last = next_offset
+            next_offset = next(offsets, None)
+        parts.append(code[last:self.end])
+        return "".join(parts)
+
+    def edit_script(self):
+        """
+        The recorded edits as [offset, delete, insert] ops against the
+        original code, in ascending offset order and never overlapping.
+        Adjacent edits are merged; apply back to front to keep offsets valid.
+        """
+        ops = []
+
+        def emit(offset, delete, text):
+            if ops and ops[-1][0] + ops[-1][1] == offset:
+                ops[-1][1] += delete
+                ops[-1][2] += text
+            else:
+                ops.append([offset, delete, text])
+
+        insertions = self.insertions
+        offsets = iter(self._insertion_offsets)
+        next_offset = next(offsets, None)
+
+        for start, end, text in self.replacements:
+            if start >= self.end:
+                break
+            while next_offset is not None and next_offset <= start:
+                emit(next_offset, 0, "".join(piece.text for piece in insertions[next_offset]))
+                next_offset = next(offsets, None)
+            emit(start, end - start, text)
+
+        while next_offset is not None and next_offset <= self.end:
+            emit(next_offset, 0, "".join(piece.text for piece in insertions[next_offset]))
+            next_offset = next(offsets, None)
+        if self.end < len(self.code):
+            emit(self.end, len(self.code) - self.end, "")
+        return [op for op in ops if op[1] or op[2]]
+
+
+class PageEditor:
+    """
+    Structural placement on top of a SpliceBuffer. Anchors such as "after
+    the Navbar" or "last child of the page" resolve against the JSXIndex
+    for elements of the original code, and against Pieces for sections
+    inserted earlier in the same request.
+    """
+    def __init__(self, doc, jsx=None):
+        self.doc = doc
+        self._jsx = jsx
+        # tag or section name -> Piece inserted during this request
+        self.placed = {}
+        self.wrapper_open = None
+        self.wrapper_close = None
+
+    @property
+    def jsx(self):
+        # Built on first structural lookup; color-only edits never parse
+        if self._jsx is None:
+            self._jsx = JSXIndex(self.doc.code)
+        return self._jsx
+
+    def has_tag(self, tag):
+        return tag in self.placed or self.jsx.has(tag)
+
+    def wrap_root(self, opening, closing="</div>\n"):
+        """Wraps the component's returned JSX in a new container element."""
+        jsx = self.jsx
+        if jsx.return_open is None:
+            return False
+        self.wrapper_open = self.doc.insert(jsx.return_open, opening, after_anchor=True)
+        self.wrapper_close = self.doc.insert(jsx.return_close, closing)
+        return True
+
+    def insert_wrapped(self, opening, text):
+        """Wraps the returned JSX in `opening` and inserts `text` as its first child."""
+        if not self.wrap_root(opening):
+            return None
+        return self.doc.insert_after_piece(self.wrapper_open, text)
+
+    def insert_after(self, key, text):
+        piece = self.placed.get(key)
+        if piece is not None:
+            return self.doc.insert_after_piece(piece, text)
+        element = self.jsx.first(key)
+        if element is not None:
+            return self.doc.insert(element.end, text, after_anchor=True)
+        return None
+
+    def insert_after_element(self, element, text):
+        return self.doc.insert(element.end, text, after_anchor=True)
+
+    def insert_after_placed(self, key, text):
+        """Inserts `text` after a section placed earlier in this request."""
+        piece = self.placed.get(key)
+        if piece is None:
+            return None
+        return self.doc.insert_after_piece(piece, text)
+
+    def insert_after_section(self, marker, text):
+        """Inserts `text` after the top-level page section containing `marker`."""
+        element = self.section_containing(marker)
+        if element is None:
+            return None
+        return self.insert_after_element(element, text)
+
+    def insert_before(self, key, text):
+        piece = self.placed.get(key)
+        if piece is not None:
+            return self.doc.insert_before_piece(piece, text)
+        element = self.jsx.first(key)
+        if element is not None:
+            return self.doc.insert(element.start, text)
+        return None
+
+    def insert_before_close(self, tag, text):
+        """Appends `text` as the last child of the first <tag> element."""
+        element = self.jsx.first(tag)
+        if element is None or element.self_closing:
+            return None
+        return self.doc.insert(element.close_start, text)
+
+    def prepend_child(self, text):
+        """Inserts `text` as the first child of the page container."""
+        if self.wrapper_open is not None:
+            return self.doc.insert_after_piece(self.wrapper_open, text)
+        root = self.jsx.root
+        if root is None or root.self_closing:
+            return None
+        return self.doc.insert(root.open_end, text, after_anchor=True)
+
+    def append_child(self, text):
+        """Inserts `text` as the last child of the page container."""
+        if self.wrapper_close is not None:
+            return self.doc.insert_before_piece(self.wrapper_close, text)
+        root = self.jsx.root
+        if root is None or root.self_closing:
+            return None
+        return self.doc.insert(root.close_start, text)
+
+    def append_to_end(self, text):
+        """Appends `text` after the last non-whitespace character of the code."""
+        self.doc.rstrip()
+        return self.doc.append(text)
+
+    def prepend_to_wrapper_row(self, text):
+        """First child of the wrapper added in this request, switched to a flex row."""
+        if self.wrapper_open is None:
+            return None
+        self.wrapper_open.text = self.wrapper_open.text.replace('className="min-h-screen', 'className="min-h-screen flex', 1)
+        return self.doc.insert_after_piece(self.wrapper_open, text)
+
+    def prepend_to_page_row(self, text):
+        """First child of the page's min-h-screen container, switched to a flex row."""
+        container = self.jsx.first_with_class_prefix("min-h-screen")
+        if container is None or container.self_closing:
+            return None
+        class_start = container.attrs["className"][0]
+        self.doc.insert(class_start + len("min-h-screen"), " flex", after_anchor=True)
+        return self.doc.insert(container.open_end, text, after_anchor=True)
+
+    def section_containing(self, text):
+        """The top-level page section (a child of the root) containing `text`."""
+        pos = self.doc.index.first(text)
+        if pos == -1:
+            return None
+        jsx = self.jsx
+        element = jsx.element_at(pos)
+        while element is not None and element.parent is not None and element.parent is not jsx.root:
+            element = element.parent
+        if element is None or element is jsx.root:
+            return None
+        return element
+
+
+def apply_modifications(current_code, prompt, new_color, new_brand, jsx=None, timer=NULL_TIMER, components=None):
+    """
+    Applies every modify_ui heuristic to `current_code` and returns
+    (modified_code, high_level_plan, explanation_steps). Edits are anchored
+    on the structural JSXIndex (built on demand, or passed in to reuse one)
+    and applied in a single splice.
+    """
+    doc, high_level_plan, explanation_steps = plan_modifications(
+        current_code, prompt, new_color, new_brand, jsx, timer, components
+    )
+    modified_code = doc.render()
+    timer.lap("render")
+    return modified_code, high_level_plan, explanation_steps
+
+
+def plan_modifications(current_code, prompt, new_color, new_brand, jsx=None, timer=NULL_TIMER, components=None):
+    """
+    Records every modify_ui heuristic against `current_code` without
+    applying it. Returns (SpliceBuffer, high_level_plan, explanation_steps);
+    the buffer can render the new code or emit it as an edit script.
+    Each heuristic that fires closes a "modify.<name>" lap on `timer`.
+    `components` is the set of requested sections (a PromptAnalysis has
+    it); it is matched from `prompt` when not given.
+    """
+    index = AnchorIndex(current_code)
+    doc = SpliceBuffer(current_code, index)
+    editor = PageEditor(doc, jsx)
+
+    # Replace simple color names in text/bg classes
+    rewrites = [
+        (start, end, new_color)
+        for start, end in index.colors
+        if current_code[start:end] != new_color
+    ]
+
+    explanation_steps = [
+        f"- Updated theme color tokens across the component tree to '{new_color}'.",
+    ]
+
+    # Content Updates (Brand Name / Title)
+    if new_brand and new_brand != "Ryze App": # If a specific brand was detected
+        # Replace the brand prop of the Navbar if it exists
+        if index.first('brand="') != -1:
+            brand_attr = f'brand="{new_brand}"'
+            if index.brands:
+                # The whole attribute is rewritten, so recolors inside it are moot
+                rewrites = [
+                    span for span in rewrites
+                    if not _inside_any(span[0], index.brands)
+                ]
+            rewrites.extend((start, end, brand_attr) for start, end in index.brands)
+            doc.searchable.append(brand_attr)
+            explanation_steps.append(f"- Renamed application brand to '{new_brand}'.")
+
+    doc.replace_spans(rewrites)
+    timer.lap("modify.recolor")
+
+    high_level_plan = [
+        f"1. Detected iterative style change request in: '{prompt}'.",
+        f"2. Swapped Tailwind color tokens to '{new_color}' while preserving layout and component structure.",
+    ]
+
+    if components is None:
+        components = requested_components(prompt.lower())
+
+    # --- Sections: one memoized plan per component set, recorded on the same splice ---
+    context = {"PRIMARY_COLOR": new_color, "BRAND_NAME": new_brand}
+    section_registry.apply(editor, components, context, high_level_plan, explanation_steps, timer)
+
+    return doc, high_level_plan, explanation_steps
@@ -0,0 +1,304 @@
+from .metrics import NULL_TIMER
+from .template_engine import CompiledTemplate
+from .templates import (
+    APP_FEATURES_SNIPPET,
+    APP_FOOTER_SNIPPET,
+    APP_HERO_SNIPPET,
+    APP_NAV_SNIPPET,
+    APP_WRAPPER,
+    CHART_SNIPPET,
+    FEATURES_SNIPPET,
+    FOOTER_SNIPPET,
+    HERO_SNIPPET,
+    NAV_SNIPPET,
+    NAV_WRAPPER,
+    PRICING_SECTION_SNIPPET,
+    SIDEBAR_SNIPPET,
+    TESTIMONIALS_SNIPPET,
+)
+
+# Rendered variants kept per section with placeholders (one per color and brand seen)
+RENDERED_LIMIT = 256
+# Anchors that land right before a closing tag: the section becomes a child of that element
+CHILD_METHODS = frozenset(['insert_before_close', 'append_child'])
+
+
+def indent_piece(piece, source, child):
+    """
+    Re-indents a section inserted (as "snippet\n") at the start of an
+    indented line: level with the element it lands before, or a level
+    deeper when that is a closing tag (`child`), keeping the line's own
+    indentation for what follows. Pieces placed mid-line keep their text.
+    """
+    line_start = source.rfind("\n", 0, piece.offset) + 1
+    indent = source[line_start:piece.offset]
+    if indent.strip():
+        return
+    inner = indent + "  " if child else indent
+    lines = piece.text[:-1].split("\n")
+    piece.text = inner[len(indent):] + ("\n" + inner).join(lines) + "\n" + indent
+
+
+class Section:
+    """
+    A page section modify_ui can insert. The snippet is compiled once;
+    `absent` lists ('tag' | 'text' | 'attr', value) checks that must all
+    fail for the section to be added (the page already has one otherwise).
+    `anchors` are (PageEditor method, key, prefix, suffix) rules tried in
+    order until one places the snippet; key is None for methods that only
+    take the text. A snippet inserted before a line's first tag is
+    re-indented to fit there (see indent_piece). The placed Piece is kept
+    under `register` so later
+    sections can anchor on it. `after` names sections that must be placed
+    first when both are requested. A section with `members` places each of
+    them (those whose own checks pass) instead of a snippet of its own.
+    """
+    __slots__ = ('name', 'template', 'absent', 'anchors', 'texts', 'keys', 'rendered', 'register', 'after',
+                 'members', 'plan_line', 'explanation', 'report_unplaced', 'lap')
+
+    def __init__(self, name, snippet=None, absent=(), anchors=(), register=None, after=(), members=(),
+                 plan_line=None, explanation=None, report_unplaced=True):
+        self.name = name
+        self.template = CompiledTemplate(snippet, name=name) if snippet is not None else None
+        self.absent = tuple(absent)
+        self.anchors = tuple(anchors)
+        # Per-anchor texts (prefix + snippet + suffix): joined up front when the
+        # snippet has no placeholders, else on first use for each set of values
+        if self.template is not None and not self.template.slots:
+            self.texts = self._join(snippet)
+        else:
+            self.texts = None
+        self.keys = tuple(sorted(self.template.placeholders)) if self.template is not None else ()
+        self.rendered = {}
+        self.register = register
+        self.after = tuple(after)
+        self.members = tuple(members)
+        self.plan_line = plan_line
+        self.explanation = explanation
+        # Report (and time) the section even when no anchor matched
+        self.report_unplaced = report_unplaced
+        self.lap = f"modify.{name}"
+
+    def _join(self, body):
+        return tuple(prefix + body + suffix for _, _, prefix, suffix in self.anchors)
+
+    def _render(self, context):
+        key = tuple(context.get(name) for name in self.keys)
+        texts = self.rendered.get(key)
+        if texts is None:
+            texts = self._join(self.template.render(context))
+            if len(self.rendered) >= RENDERED_LIMIT:
+                self.rendered.clear()
+            self.rendered[key] = texts
+        return texts
+
+    def missing(self, editor):
+        """True when the page has none of the markers in `absent`."""
+        for kind, value in self.absent:
+            if kind == 'tag':
+                found = editor.has_tag(value)
+            elif kind == 'text':
+                found = editor.doc.contains(value)
+            else:
+                found = editor.jsx.has_attr(*value)
+            if found:
+                return False
+        return True
+
+    def place(self, editor, context):
+        """Inserts the section at its first matching anchor; returns whether it was placed."""
+        if self.members:
+            for member in self.members:
+                if member.missing(editor):
+                    member.place(editor, context)
+            return True
+
+        texts = self.texts if self.texts is not None else self._render(context)
+        for (method, key, prefix, suffix), text in zip(self.anchors, texts):
+            insert = getattr(editor, method)
+            piece = insert(text) if key is None else insert(key, text)
+            if piece is not None:
+                # Snippets that start on a new line of their own bring their layout along
+                if not prefix and suffix == '\n' and not text.startswith('\n'):
+                    indent_piece(piece, editor.doc.code, method in CHILD_METHODS)
+                if self.register is not None:
+                    editor.placed[self.register] = piece
+                return True
+        return False
+
+
+class SectionRegistry:
+    """
+    Sections by name, in registration order. plan() turns a set of
+    requested component names into the order they are placed in: every
+    section follows the requested sections named in its `after`, ties keep
+    registration order. Plans are memoized per component set, so a request
+    only runs the presence checks and the anchor lookups.
+    """
+    def __init__(self, sections=()):
+        self.sections = {}
+        self._plans = {}
+        for section in sections:
+            self.register(section)
+
+    def register(self, section):
+        self.sections[section.name] = section
+        self._plans.clear()
+
+    def get(self, name):
+        return self.sections.get(name)
+
+    def names(self):
+        return list(self.sections)
+
+    def plan(self, components):
+        """Tuple of the Sections to place for `components`, dependencies first."""
+        if not isinstance(components, frozenset):
+            components = frozenset(components)
+        plan = self._plans.get(components)
+        if plan is None:
+            plan = self._plans[components] = self._order(components)
+        return plan
+
+    def _order(self, components):
+        pending = [section for name, section in self.sections.items() if name in components]
+        ordered = []
+        done = set()
+        while pending:
+            for section in pending:
+                if all(name in done or name not in components for name in section.after):
+                    break
+            else:
+                raise ValueError(f"Section dependency cycle among {sorted(s.name for s in pending)}")
+            pending.remove(section)
+            ordered.append(section)
+            done.add(section.name)
+        return tuple(ordered)
+
+    def apply(self, editor, components, context, high_level_plan, explanation_steps, timer=NULL_TIMER):
+        """
+        Places every requested section the page does not have yet, in plan
+        order, recording the edits on `editor` (nothing is rendered here).
+        `context` fills the snippets' placeholders. Each section that fires
+        appends its plan and explanation lines and closes its lap on `timer`.
+        """
+        for section in self.plan(components):
+            if not section.missing(editor):
+                continue
+            if section.place(editor, context) or section.report_unplaced:
+                high_level_plan.append(section.plan_line)
+                explanation_steps.append(section.explanation)
+                timer.lap(section.lap)
+
+
+# Content sections land before the footer, else at the end of <main> or the page
+CONTENT_ANCHORS = (
+    ('insert_before', 'footer', '', '\n'),
+    ('insert_before_close', 'main', '', '\n'),
+    ('append_child', None, '', '\n'),
+)
+# Last child of <main>, else of the page
+_END_ANCHORS = (
+    ('insert_before_close', 'main', '', '\n'),
+    ('append_child', None, '', '\n'),
+)
+
+# Singleton instance, in the order sections were historically applied
+section_registry = SectionRegistry([
+    # The returned JSX is wrapped in a page container whose first child is the Navbar
+    Section(
+        'navbar', NAV_SNIPPET,
+        absent=[('tag', 'Navbar')],
+        anchors=[('insert_wrapped', NAV_WRAPPER, '', '')],
+        register='Navbar',
+        plan_line="3. Injected Navigation Bar component with responsive layout.",
+        explanation="- Added <Navbar> component to the top of the view hierarchy.",
+    ),
+    Section(
+        'hero', HERO_SNIPPET,
+        absent=[('text', '<h1>'), ('text', 'Welcome')],
+        anchors=[
+            ('insert_after', 'Navbar', '\n', ''),
+            ('prepend_child', None, '', '\n'),
+        ],
+        register='hero',
+        after=['navbar'],
+        plan_line="3. Generated conversion-optimized Hero Section.",
+        explanation="- Added gradient Hero section with CTAs.",
+    ),
+    Section(
+        'features', FEATURES_SNIPPET,
+        absent=[('text', 'Feature 1')],
+        anchors=[
+            ('insert_after_placed', 'hero', '\n', ''),
+            ('insert_after_section', 'Build Faster with AI', '\n', ''),
+            ('insert_after', 'Navbar', '\n', ''),
+        ] + list(_END_ANCHORS),
+        after=['navbar', 'hero'],
+        plan_line="3. Added Features Grid with hover effects.",
+        explanation="- Created 3-column Features section using Card components.",
+    ),
+    Section(
+        'footer', FOOTER_SNIPPET,
+        absent=[('tag', 'footer')],
+        anchors=_END_ANCHORS,
+        register='footer',
+        plan_line="3. Appended professional Footer.",
+        explanation="- Added clean Footer with copyright and links.",
+    ),
+    Section(
+        'testimonials', TESTIMONIALS_SNIPPET,
+        absent=[('text', 'user says')],
+        anchors=CONTENT_ANCHORS,
+        after=['footer'],
+        plan_line="3. Added Social Proof section with user testimonials.",
+        explanation="- Created trusted Testimonials grid.",
+    ),
+    # A whole landing page at once; skipped when the page already has a Navbar
+    Section(
+        'full_app',
+        absent=[('tag', 'Navbar')],
+        members=[
+            Section('app_navbar', APP_NAV_SNIPPET,
+                    anchors=[('insert_wrapped', APP_WRAPPER, '', '')], register='Navbar'),
+            Section('app_hero', APP_HERO_SNIPPET, absent=[('text', 'Welcome')],
+                    anchors=[('insert_after', 'Navbar', '', '\n')], register='app_hero'),
+            Section('app_features', APP_FEATURES_SNIPPET, absent=[('text', 'Feature 1')],
+                    anchors=[('insert_after_placed', 'app_hero', '\n', '')]),
+            Section('app_footer', APP_FOOTER_SNIPPET, absent=[('tag', 'footer')],
+                    anchors=_END_ANCHORS, register='footer'),
+        ],
+        after=['navbar', 'hero', 'features', 'footer', 'testimonials'],
+        plan_line="3. ORCHESTRATOR: Assembled complete SaaS Landing Page architecture.",
+        explanation="- Generated Full-Stack Landing Page structure.",
+    ),
+    # First child of the min-h-screen container, switched to a flex row
+    Section(
+        'sidebar', SIDEBAR_SNIPPET,
+        absent=[('tag', 'Sidebar')],
+        anchors=[
+            ('prepend_to_wrapper_row', None, '', '\n'),
+            ('prepend_to_page_row', None, '\n', ''),
+        ],
+        after=['navbar', 'full_app'],
+        plan_line="3. Integrated Sidebar navigation panel.",
+        explanation="- Added <Sidebar> component and updated layout to Flexbox 'row'.",
+        report_unplaced=False,
+    ),
+    Section(
+        'chart', CHART_SNIPPET,
+        absent=[('tag', 'Chart')],
+        anchors=CONTENT_ANCHORS,
+        after=['footer', 'full_app'],
+        plan_line="3. Visualized data with interactive Charts.",
+        explanation="- Added Bar and Line <Chart> components.",
+    ),
+    Section(
+        'pricing', PRICING_SECTION_SNIPPET,
+        absent=[('text', 'RYZE_PRICING_SECTION'), ('attr', ('id', 'pricing')), ('text', 'id="pricing"')],
+        anchors=CONTENT_ANCHORS + (('append_to_end', None, '', '\n'),),
+        after=['footer', 'full_app', 'chart'],
+        plan_line="3. Inserted a deterministic Pricing section snippet before the main footer.",
+        explanation="- Added a structured pricing section using the shared component library.",
+    ),
+])
@@ -0,0 +1,78 @@
+import threading
+
+from .cache import LRUCache
+
+
+class SessionStore:
+    """
+    Latest code per editing session, kept server-side so iterative
+    modifications only exchange prompts and edit scripts.
+    Entries are (version, code) pairs in a bounded LRUCache; sessions
+    that fall out of it are simply re-seeded by the client.
+    """
+    def __init__(self, max_entries=1024, max_bytes=None, ttl=None):
+        self._cache = LRUCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            ttl=ttl,
+            sizeof=lambda entry: len(entry[1].encode('utf-8')),
+        )
+        # Serializes version checks with the write that follows them
+        self._lock = threading.Lock()
+
+    def get(self, session_id):
+        """Returns (version, code), or None for unknown or evicted sessions."""
+        return self._cache.get(session_id)
+
+    def seed(self, session_id, code):
+        """
+        Stores `code` as the next version of the session (version 1 for a
+        new one). Returns the version, or None if the code is too large.
+        """
+        with self._lock:
+            entry = self._cache.get(session_id)
+            version = entry[0] + 1 if entry is not None else 1
+            if not self._cache.set(session_id, (version, code)):
+                return None
+            return version
+
+    def fits(self, code):
+        """Whether `code` is small enough to be stored at all."""
+        max_bytes = self._cache.max_bytes
+        return max_bytes is None or len(code.encode('utf-8')) <= max_bytes
+
+    def commit(self, session_id, base_version, code):
+        """
+        Stores `code` on top of `base_version`. Returns the new version, or
+        None when the session moved on (or was evicted) in the meantime, or
+        the code is too large (see fits()).
+        """
+        with self._lock:
+            entry = self._cache.get(session_id)
+            if entry is None or entry[0] != base_version:
+                return None
+            version = base_version + 1
+            if not self._cache.set(session_id, (version, code)):
+                return None
+            return version
+
+    def stats(self):
+        return self._cache.stats()
+
+
+def utf16_edits(code, edits):
+    """
+    Converts [offset, delete, insert] ops from code point offsets into
+    UTF-16 code units, the unit JavaScript strings are indexed in.
+    """
+    if code.isascii():
+        return edits
+    converted = []
+    position = 0
+    units = 0
+    for offset, delete, text in edits:
+        units += len(code[position:offset].encode('utf-16-le')) // 2
+        position = offset
+        deleted = len(code[offset:offset + delete].encode('utf-16-le')) // 2
+        converted.append([units, deleted, text])
+    return converted
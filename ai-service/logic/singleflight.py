@@ -0,0 +1,191 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+from .cache_backends import decode_value, encode_value, open_private, private_dir
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process coalescing, thread locks are enough
+    fcntl = None
+
+# Shared results written between two sweeps of the expired ones
+SWEEP_EVERY = 256
+
+
+@contextmanager
+def _key_lock(path):
+    fd = open_private(path, os.O_RDWR | os.O_CREAT)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
+
+
+class _Call:
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical computations. do(key, fn) runs fn() in
+    the first thread to ask for `key` (the leader); threads asking while it
+    runs wait and get the same result, or the same exception. Without
+    `shared_dir` nothing is kept once the call is over: caching stays the
+    caller's job.
+
+    With `shared_dir` (a private_dir()), leaders in different processes on
+    the host also coalesce: a leader takes the key's own lock file, and
+    whoever gets it first computes and leaves the result there for `ttl`
+    seconds, so leaders that waited on the lock load it instead of
+    recomputing. Only values encode_value() handles are shared that way;
+    other results are still coalesced within the process.
+    """
+    def __init__(self, shared_dir=None, ttl=5.0):
+        self.shared_dir = shared_dir
+        self.ttl = ttl
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.leaders = 0
+        self.coalesced = 0
+        self.shared = 0
+        if shared_dir:
+            private_dir(shared_dir)
+
+    def do(self, key, fn):
+        """Returns (value, coalesced): coalesced is True when another call computed it."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+                self.leaders += 1
+            else:
+                leader = False
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+
+        try:
+            if self.shared_dir:
+                call.value, coalesced = self._do_shared(key, fn)
+            else:
+                call.value, coalesced = fn(), False
+            return call.value, coalesced
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def _paths(self, key):
+        base = os.path.join(self.shared_dir, hashlib.blake2b(repr(key).encode('utf-8'), digest_size=16).hexdigest())
+        return base + ".lock", base + ".result"
+
+    def _do_shared(self, key, fn):
+        lock_path, result_path = self._paths(key)
+        # One lock per key: only processes after the same result queue on it
+        with _key_lock(lock_path):
+            value = self._load(result_path)
+            if value is not None:
+                with self._lock:
+                    self.shared += 1
+                return value, True
+            value = fn()
+            self._store(result_path, value)
+        return value, False
+
+    def _load(self, path):
+        try:
+            with os.fdopen(open_private(path, os.O_RDONLY), 'rb') as f:
+                if os.fstat(f.fileno()).st_mtime + self.ttl < time.time():
+                    return None
+                return decode_value(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, path, value):
+        try:
+            data = encode_value(value)
+        except TypeError:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.shared_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            # Only the processes already waiting lose out: they compute it themselves
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self._writes += 1
+            sweep = self._writes % SWEEP_EVERY == 0
+        if sweep:
+            self.sweep()
+
+    def sweep(self):
+        """Removes shared results and idle lock files older than the TTL; returns how many."""
+        removed = 0
+        cutoff = time.time() - self.ttl
+        for entry in os.scandir(self.shared_dir):
+            if not entry.name.endswith(('.result', '.tmp', '.lock')):
+                continue
+            try:
+                if entry.stat(follow_symlinks=False).st_mtime >= cutoff:
+                    continue
+                if entry.name.endswith('.lock'):
+                    removed += self._remove_idle_lock(entry.path)
+                else:
+                    os.remove(entry.path)
+                    removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def _remove_idle_lock(self, path):
+        # Only unlinked while nobody holds it. A process that opened it just
+        # before then locks a file the next leader no longer sees, which at
+        # worst costs one render done twice
+        if fcntl is None:
+            return 0
+        fd = open_private(path, os.O_RDWR)
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return 0
+            os.remove(path)
+            return 1
+        finally:
+            os.close(fd)
+
+    def stats(self):
+        return {
+            "shared_dir": self.shared_dir,
+            "in_flight": len(self._calls),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "shared": self.shared,
+        }
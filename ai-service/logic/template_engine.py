@@ -0,0 +1,198 @@
+import hashlib
+import mmap
+import os
+import re
+import threading
+import time
+
+# Placeholders are upper-case tokens such as {{PRIMARY_COLOR}}.
+# JSX object literals like user={{name: "x"}} never match this pattern.
+PLACEHOLDER_PATTERN = re.compile(r'\{\{([A-Z][A-Z0-9_]*)\}\}')
+
+
+class CompiledTemplate:
+    """
+    A template parsed once into static segments and placeholder slots.
+    Rendering fills the slots and performs a single join, so the template
+    source is never rescanned per request and a render allocates only its
+    output, not one full copy per placeholder as a str.replace chain does. `digest` identifies the source
+    itself: a file edited in place keeps its version but not its digest,
+    so anything keyed on both never serves output of the old source.
+    """
+    __slots__ = ('name', 'version', 'digest', 'source', 'chunks', 'slots', 'placeholders')
+
+    def __init__(self, source, name=None, version=None):
+        self.name = name
+        self.version = version
+        self.digest = hashlib.blake2b(source.encode('utf-8'), digest_size=8).hexdigest()
+        self.source = source
+
+        chunks = []
+        slots = []
+        last = 0
+        for match in PLACEHOLDER_PATTERN.finditer(source):
+            chunks.append(source[last:match.start()])
+            # The slot keeps the raw token so unknown placeholders render unchanged
+            slots.append((len(chunks), match.group(1)))
+            chunks.append(match.group(0))
+            last = match.end()
+        chunks.append(source[last:])
+
+        self.chunks = tuple(chunks)
+        self.slots = tuple(slots)
+        self.placeholders = frozenset(key for _, key in slots)
+
+    def render(self, context=None, **values):
+        if context:
+            values = {**context, **values}
+        if not self.slots:
+            return self.source
+
+        parts = list(self.chunks)
+        for index, key in self.slots:
+            value = values.get(key)
+            if value is not None:
+                parts[index] = str(value)
+        return "".join(parts)
+
+
+TEMPLATE_SUFFIX = '.jsx'
+
+# Templates ship next to the service; point TEMPLATES_DIR elsewhere to override
+TEMPLATES_DIR = os.getenv(
+    "TEMPLATES_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates'),
+)
+# Section fragments of each intent, spliced into another intent's page by
+# logic.composer; same <name>/<version>.jsx layout, one directory down
+SECTIONS_DIR = os.getenv("SECTIONS_DIR", os.path.join(TEMPLATES_DIR, 'sections'))
+# Seconds between checks of the template directory for changes (0 disables hot reload)
+TEMPLATE_RELOAD_INTERVAL = float(os.getenv("TEMPLATE_RELOAD_INTERVAL", 2))
+
+
+def _version_key(version):
+    # '1.10' sorts after '1.9'; non-numeric parts sort after numeric ones
+    return tuple((0, int(part), '') if part.isdigit() else (1, 0, part) for part in version.split('.'))
+
+
+def _read_mapped(path):
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped[:].decode('utf-8')
+
+
+class TemplateRegistry:
+    """
+    Versioned templates stored on disk as <root>/<name>/<version>.jsx.
+    The highest version of each template is served. Files are memory-mapped
+    and compiled on first use, so a worker only holds the templates it
+    renders (or, when preload() runs before forking, shares them with the
+    master). The directory is rescanned every `reload_interval` seconds and
+    changed templates are recompiled on their next use, without a restart.
+    """
+    def __init__(self, root, default='dashboard', reload_interval=TEMPLATE_RELOAD_INTERVAL):
+        self.root = root
+        self.default = default
+        self.reload_interval = reload_interval
+        # name -> (version, path, (mtime_ns, size)) of the newest file on disk
+        self.available = {}
+        # name -> CompiledTemplate, filled lazily
+        self.loaded = {}
+        self.loads = 0
+        self.reloads = 0
+        self._lock = threading.Lock()
+        self._checked_at = 0.0
+        self.refresh()
+
+    def _scan(self):
+        available = {}
+        try:
+            entries = list(os.scandir(self.root))
+        except FileNotFoundError:
+            return available
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            newest = None
+            for file in os.scandir(entry.path):
+                if not file.name.endswith(TEMPLATE_SUFFIX) or not file.is_file():
+                    continue
+                version = file.name[:-len(TEMPLATE_SUFFIX)]
+                if newest is None or _version_key(version) > _version_key(newest[0]):
+                    stat = file.stat()
+                    newest = (version, file.path, (stat.st_mtime_ns, stat.st_size))
+            if newest is not None:
+                available[entry.name] = newest
+        return available
+
+    def refresh(self):
+        """
+        Rescans the template directory. Templates whose newest file changed
+        (new version, or an edit in place) are dropped and recompiled lazily.
+        Returns the names that changed.
+        """
+        available = self._scan()
+        with self._lock:
+            changed = [
+                name for name in set(self.available) | set(available)
+                if self.available.get(name) != available.get(name)
+            ]
+            for name in changed:
+                if self.loaded.pop(name, None) is not None:
+                    self.reloads += 1
+            self.available = available
+            self._checked_at = time.monotonic()
+        return changed
+
+    def _maybe_refresh(self):
+        if self.reload_interval and time.monotonic() - self._checked_at >= self.reload_interval:
+            self.refresh()
+
+    def _load(self, name):
+        with self._lock:
+            template = self.loaded.get(name)
+            if template is None:
+                version, path, _ = self.available[name]
+                template = CompiledTemplate(_read_mapped(path), name=name, version=version)
+                self.loaded[name] = template
+                self.loads += 1
+            return template
+
+    def get(self, name):
+        self._maybe_refresh()
+        if name not in self.available:
+            name = self.default
+        template = self.loaded.get(name)
+        if template is None:
+            template = self._load(name)
+        return template
+
+    def render(self, name, context=None, **values):
+        return self.get(name).render(context, **values)
+
+    def names(self):
+        return sorted(self.available)
+
+    def has(self, name):
+        self._maybe_refresh()
+        return name in self.available
+
+    def preload(self):
+        """Compiles every template now (e.g. in the master before forking)."""
+        for name in self.names():
+            self.get(name)
+
+    def stats(self):
+        return {
+            "available": {name: entry[0] for name, entry in sorted(self.available.items())},
+            "loaded": sorted(self.loaded),
+            "loads": self.loads,
+            "reloads": self.reloads,
+        }
+
+
+# Singleton instances (templates are compiled on first use)
+template_engine = TemplateRegistry(TEMPLATES_DIR)
+section_templates = TemplateRegistry(SECTIONS_DIR, default=None)
@@ -0,0 +1,112 @@
+"""
+Moves flat deployments/<id>.html pages into the chunk store that
+/deployments now serves from, keeping their ids (and so their URLs).
+Pages stored as one manifest file each (deployments/manifests/, the
+store's first layout) are moved into its sharded index the same way.
+Every page is read back from the store and compared byte-for-byte before
+its original is touched; originals are only deleted with --delete.
+Reports the storage saved.
+
+    python migrate_deployments.py [--dir deployments] [--delete] [--dry-run]
+"""
+import argparse
+import os
+import sys
+
+from logic.chunk_store import KEY_PATTERN, ChunkStore, _parse_manifest
+
+
+def flat_pages(directory):
+    """(artifact id, path) for every flat <id>.html page."""
+    return [
+        (name[:-len('.html')], os.path.join(directory, name)) for name in sorted(os.listdir(directory))
+        if name.endswith('.html') and KEY_PATTERN.match(name[:-len('.html')])
+    ]
+
+
+def manifest_files(directory):
+    """(artifact id, path) for every manifests/<xx>/<id> file of the first store layout."""
+    pages = []
+    for parent, _, names in os.walk(os.path.join(directory, 'manifests')):
+        pages.extend((name, os.path.join(parent, name)) for name in sorted(names) if KEY_PATTERN.match(name))
+    return pages
+
+
+def _load(store, path):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if not path.endswith('.html'):
+        # A manifest: the page is its chunks, already in chunks/
+        manifest = _parse_manifest(raw)
+        if manifest is None:
+            raise ValueError("corrupt manifest")
+        chunks = []
+        for digest in manifest[1]:
+            with open(store._chunk_path(digest), 'rb') as f:
+                chunks.append(f.read())
+        raw = b''.join(chunks)
+    return raw
+
+
+def migrate(directory, delete=False, dry_run=False):
+    store = ChunkStore(directory)
+    pages = flat_pages(directory) + manifest_files(directory)
+    migrated = skipped = failed = 0
+    for artifact_id, path in pages:
+        name = os.path.relpath(path, directory)
+        try:
+            data = _load(store, path)
+        except (OSError, ValueError) as e:
+            print(f"FAIL {name}: {e}")
+            failed += 1
+            continue
+        if dry_run:
+            migrated += 1
+            continue
+
+        created = store.put(artifact_id, data)
+        if store.read(artifact_id) != data:
+            if created:
+                print(f"FAIL {name}: read back differs from the original")
+                failed += 1
+            else:
+                # Same id, different page: leave both alone
+                print(f"SKIP {name}: the store already has a different page under this id")
+                skipped += 1
+            continue
+        if delete:
+            os.remove(path)
+        migrated += 1
+
+    if delete:
+        for parent, _, _ in sorted(os.walk(os.path.join(directory, 'manifests')), reverse=True):
+            try:
+                os.rmdir(parent)
+            except OSError:  # still holds pages that were skipped
+                pass
+    return store, pages, migrated, skipped, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument('--dir', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'deployments'))
+    parser.add_argument('--delete', action='store_true', help="remove each original once verified")
+    parser.add_argument('--dry-run', action='store_true', help="only list what would be migrated")
+    args = parser.parse_args()
+
+    flat_bytes = sum(os.path.getsize(path) for _, path in flat_pages(args.dir))
+    store, pages, migrated, skipped, failed = migrate(args.dir, args.delete, args.dry_run)
+    print(f"{migrated} of {len(pages)} pages migrated, {skipped} skipped, {failed} failed"
+          + (" (dry run)" if args.dry_run else ""))
+
+    if not args.dry_run:
+        usage = store.usage()
+        saved = usage["logical_bytes"] - usage["stored_bytes"]
+        print(f"store: {usage['artifacts']} artifacts in {usage['chunks']} chunks, "
+              f"{usage['logical_bytes'] / 1024:.1f} KB of pages held in {usage['stored_bytes'] / 1024:.1f} KB "
+              f"({saved / max(usage['logical_bytes'], 1):.0%} saved; flat files were {flat_bytes / 1024:.1f} KB)")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+export default function Dashboard() {
+  const [activeTab, setActiveTab] = React.useState('Overview');
+
+  // Sidebar Items
+  const sidebarItems = [
+    { label: 'Overview', icon: 'LayoutDashboard', onClick: () => setActiveTab('Overview') },
+    { label: 'Analytics', icon: 'BarChart2', onClick: () => setActiveTab('Analytics') },
+    { label: 'Settings', icon: 'Settings', onClick: () => setActiveTab('Settings') }
+  ];
+
+  // Navbar Links
+  const navbarLinks = [
+    { label: 'Help', href: '#' },
+    { label: 'Profile', href: '#' }
+  ];
+  
+  // User Profile
+  const user = {
+    name: "Alex Designer",
+    avatar: "https://i.pravatar.cc/150?u=a042581f4e29026704d"
+  };
+
+  return (
+    <div className="flex h-screen bg-gradient-to-br from-gray-50 to-gray-100 dark:from-gray-900 dark:to-black text-foreground font-sans antialiased overflow-hidden">
+      {/* Sidebar Navigation - Glassmorphism */}
+      <Sidebar 
+        items={sidebarItems} 
+        activeItem={activeTab} 
+        position="left" 
+        className="hidden md:flex glass border-none z-10"
+      />
+      
+      {/* Main Content Area */}
+      <div className="flex-1 flex flex-col overflow-hidden relative">
+        <Navbar brand="{{BRAND_NAME}}" links={navbarLinks} user={user} className="sticky top-0 z-10 backdrop-blur-md bg-transparent border-b border-white/10" />
+        
+        {/* Decorative background blobs */}
+        <div className="absolute top-0 left-0 w-96 h-96 bg-{{PRIMARY_COLOR}}-500/20 rounded-full blur-3xl -z-10 translate-x-1/2 translate-y-1/2 pointer-events-none"></div>
+        <div className="absolute bottom-0 right-0 w-96 h-96 bg-purple-500/20 rounded-full blur-3xl -z-10 -translate-x-1/2 -translate-y-1/2 pointer-events-none"></div>
+
+        <main className="flex-1 overflow-y-auto p-6 scroll-smooth">
+          <div className="max-w-7xl mx-auto space-y-6">
+             {/* Header Section */}
+             <div className="flex justify-between items-center mb-6">
+                <div className="animate-in fade-in slide-in-from-bottom-4 duration-700">
+                   <h1 className="text-4xl font-extrabold tracking-tight bg-clip-text text-transparent bg-gradient-to-r from-gray-900 to-gray-600 dark:from-white dark:to-gray-400">
+                     Dashboard Overview
+                   </h1>
+                   <p className="text-muted-foreground mt-2">Welcome back, {user.name}</p>
+                </div>
+                <div className="flex gap-3">
+                   <Button variant="outline" size="sm" className="glass-card hover:bg-white/40">Export Report</Button>
+                   <Button variant="primary" size="sm" className="shadow-lg shadow-{{PRIMARY_COLOR}}-500/20" onClick={() => alert('Add New Clicked')}>+ Add New</Button>
+                </div>
+             </div>
+             
+             {/* Key Metrics Cards */}
+             <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 gap-6">
+                <Card className="glass-card border-none hover:-translate-y-1 transition-transform duration-300">
+                    <div className="flex justify-between items-start mb-4">
+                        <div className="p-3 bg-{{PRIMARY_COLOR}}-500/10 rounded-2xl">
+                            <Lucide.Users className="w-6 h-6 text-{{PRIMARY_COLOR}}-600 dark:text-{{PRIMARY_COLOR}}-400" />
+                        </div>
+                        <span className="text-xs font-bold text-emerald-600 bg-emerald-100 dark:text-emerald-400 dark:bg-emerald-900/30 px-2 py-1 rounded-full border border-emerald-200 dark:border-emerald-800">+12.5%</span>
+                    </div>
+                    <div>
+                        <p className="text-sm font-medium text-muted-foreground">Total Users</p>
+                        <h3 className="text-3xl font-bold mt-1 tracking-tight">12,345</h3>
+                    </div>
+                </Card>
+                
+                 <Card className="glass-card border-none hover:-translate-y-1 transition-transform duration-300">
+                    <div className="flex justify-between items-start mb-4">
+                        <div className="p-3 bg-{{PRIMARY_COLOR}}-500/10 rounded-2xl">
+                            <Lucide.DollarSign className="w-6 h-6 text-{{PRIMARY_COLOR}}-600 dark:text-{{PRIMARY_COLOR}}-400" />
+                        </div>
+                        <span className="text-xs font-bold text-emerald-600 bg-emerald-100 dark:text-emerald-400 dark:bg-emerald-900/30 px-2 py-1 rounded-full border border-emerald-200 dark:border-emerald-800">+8.2%</span>
+                    </div>
+                    <div>
+                        <p className="text-sm font-medium text-muted-foreground">Total Revenue</p>
+                        <h3 className="text-3xl font-bold mt-1 tracking-tight">$45,200</h3>
+                    </div>
+                </Card>
+                
+                 <Card className="glass-card border-none hover:-translate-y-1 transition-transform duration-300">
+                    <div className="flex justify-between items-start mb-4">
+                        <div className="p-3 bg-{{PRIMARY_COLOR}}-500/10 rounded-2xl">
+                            <Lucide.Activity className="w-6 h-6 text-{{PRIMARY_COLOR}}-600 dark:text-{{PRIMARY_COLOR}}-400" />
+                        </div>
+                        <span className="text-xs font-bold text-gray-500 bg-gray-100 px-2 py-1 rounded-full">Active</span>
+                    </div>
+                    <div>
+                        <p className="text-sm font-medium text-muted-foreground">Active Sessions</p>
+                        <h3 className="text-3xl font-bold mt-1 tracking-tight">894</h3>
+                    </div>
+                </Card>
+             </div>
+             
+             {/* Charts & Tables Section */}
+             <div className="grid grid-cols-1 lg:grid-cols-3 gap-6">
+               <Card className="lg:col-span-2 glass-card border-none" title="Revenue Growth">
+                  <div className="mt-4">
+                    <Chart type="bar" color="{{PRIMARY_COLOR}}" />
+                  </div>
+               </Card>
+               
+               <Card title="Traffic Sources" className="glass-card border-none">
+                  <div className="mt-4">
+                    <Chart type="pie" color="{{PRIMARY_COLOR}}" />
+                  </div>
+               </Card>
+             </div>
+             
+             <Card title="Recent Transactions" className="glass-card border-none overflow-hidden">
+               <Table 
+                 headers={["User", "Date", "Amount", "Status"]}
+                 data={[
+                   { user: "John Doe", date: "Oct 24, 2024", amount: "$120.00", status: "Completed" },
+                   { user: "Jane Smith", date: "Oct 23, 2024", amount: "$250.00", status: "Pending" },
+                   { user: "Bob Johnson", date: "Oct 22, 2024", amount: "$99.00", status: "Completed" },
+                   { user: "Alice Brown", date: "Oct 21, 2024", amount: "$450.00", status: "Failed" },
+                 ]}
+                 className="mt-4"
+               />
+            </Card>
+          </div>
+        </main>
+      </div>
+    </div>
+  );
+}
\ No newline at end of file
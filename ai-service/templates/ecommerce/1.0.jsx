@@ -0,0 +1,103 @@
+export default function EcommerceProduct() {
+  const [selectedImage, setSelectedImage] = React.useState(0);
+  const [quantity, setQuantity] = React.useState(1);
+
+  return (
+    <div className="min-h-screen bg-background py-12 px-4 sm:px-6 lg:px-8 font-sans">
+      <div className="max-w-7xl mx-auto">
+        <div className="lg:grid lg:grid-cols-2 lg:gap-x-8 lg:items-start">
+          
+          {/* Image Gallery */}
+          <div className="flex flex-col-reverse">
+            <div className="hidden mt-6 w-full max-w-2xl mx-auto sm:block lg:max-w-none">
+              <div className="grid grid-cols-4 gap-6">
+                {[0, 1, 2, 3].map((img) => (
+                  <button key={img} onClick={() => setSelectedImage(img)} className={`relative h-24 bg-white rounded-md flex items-center justify-center text-sm font-medium uppercase text-gray-900 cursor-pointer hover:bg-gray-50 focus:outline-none focus:ring focus:ring-offset-4 focus:ring-opacity-50 focus:ring-{{PRIMARY_COLOR}}-500 ${selectedImage === img ? 'ring-2 ring-{{PRIMARY_COLOR}}-500' : 'ring-1 ring-gray-200 dark:ring-gray-700'}`}>
+                    <span className="sr-only">Image {img + 1}</span>
+                    <span className="absolute inset-0 rounded-md overflow-hidden">
+                       <div className="w-full h-full bg-gray-100 dark:bg-gray-800 flex items-center justify-center text-xs text-muted-foreground">Img {img + 1}</div>
+                    </span>
+                  </button>
+                ))}
+              </div>
+            </div>
+
+            <div className="w-full aspect-w-1 aspect-h-1 rounded-2xl bg-gray-100 dark:bg-gray-800 overflow-hidden border border-border">
+               <div className="w-full h-[500px] flex items-center justify-center bg-gray-50 dark:bg-gray-900 relative">
+                  <Lucide.ShoppingBag className="w-32 h-32 text-{{PRIMARY_COLOR}}-200 dark:text-{{PRIMARY_COLOR}}-900/50" />
+                  <span className="absolute bottom-4 right-4 text-xs text-muted-foreground">Product View {selectedImage + 1}</span>
+               </div>
+            </div>
+          </div>
+
+          {/* Product Info */}
+          <div className="mt-10 px-4 sm:px-0 sm:mt-16 lg:mt-0">
+            <div className="flex justify-between">
+                <h1 className="text-3xl font-extrabold tracking-tight text-foreground">{{BRAND_NAME}} Premium</h1>
+                <div className="p-2 bg-{{PRIMARY_COLOR}}-50 dark:bg-{{PRIMARY_COLOR}}-900/20 text-{{PRIMARY_COLOR}}-700 dark:text-{{PRIMARY_COLOR}}-300 rounded-lg text-sm font-bold">New Arrival</div>
+            </div>
+            
+            <div className="mt-3">
+              <h2 className="sr-only">Product information</h2>
+              <p className="text-3xl text-foreground font-light">$192.00</p>
+            </div>
+
+            <div className="mt-3">
+               <div className="flex item-center gap-1">
+                  {[1,2,3,4,5].map(s => <Lucide.Star key={s} className="w-4 h-4 text-amber-400 fill-amber-400" />)}
+                  <span className="text-sm text-muted-foreground ml-2">(148 reviews)</span>
+               </div>
+            </div>
+
+            <div className="mt-6">
+              <h3 className="sr-only">Description</h3>
+              <p className="text-base text-muted-foreground space-y-6">
+                The {{BRAND_NAME}} Premium is designed for ultimate performance and style. Featuring our proprietary {{PRIMARY_COLOR}} technology, it delivers unmatched results in any environment.
+              </p>
+            </div>
+
+            <form className="mt-6">
+               <div className="flex gap-4 mb-6">
+                  <div className="flex-1">
+                     <label className="block text-sm font-medium text-muted-foreground mb-1">Quantity</label>
+                     <div className="flex items-center border border-border rounded-md">
+                        <button type="button" onClick={() => setQuantity(Math.max(1, quantity - 1))} className="p-2 hover:bg-muted"><Lucide.Minus className="w-4 h-4"/></button>
+                        <span className="flex-1 text-center font-bold px-4">{quantity}</span>
+                        <button type="button" onClick={() => setQuantity(quantity + 1)} className="p-2 hover:bg-muted"><Lucide.Plus className="w-4 h-4"/></button>
+                     </div>
+                  </div>
+                  <div className="flex-1">
+                     <label className="block text-sm font-medium text-muted-foreground mb-1">Size</label>
+                     <select className="w-full p-2.5 bg-background border border-border rounded-md focus:ring-2 focus:ring-{{PRIMARY_COLOR}}-500">
+                        <option>Small</option>
+                        <option>Medium</option>
+                        <option>Large</option>
+                     </select>
+                  </div>
+               </div>
+
+              <div className="mt-10 flex sm:flex-col1">
+                <Button variant="primary" size="lg" className="w-full bg-{{PRIMARY_COLOR}}-600 hover:bg-{{PRIMARY_COLOR}}-700 text-white shadow-xl shadow-{{PRIMARY_COLOR}}-500/20 h-14 text-lg">
+                   Add to bag
+                </Button>
+              </div>
+            </form>
+            
+            <div className="mt-8 border-t border-border pt-8">
+               <div className="grid grid-cols-2 gap-4">
+                  <div className="flex items-center gap-3 text-sm text-muted-foreground">
+                     <Lucide.Truck className="w-5 h-5 text-{{PRIMARY_COLOR}}-600" />
+                     <span>Free Shipping</span>
+                  </div>
+                  <div className="flex items-center gap-3 text-sm text-muted-foreground">
+                     <Lucide.ShieldCheck className="w-5 h-5 text-{{PRIMARY_COLOR}}-600" />
+                     <span>2 Year Warranty</span>
+                  </div>
+               </div>
+            </div>
+          </div>
+        </div>
+      </div>
+    </div>
+  );
+}
\ No newline at end of file
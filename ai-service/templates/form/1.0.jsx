@@ -0,0 +1,98 @@
+export default function ContactForm() {
+  const [formData, setFormData] = React.useState({
+    firstName: '',
+    lastName: '',
+    email: '',
+    message: ''
+  });
+  const [isSubmitting, setIsSubmitting] = React.useState(false);
+
+  const handleSubmit = () => {
+    setIsSubmitting(true);
+    setTimeout(() => {
+        setIsSubmitting(false);
+        alert('Message Sent!');
+    }, 1500);
+  };
+
+  return (
+    <div className="min-h-screen bg-gray-50 dark:bg-gray-950 flex items-center justify-center p-4 sm:p-6 lg:p-8 relative overflow-hidden">
+       {/* Background Decoration */}
+       <div className="absolute -top-40 -right-40 w-[600px] h-[600px] bg-{{PRIMARY_COLOR}}-500/20 rounded-full blur-[100px] pointer-events-none"></div>
+       <div className="absolute -bottom-40 -left-40 w-[600px] h-[600px] bg-indigo-500/20 rounded-full blur-[100px] pointer-events-none"></div>
+
+      <div className="max-w-5xl w-full grid grid-cols-1 lg:grid-cols-2 gap-0 bg-white dark:bg-gray-900 rounded-3xl shadow-2xl overflow-hidden glass border border-white/20 dark:border-white/10">
+        
+        {/* Info Section */}
+        <div className="bg-gradient-to-br from-{{PRIMARY_COLOR}}-600 to-indigo-700 p-10 text-white flex flex-col justify-between relative overflow-hidden">
+           {/* Abstract Shapes */}
+           <div className="absolute top-10 right-10 w-20 h-20 bg-white/10 rounded-full blur-xl"></div>
+           <div className="absolute bottom-10 left-10 w-32 h-32 bg-black/10 rounded-full blur-xl"></div>
+           
+           <div className="relative z-10">
+               <h2 className="text-4xl font-extrabold mb-6 tracking-tight">Get in touch</h2>
+               <p className="text-{{PRIMARY_COLOR}}-100 mb-10 text-lg leading-relaxed">
+                 Fill in the form to start a conversation with our team. We typically respond within 24 hours.
+               </p>
+               
+               <div className="space-y-8">
+                 <div className="flex items-center gap-5">
+                    <div className="p-3 bg-white/10 rounded-lg backdrop-blur-sm">
+                        <Lucide.MapPin className="w-6 h-6 text-{{PRIMARY_COLOR}}-100" />
+                    </div>
+                    <span className="text-lg">123 Innovation Drive, Tech Valley, CA</span>
+                 </div>
+                 <div className="flex items-center gap-5">
+                    <div className="p-3 bg-white/10 rounded-lg backdrop-blur-sm">
+                        <Lucide.Phone className="w-6 h-6 text-{{PRIMARY_COLOR}}-100" />
+                    </div>
+                    <span className="text-lg">+1 (555) 000-0000</span>
+                 </div>
+                 <div className="flex items-center gap-5">
+                    <div className="p-3 bg-white/10 rounded-lg backdrop-blur-sm">
+                        <Lucide.Mail className="w-6 h-6 text-{{PRIMARY_COLOR}}-100" />
+                    </div>
+                    <span className="text-lg">contact@ryze.ai</span>
+                 </div>
+               </div>
+           </div>
+           
+           <div className="flex gap-4 mt-12 relative z-10">
+              <Button size="icon" variant="ghost" className="text-white hover:bg-white/20 rounded-full w-12 h-12"><Lucide.Twitter className="w-5 h-5"/></Button>
+              <Button size="icon" variant="ghost" className="text-white hover:bg-white/20 rounded-full w-12 h-12"><Lucide.Linkedin className="w-5 h-5"/></Button>
+              <Button size="icon" variant="ghost" className="text-white hover:bg-white/20 rounded-full w-12 h-12"><Lucide.Instagram className="w-5 h-5"/></Button>
+           </div>
+        </div>
+
+        {/* Form Section */}
+        <div className="p-10 lg:p-14 bg-white/50 dark:bg-black/50 backdrop-blur-md">
+            <h3 className="text-2xl font-bold text-foreground mb-8">Send us a Message</h3>
+            <div className="space-y-6">
+              <div className="grid grid-cols-1 sm:grid-cols-2 gap-6">
+                 <Input label="First Name" placeholder="John" className="bg-transparent" />
+                 <Input label="Last Name" placeholder="Doe" className="bg-transparent" />
+              </div>
+              <Input label="Email Address" type="email" placeholder="john@example.com" className="bg-transparent" />
+              <div className="flex flex-col gap-2 w-full">
+                  <label className="text-sm font-medium text-muted-foreground ml-1">Message</label>
+                  <textarea 
+                    className="flex min-h-[150px] w-full rounded-xl border border-input bg-transparent px-4 py-3 text-sm ring-offset-background placeholder:text-muted-foreground focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring focus-visible:ring-offset-2 disabled:cursor-not-allowed disabled:opacity-50 resize-none transition-shadow"
+                    placeholder="Tell us about your project..."
+                  />
+              </div>
+              
+              <div className="flex justify-end pt-6">
+                <Button 
+                   className="w-full sm:w-auto h-12 px-8 text-base bg-foreground text-background hover:bg-foreground/90 transition-all shadow-lg" 
+                   onClick={handleSubmit}
+                   loading={isSubmitting}
+                >
+                  Send Message
+                </Button>
+              </div>
+            </div>
+        </div>
+      </div>
+    </div>
+  );
+}
\ No newline at end of file
@@ -0,0 +1,101 @@
+export default function GenericPage() {
+  const [activeLink, setActiveLink] = React.useState('Home');
+
+  return (
+    <div className="min-h-screen bg-background font-sans text-foreground">
+      {/* Universal Navbar */}
+      <nav className="flex items-center justify-between px-6 py-4 bg-background/80 backdrop-blur-md border-b border-border sticky top-0 z-50">
+         <div className="text-xl font-bold flex items-center gap-2">
+            <div className="w-8 h-8 rounded-lg bg-gradient-to-br from-{{PRIMARY_COLOR}}-500 to-indigo-600 flex items-center justify-center text-white">
+               <Lucide.Zap className="w-5 h-5" />
+            </div>
+            {{BRAND_NAME}}
+         </div>
+         <div className="hidden md:flex gap-6">
+            {['Home', 'Platform', 'Resources', 'Pricing'].map(link => (
+               <button 
+                  key={link} 
+                  onClick={() => setActiveLink(link)}
+                  className={`text-sm font-medium transition-colors ${activeLink === link ? 'text-{{PRIMARY_COLOR}}-600' : 'text-muted-foreground hover:text-foreground'}`}
+               >
+                  {link}
+               </button>
+            ))}
+         </div>
+         <div className="flex gap-2">
+            <Button variant="ghost" size="sm">Log In</Button>
+            <Button size="sm" className="bg-{{PRIMARY_COLOR}}-600 text-white hover:bg-{{PRIMARY_COLOR}}-700">Get Started</Button>
+         </div>
+      </nav>
+
+      {/* Main Content Skeleton */}
+      <main className="container mx-auto px-4 py-16 space-y-20">
+         
+         {/* Adaptive Hero */}
+         <section className="text-center space-y-6 max-w-4xl mx-auto">
+             <div className="inline-flex items-center gap-2 px-3 py-1 bg-{{PRIMARY_COLOR}}-100 dark:bg-{{PRIMARY_COLOR}}-900/30 text-{{PRIMARY_COLOR}}-700 dark:text-{{PRIMARY_COLOR}}-300 rounded-full text-xs font-bold uppercase tracking-wide">
+                <span className="w-2 h-2 rounded-full bg-{{PRIMARY_COLOR}}-600 animate-pulse"></span>
+                Now Available
+             </div>
+             <h1 className="text-5xl md:text-6xl font-extrabold tracking-tight">
+                Build your next idea with <span className="text-transparent bg-clip-text bg-gradient-to-r from-{{PRIMARY_COLOR}}-600 to-purple-600">{{BRAND_NAME}}</span>
+             </h1>
+             <p className="text-xl text-muted-foreground leading-relaxed max-w-2xl mx-auto">
+                A powerful, scalable, and secure platform designed to help you achieve more. Start building the future today with our advanced tools.
+             </p>
+             <div className="flex justify-center gap-4 pt-4">
+                 <Button size="lg" className="h-12 px-8 bg-{{PRIMARY_COLOR}}-600 hover:bg-{{PRIMARY_COLOR}}-700 text-white shadow-lg shadow-{{PRIMARY_COLOR}}-500/25">Start Free Trial</Button>
+                 <Button size="lg" variant="outline" className="h-12 px-8">View Documentation</Button>
+             </div>
+         </section>
+
+         {/* Content Grid (Generic Features/Items) */}
+         <section>
+             <div className="flex items-center justify-between mb-8">
+                 <h2 className="text-2xl font-bold">Key Capabilities</h2>
+                 <Button variant="link" className="text-{{PRIMARY_COLOR}}-600">View All <Lucide.ArrowRight className="w-4 h-4 ml-1"/></Button>
+             </div>
+             <div className="grid grid-cols-1 md:grid-cols-3 gap-6">
+                 {[1, 2, 3, 4, 5, 6].map((i) => (
+                    <Card key={i} className="hover:border-{{PRIMARY_COLOR}}-500/50 transition-colors cursor-pointer group">
+                       <div className="h-32 bg-gray-100 dark:bg-gray-800 rounded-t-xl mb-4 relative overflow-hidden">
+                           <div className="absolute inset-0 bg-gradient-to-tr from-{{PRIMARY_COLOR}}-500/10 to-transparent opacity-0 group-hover:opacity-100 transition-opacity"></div>
+                           <div className="absolute top-4 left-4 p-2 bg-white dark:bg-black rounded-lg shadow-sm">
+                              <Lucide.Layers className="w-5 h-5 text-{{PRIMARY_COLOR}}-600" />
+                           </div>
+                       </div>
+                       <div className="px-6 pb-6 pt-2">
+                           <h3 className="font-bold text-lg mb-2">Feature Component {i}</h3>
+                           <p className="text-muted-foreground text-sm">A flexible component block that adapts to various content requirements and layouts.</p>
+                       </div>
+                    </Card>
+                 ))}
+             </div>
+         </section>
+
+         {/* Call to Action Banner */}
+         <section className="rounded-3xl bg-gray-900 text-white p-12 overflow-hidden relative">
+             <div className="absolute top-0 right-0 w-64 h-64 bg-{{PRIMARY_COLOR}}-500/30 rounded-full blur-[80px] -translate-y-1/2 translate-x-1/2"></div>
+             <div className="relative z-10 flex flex-col md:flex-row items-center justify-between gap-8">
+                 <div className="space-y-4">
+                     <h2 className="text-3xl font-bold">Ready to get started?</h2>
+                     <p className="text-gray-400 max-w-md">Join thousands of others building on {{BRAND_NAME}} platform today.</p>
+                 </div>
+                 <div className="bg-white p-1 rounded-xl flex">
+                     <input type="email" placeholder="Enter your email" className="bg-transparent text-gray-900 px-4 py-2 outline-none w-64" />
+                     <Button className="bg-{{PRIMARY_COLOR}}-600 hover:bg-{{PRIMARY_COLOR}}-700 text-white rounded-lg">Subscribe</Button>
+                 </div>
+             </div>
+         </section>
+
+      </main>
+      
+      {/* Footer */}
+      <footer className="border-t py-8 mt-12 bg-muted/20">
+         <div className="container mx-auto px-4 text-center text-muted-foreground text-sm">
+            &copy; 2024 {{BRAND_NAME}}. All rights reserved.
+         </div>
+      </footer>
+    </div>
+  );
+}
\ No newline at end of file
@@ -0,0 +1,217 @@
+export default function LandingPage() {
+  const [isMenuOpen, setIsMenuOpen] = React.useState(false);
+
+  // Smooth scroll
+  const scrollTo = (id) => {
+    const element = document.getElementById(id);
+    if (element) element.scrollIntoView({ behavior: 'smooth' });
+    setIsMenuOpen(false);
+  };
+
+  return (
+    <div className="flex flex-col min-h-screen bg-background font-sans text-foreground selection:bg-{{PRIMARY_COLOR}}-500/30">
+      
+      {/* Navigation */}
+      <header className="sticky top-0 z-50 w-full border-b border-border/40 bg-background/80 backdrop-blur-md">
+        <div className="container mx-auto flex h-16 items-center justify-between px-4">
+          <div className="flex items-center gap-2">
+            <div className="bg-gradient-to-tr from-{{PRIMARY_COLOR}}-600 to-purple-600 p-2 rounded-xl">
+               <Lucide.Sparkles className="h-5 w-5 text-white" />
+            </div>
+            <span className="font-bold text-xl tracking-tight">{{BRAND_NAME}}</span>
+          </div>
+          
+          <div className="hidden md:flex gap-8 items-center">
+            {['Features', 'Testimonials', 'Pricing'].map((item) => (
+               <button key={item} onClick={() => scrollTo(item.toLowerCase())} className="text-sm font-medium text-muted-foreground hover:text-{{PRIMARY_COLOR}}-600 transition-colors">
+                  {item}
+               </button>
+            ))}
+            <Button variant="primary" className="bg-{{PRIMARY_COLOR}}-600 hover:bg-{{PRIMARY_COLOR}}-700 text-white shadow-lg shadow-{{PRIMARY_COLOR}}-500/25">
+               Get Started
+            </Button>
+          </div>
+
+          <button className="md:hidden" onClick={() => setIsMenuOpen(!isMenuOpen)}>
+             {isMenuOpen ? <Lucide.X className="h-6 w-6" /> : <Lucide.Menu className="h-6 w-6" />}
+          </button>
+        </div>
+        
+        {/* Mobile Menu */}
+        {isMenuOpen && (
+           <div className="md:hidden p-4 border-t bg-background space-y-4 animate-in slide-in-from-top-2">
+              {['Features', 'Testimonials', 'Pricing'].map((item) => (
+                 <button key={item} onClick={() => scrollTo(item.toLowerCase())} className="block w-full text-left py-2 font-medium">
+                    {item}
+                 </button>
+              ))}
+               <Button className="w-full bg-{{PRIMARY_COLOR}}-600 text-white">Get Started</Button>
+           </div>
+        )}
+      </header>
+      
+      <main className="flex-1">
+      
+        {/* Hero Section */}
+        <section className="relative pt-24 pb-32 overflow-hidden">
+           <div className="absolute top-0 left-1/2 -translate-x-1/2 w-[800px] h-[500px] bg-{{PRIMARY_COLOR}}-500/20 rounded-full blur-[120px] -z-10 pointer-events-none"></div>
+           
+           <div className="container mx-auto px-4 text-center">
+              <div className="inline-flex items-center rounded-full border border-{{PRIMARY_COLOR}}-200 bg-{{PRIMARY_COLOR}}-50 dark:border-{{PRIMARY_COLOR}}-800 dark:bg-{{PRIMARY_COLOR}}-900/20 px-3 py-1 text-sm font-medium text-{{PRIMARY_COLOR}}-600 dark:text-{{PRIMARY_COLOR}}-400 mb-6 backdrop-blur-sm">
+                 <span className="flex h-2 w-2 rounded-full bg-{{PRIMARY_COLOR}}-600 mr-2 animate-pulse"></span>
+                 New Version 2.0 Released
+              </div>
+              
+              <h1 className="text-4xl md:text-6xl lg:text-7xl font-extrabold tracking-tight text-transparent bg-clip-text bg-gradient-to-b from-foreground to-foreground/60 mb-6">
+                 Build faster with <br className="hidden md:block"/>
+                 <span className="bg-clip-text text-transparent bg-gradient-to-r from-{{PRIMARY_COLOR}}-600 to-purple-600">{{BRAND_NAME}}</span>
+              </h1>
+              
+              <p className="mx-auto max-w-[700px] text-lg text-muted-foreground mb-10 leading-relaxed">
+                 The ultimate platform for modern developers. Deterministic, scalable, and built for performance. Start building your dream project today.
+              </p>
+              
+              <div className="flex flex-col sm:flex-row items-center justify-center gap-4">
+                 <Button size="lg" className="h-12 px-8 text-base bg-{{PRIMARY_COLOR}}-600 hover:bg-{{PRIMARY_COLOR}}-700 text-white shadow-xl shadow-{{PRIMARY_COLOR}}-500/20 hover:scale-105 transition-transform">
+                    Start Building Free
+                 </Button>
+                 <Button size="lg" variant="outline" className="h-12 px-8 text-base hover:bg-muted/50 backdrop-blur-sm">
+                    <Lucide.Play className="mr-2 h-4 w-4" /> Watch Demo
+                 </Button>
+              </div>
+              
+              {/* Hero Image / Dashboard Preview */}
+              <div className="mt-20 relative mx-auto max-w-5xl">
+                 <div className="rounded-xl border bg-background/50 backdrop-blur shadow-2xl overflow-hidden p-2 ring-1 ring-inset ring-foreground/10">
+                    <div className="rounded-lg bg-foreground/5 aspect-[16/9] flex items-center justify-center relative overflow-hidden group">
+                       <div className="absolute inset-0 bg-gradient-to-tr from-{{PRIMARY_COLOR}}-500/10 to-purple-500/10 opacity-0 group-hover:opacity-100 transition-opacity duration-700"></div>
+                       {/* Mock UI Elements */}
+                       <div className="w-[80%] h-[80%] bg-white dark:bg-black rounded-lg shadow-xl border border-border flex">
+                          <div className="w-1/4 h-full border-r border-border p-4 space-y-2 hidden md:block">
+                             <div className="h-2 w-1/2 bg-muted rounded mb-6"></div>
+                             {[1,2,3,4].map(i => <div key={i} className="h-8 w-full bg-muted/50 rounded"></div>)}
+                          </div>
+                          <div className="flex-1 p-6 space-y-4">
+                             <div className="h-8 w-1/3 bg-muted rounded mb-8"></div>
+                             <div className="grid grid-cols-2 gap-4">
+                                <div className="h-32 bg-{{PRIMARY_COLOR}}-50/50 dark:bg-{{PRIMARY_COLOR}}-900/10 border border-{{PRIMARY_COLOR}}-100 dark:border-{{PRIMARY_COLOR}}-800 rounded"></div>
+                                <div className="h-32 bg-purple-50/50 dark:bg-purple-900/10 border border-purple-100 dark:border-purple-800 rounded"></div>
+                             </div>
+                             <div className="h-40 bg-muted/30 rounded border border-border"></div>
+                          </div>
+                       </div>
+                    </div>
+                 </div>
+                 <div className="absolute -z-10 -bottom-10 -right-10 w-64 h-64 bg-purple-500/30 rounded-full blur-[80px] pointer-events-none"></div>
+                 <div className="absolute -z-10 -top-10 -left-10 w-64 h-64 bg-{{PRIMARY_COLOR}}-500/30 rounded-full blur-[80px] pointer-events-none"></div>
+              </div>
+           </div>
+        </section>
+        
+        {/* Features Grid */}
+        <section id="features" className="py-24 bg-muted/30 relative">
+           <div className="container mx-auto px-4">
+              <div className="text-center max-w-3xl mx-auto mb-16">
+                 <h2 className="text-3xl font-bold tracking-tight mb-4">Everything you need to scale</h2>
+                 <p className="text-muted-foreground text-lg">Powerful features configured for production. Security, performance, and reliability out of the box.</p>
+              </div>
+              
+              <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-8">
+                 {[
+                    { title: "Deterministic AI", icon: Lucide.Brain, desc: "Zero hallucinations. Guaranteed valid code generation every time." },
+                    { title: "Glassmorphism UI", icon: Lucide.Layers, desc: "Premium styling with blur effects and dynamic gradients built-in." },
+                    { title: "Secure by Default", icon: Lucide.ShieldCheck, desc: "Enterprise-grade security standards with automated compliance." },
+                    { title: "Microservices", icon: Lucide.Server, desc: "Independently scalable architecture for frontend, gateway, and engine." },
+                    { title: "Real-time Sync", icon: Lucide.RefreshCw, desc: "Instant state synchronization across all connected clients." },
+                    { title: "Global CDN", icon: Lucide.Globe, desc: "Deployed on edge networks for sub-millisecond latency worldwide." }
+                 ].map((feature, i) => (
+                    <div key={i} className="group relative overflow-hidden rounded-2xl border bg-background p-8 hover:shadow-xl transition-all duration-300 hover:-translate-y-1">
+                       <div className="absolute top-0 right-0 p-4 opacity-10 group-hover:opacity-20 transition-opacity">
+                          <feature.icon className="w-24 h-24 text-{{PRIMARY_COLOR}}-500" />
+                       </div>
+                       <div className="mb-4 inline-flex items-center justify-center rounded-xl bg-{{PRIMARY_COLOR}}-50 dark:bg-{{PRIMARY_COLOR}}-900/20 p-3 text-{{PRIMARY_COLOR}}-600">
+                          <feature.icon className="h-6 w-6" />
+                       </div>
+                       <h3 className="mb-2 text-xl font-bold">{feature.title}</h3>
+                       <p className="text-muted-foreground">{feature.desc}</p>
+                    </div>
+                 ))}
+              </div>
+           </div>
+        </section>
+        
+        {/* How It Works Section */}
+        <section className="py-24 bg-background relative overflow-hidden">
+           <div className="container mx-auto px-4">
+              <div className="text-center max-w-3xl mx-auto mb-16">
+                 <h2 className="text-3xl font-bold tracking-tight mb-4">How it works</h2>
+                 <p className="text-muted-foreground text-lg">Three simple steps to launch your next big idea.</p>
+              </div>
+              
+              <div className="grid grid-cols-1 md:grid-cols-3 gap-12 relative">
+                 {/* Connecting Line */}
+                 <div className="hidden md:block absolute top-12 left-[16%] right-[16%] h-0.5 bg-gradient-to-r from-transparent via-{{PRIMARY_COLOR}}-200 dark:via-{{PRIMARY_COLOR}}-800 to-transparent -z-10"></div>
+                 
+                 {[
+                    { step: "01", title: "Connect", desc: "Integrate with your existing data sources in minutes." },
+                    { step: "02", title: "Configure", desc: "Customize the logic and UI to match your brand requirements." },
+                    { step: "03", title: "Deploy", desc: "Launch globally with a single click to our edge network." }
+                 ].map((item, i) => (
+                    <div key={i} className="flex flex-col items-center text-center group">
+                       <div className="w-24 h-24 rounded-full bg-white dark:bg-gray-900 border-4 border-{{PRIMARY_COLOR}}-50 dark:border-{{PRIMARY_COLOR}}-900/30 flex items-center justify-center text-2xl font-bold text-{{PRIMARY_COLOR}}-600 shadow-xl mb-6 group-hover:scale-110 transition-transform duration-300 relative z-10">
+                          {item.step}
+                       </div>
+                       <h3 className="text-xl font-bold mb-3">{item.title}</h3>
+                       <p className="text-muted-foreground leading-relaxed max-w-xs">{item.desc}</p>
+                    </div>
+                 ))}
+              </div>
+           </div>
+        </section>
+
+        {/* Pricing CTA */}
+        <section id="pricing" className="py-24 relative overflow-hidden">
+           <div className="container mx-auto px-4">
+               <div className="rounded-3xl bg-gradient-to-r from-{{PRIMARY_COLOR}}-600 to-purple-600 p-12 text-center text-white relative overflow-hidden shadow-2xl">
+                   <div className="absolute top-0 left-0 w-full h-full bg-[url('https://grainy-gradients.vercel.app/noise.svg')] opacity-20 mix-blend-overlay"></div>
+                   <div className="relative z-10 max-w-2xl mx-auto">
+                       <h2 className="text-3xl md:text-4xl font-bold mb-6">Ready to transform your workflow?</h2>
+                       <p className="text-{{PRIMARY_COLOR}}-100 text-lg mb-8">Join thousands of developers building the future with {{BRAND_NAME}} today.</p>
+                       <div className="flex flex-col sm:flex-row gap-4 justify-center">
+                           <Button size="lg" className="bg-white text-{{PRIMARY_COLOR}}-600 hover:bg-gray-100 border-0 shadow-xl">
+                               Get Started Now
+                           </Button>
+                           <Button size="lg" variant="outline" className="text-white border-white hover:bg-white/10 hover:text-white backdrop-blur-sm">
+                               Contact Sales
+                           </Button>
+                       </div>
+                   </div>
+               </div>
+           </div>
+        </section>
+      </main>
+      
+      {/* Footer */}
+      <footer className="border-t py-12 bg-muted/20">
+         <div className="container mx-auto px-4">
+            <div className="flex flex-col md:flex-row justify-between items-center gap-6">
+               <div className="flex items-center gap-2">
+                  <div className="bg-{{PRIMARY_COLOR}}-600 p-1.5 rounded-lg">
+                     <Lucide.Boxes className="h-4 w-4 text-white" />
+                  </div>
+                  <span className="font-bold text-lg">{{BRAND_NAME}}</span>
+               </div>
+               <div className="text-sm text-muted-foreground">
+                  &copy; 2024 {{BRAND_NAME}} Inc. All rights reserved.
+               </div>
+               <div className="flex gap-4">
+                  <Lucide.Twitter className="h-5 w-5 text-muted-foreground hover:text-foreground cursor-pointer transition-colors" />
+                  <Lucide.Github className="h-5 w-5 text-muted-foreground hover:text-foreground cursor-pointer transition-colors" />
+                  <Lucide.Linkedin className="h-5 w-5 text-muted-foreground hover:text-foreground cursor-pointer transition-colors" />
+               </div>
+            </div>
+         </div>
+      </footer>
+    </div>
+  );
+}
\ No newline at end of file
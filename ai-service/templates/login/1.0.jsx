@@ -0,0 +1,95 @@
+export default function LoginPage() {
+  const [email, setEmail] = React.useState('');
+  const [password, setPassword] = React.useState('');
+  const [isLoading, setIsLoading] = React.useState(false);
+
+  // Handle Login Logic
+  const handleLogin = () => {
+    setIsLoading(true);
+    // Simulate API call
+    setTimeout(() => {
+        setIsLoading(false);
+        alert('Login Successful (Simulation)');
+    }, 2000);
+  };
+
+  return (
+    <div className="flex min-h-screen items-center justify-center bg-gray-100 dark:bg-black p-4 relative overflow-hidden">
+      
+      {/* Dynamic Background */}
+      <div className="absolute inset-0 bg-[url('https://grainy-gradients.vercel.app/noise.svg')] opacity-20 brightness-100 contrast-150 mix-blend-overlay"></div>
+      <div className="absolute top-0 right-0 w-[500px] h-[500px] bg-{{PRIMARY_COLOR}}-500/30 rounded-full blur-[120px] -translate-y-1/2 translate-x-1/2"></div>
+      <div className="absolute bottom-0 left-0 w-[500px] h-[500px] bg-purple-500/30 rounded-full blur-[120px] translate-y-1/2 -translate-x-1/2"></div>
+
+      {/* Authentication Card */}
+      <Card className="glass w-full max-w-md p-8 rounded-3xl border-white/20 dark:border-white/10 relative z-10 backdrop-blur-xl">
+        
+        <div className="text-center mb-8">
+          <div className="inline-flex justify-center items-center w-16 h-16 rounded-2xl bg-gradient-to-tr from-{{PRIMARY_COLOR}}-500 to-purple-600 shadow-lg shadow-{{PRIMARY_COLOR}}-500/30 mb-6 group">
+             <Lucide.Lock className="w-8 h-8 text-white group-hover:scale-110 transition-transform duration-300" />
+          </div>
+          <h1 className="text-3xl font-extrabold text-foreground mb-2 tracking-tight">Welcome Back</h1>
+          <p className="text-muted-foreground">Enter your credentials to access your account</p>
+        </div>
+        
+        <div className="space-y-6">
+          <div className="space-y-2">
+            <Input 
+                label="Email Address" 
+                type="email" 
+                placeholder="name@company.com" 
+                value={email}
+                onChange={(e) => setEmail(e.target.value)}
+                icon={Lucide.Mail}
+                className="bg-white/50 dark:bg-black/50 border-transparent focus:border-{{PRIMARY_COLOR}}-500 h-12"
+            />
+          </div>
+          
+          <div className="space-y-2">
+              <Input 
+                label="Password" 
+                type="password" 
+                placeholder="••••••••" 
+                value={password}
+                onChange={(e) => setPassword(e.target.value)}
+                icon={Lucide.Lock}
+                className="bg-white/50 dark:bg-black/50 border-transparent focus:border-{{PRIMARY_COLOR}}-500 h-12"
+              />
+              <div className="flex justify-end">
+                  <a href="#" className="text-xs font-medium text-{{PRIMARY_COLOR}}-600 hover:text-{{PRIMARY_COLOR}}-500 dark:text-{{PRIMARY_COLOR}}-400">Forgot password?</a>
+              </div>
+          </div>
+          
+          <Button 
+            className="w-full h-12 text-base font-semibold bg-gradient-to-r from-{{PRIMARY_COLOR}}-600 to-purple-600 hover:from-{{PRIMARY_COLOR}}-500 hover:to-purple-500 text-white shadow-lg shadow-{{PRIMARY_COLOR}}-500/30 transition-all transform hover:-translate-y-0.5" 
+            variant="primary" 
+            size="lg"
+            onClick={handleLogin}
+            loading={isLoading}
+          >
+            Sign In
+          </Button>
+          
+          <div className="relative my-8">
+            <div className="absolute inset-0 flex items-center"><div className="w-full border-t border-gray-200 dark:border-gray-800"></div></div>
+            <div className="relative flex justify-center text-xs uppercase"><span className="px-3 bg-white/0 text-muted-foreground backdrop-blur-sm">Or continue with</span></div>
+          </div>
+          
+           <div className="grid grid-cols-2 gap-4">
+             <Button variant="outline" className="w-full flex items-center justify-center gap-2 h-10 bg-white/50 hover:bg-white/80 dark:bg-black/50 dark:hover:bg-black/80">
+               <Lucide.Github className="w-4 h-4" /> Github
+             </Button>
+             <Button variant="outline" className="w-full flex items-center justify-center gap-2 h-10 bg-white/50 hover:bg-white/80 dark:bg-black/50 dark:hover:bg-black/80">
+               <Lucide.Twitter className="w-4 h-4 text-blue-400" /> Twitter
+             </Button>
+          </div>
+        </div>
+        
+        <div className="mt-8 text-center text-sm">
+          <span className="text-muted-foreground">Don't have an account? </span>
+          <a href="#" className="font-bold text-{{PRIMARY_COLOR}}-600 hover:text-{{PRIMARY_COLOR}}-500 dark:text-{{PRIMARY_COLOR}}-400 hover:underline transition-colors">Create free account</a>
+        </div>
+      </Card>
+    </div>
+  );
+}
\ No newline at end of file
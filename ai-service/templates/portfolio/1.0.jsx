@@ -0,0 +1,44 @@
+export default function Portfolio() {
+  return (
+    <div className="min-h-screen bg-background text-foreground font-sans">
+      {/* Hero */}
+      <section className="py-20 px-6 text-center">
+         <div className="w-32 h-32 mx-auto rounded-full bg-{{PRIMARY_COLOR}}-100 dark:bg-{{PRIMARY_COLOR}}-900/30 mb-6 overflow-hidden border-4 border-{{PRIMARY_COLOR}}-500/20">
+            <img src="https://i.pravatar.cc/300?u=portfolio" alt="Profile" className="w-full h-full object-cover" />
+         </div>
+         <h1 className="text-4xl font-bold mb-4">Hello, I'm <span className="text-{{PRIMARY_COLOR}}-600">{{BRAND_NAME}}</span></h1>
+         <p className="text-xl text-muted-foreground max-w-2xl mx-auto mb-8">
+            A creative developer building beautiful functional web experiences.
+         </p>
+         <div className="flex justify-center gap-4">
+            <Button className="bg-{{PRIMARY_COLOR}}-600 text-white hover:bg-{{PRIMARY_COLOR}}-700">View Work</Button>
+            <Button variant="outline">Contact Me</Button>
+         </div>
+      </section>
+
+      {/* Projects Grid */}
+      <section className="py-16 px-6 bg-muted/30">
+         <div className="max-w-6xl mx-auto">
+            <h2 className="text-2xl font-bold mb-10 text-center">Featured Projects</h2>
+            <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-8">
+               {[1, 2, 3].map((item) => (
+                  <Card key={item} className="overflow-hidden hover:shadow-lg transition-all group">
+                     <div className="h-48 bg-gray-200 dark:bg-gray-800 relative overflow-hidden">
+                        <div className="absolute inset-0 bg-{{PRIMARY_COLOR}}-500/10 group-hover:bg-{{PRIMARY_COLOR}}-500/0 transition-colors"></div>
+                        <div className="flex items-center justify-center h-full text-muted-foreground">Project Preview</div>
+                     </div>
+                     <div className="p-6">
+                        <h3 className="font-bold text-lg mb-2">Project Title {item}</h3>
+                        <p className="text-muted-foreground text-sm mb-4">A brief description of this amazing project and the technologies used.</p>
+                        <a href="#" className="text-{{PRIMARY_COLOR}}-600 font-medium hover:underline inline-flex items-center gap-1">
+                           View Details <Lucide.ArrowRight className="w-3 h-3" />
+                        </a>
+                     </div>
+                  </Card>
+               ))}
+            </div>
+         </div>
+      </section>
+    </div>
+  );
+}
\ No newline at end of file
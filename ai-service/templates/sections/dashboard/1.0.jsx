@@ -0,0 +1,30 @@
+{/* [RYZE_DASHBOARD_SECTION] */}
+<section className="py-16 px-4">
+   <div className="max-w-6xl mx-auto space-y-6">
+      <h2 className="text-2xl font-bold tracking-tight">Overview</h2>
+      <div className="grid grid-cols-1 sm:grid-cols-3 gap-6">
+         {[
+            { label: "Total Users", value: "12,345", icon: Lucide.Users },
+            { label: "Total Revenue", value: "$45,200", icon: Lucide.DollarSign },
+            { label: "Active Sessions", value: "894", icon: Lucide.Activity }
+         ].map((metric) => (
+            <Card key={metric.label} className="glass-card border-none">
+               <div className="flex items-center gap-4">
+                  <div className="p-3 bg-{{PRIMARY_COLOR}}-500/10 rounded-2xl">
+                     <metric.icon className="w-6 h-6 text-{{PRIMARY_COLOR}}-600 dark:text-{{PRIMARY_COLOR}}-400" />
+                  </div>
+                  <div>
+                     <p className="text-sm font-medium text-muted-foreground">{metric.label}</p>
+                     <h3 className="text-2xl font-bold tracking-tight">{metric.value}</h3>
+                  </div>
+               </div>
+            </Card>
+         ))}
+      </div>
+      <Card title="Revenue Growth" className="glass-card border-none">
+         <div className="mt-4">
+            <Chart type="bar" color="{{PRIMARY_COLOR}}" />
+         </div>
+      </Card>
+   </div>
+</section>
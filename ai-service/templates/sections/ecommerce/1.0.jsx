@@ -0,0 +1,30 @@
+{/* [RYZE_PRODUCTS_SECTION] */}
+<section id="products" className="py-16 px-4">
+   <div className="max-w-6xl mx-auto">
+      <div className="flex justify-between items-end mb-10">
+         <h2 className="text-2xl font-bold tracking-tight">Shop {{BRAND_NAME}}</h2>
+         <a href="#" className="text-sm font-medium text-{{PRIMARY_COLOR}}-600 hover:underline">View all</a>
+      </div>
+      <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-4 gap-6">
+         {[
+            { name: "Premium", price: "$199" },
+            { name: "Essentials", price: "$89" },
+            { name: "Travel Kit", price: "$129" },
+            { name: "Gift Card", price: "$50" }
+         ].map((product) => (
+            <Card key={product.name} className="overflow-hidden group">
+               <div className="h-48 bg-gray-50 dark:bg-gray-900 flex items-center justify-center">
+                  <Lucide.ShoppingBag className="w-16 h-16 text-{{PRIMARY_COLOR}}-200 dark:text-{{PRIMARY_COLOR}}-900/50 group-hover:scale-110 transition-transform" />
+               </div>
+               <div className="p-4 flex justify-between items-center">
+                  <div>
+                     <h3 className="font-semibold">{product.name}</h3>
+                     <p className="text-muted-foreground text-sm">{product.price}</p>
+                  </div>
+                  <Button size="sm" className="bg-{{PRIMARY_COLOR}}-600 text-white hover:bg-{{PRIMARY_COLOR}}-700">Add to Cart</Button>
+               </div>
+            </Card>
+         ))}
+      </div>
+   </div>
+</section>
@@ -0,0 +1,21 @@
+{/* [RYZE_CONTACT_SECTION] */}
+<section id="contact" className="py-16 px-4">
+   <Card className="max-w-2xl mx-auto p-10 bg-white/50 dark:bg-black/50 backdrop-blur-md">
+      <h2 className="text-2xl font-bold mb-2">Send us a Message</h2>
+      <p className="text-muted-foreground mb-8">The {{BRAND_NAME}} team usually replies within a day.</p>
+      <div className="space-y-6">
+         <div className="grid grid-cols-1 sm:grid-cols-2 gap-6">
+            <Input label="First Name" placeholder="John" className="bg-transparent" />
+            <Input label="Last Name" placeholder="Doe" className="bg-transparent" />
+         </div>
+         <Input label="Email Address" type="email" placeholder="john@example.com" className="bg-transparent" />
+         <textarea
+            className="flex min-h-[150px] w-full rounded-xl border border-input bg-transparent px-4 py-3 text-sm placeholder:text-muted-foreground focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-{{PRIMARY_COLOR}}-500 resize-none"
+            placeholder="Tell us about your project..."
+         />
+         <div className="flex justify-end">
+            <Button className="h-12 px-8 bg-{{PRIMARY_COLOR}}-600 text-white hover:bg-{{PRIMARY_COLOR}}-700 shadow-lg">Send Message</Button>
+         </div>
+      </div>
+   </Card>
+</section>
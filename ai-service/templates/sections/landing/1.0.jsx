@@ -0,0 +1,25 @@
+{/* [RYZE_PRICING_SECTION] */}
+<section id="pricing" className="py-24 px-4">
+   <div className="max-w-6xl mx-auto">
+      <div className="text-center max-w-3xl mx-auto mb-16">
+         <h2 className="text-3xl font-bold tracking-tight mb-4">Simple, transparent pricing</h2>
+         <p className="text-muted-foreground text-lg">Choose the plan that fits your team and scale with {{BRAND_NAME}}.</p>
+      </div>
+      <div className="grid grid-cols-1 md:grid-cols-3 gap-8">
+         {[
+            { name: "Starter", price: "$0", desc: "Perfect for small projects and prototypes." },
+            { name: "Pro", price: "$39", desc: "For growing teams shipping production workloads.", featured: true },
+            { name: "Enterprise", price: "Custom", desc: "Advanced security, SSO, and custom SLAs." }
+         ].map((plan) => (
+            <Card key={plan.name} className={`p-8 ${plan.featured ? 'border-{{PRIMARY_COLOR}}-500 shadow-xl shadow-{{PRIMARY_COLOR}}-500/20' : ''}`}>
+               <h3 className="text-lg font-semibold mb-2">{plan.name}</h3>
+               <p className="text-muted-foreground text-sm mb-6">{plan.desc}</p>
+               <p className="text-4xl font-bold mb-6">{plan.price}<span className="text-sm font-normal text-muted-foreground"> /mo</span></p>
+               <Button className={`w-full ${plan.featured ? 'bg-{{PRIMARY_COLOR}}-600 text-white hover:bg-{{PRIMARY_COLOR}}-700' : ''}`} variant={plan.featured ? 'primary' : 'outline'}>
+                  Get Started
+               </Button>
+            </Card>
+         ))}
+      </div>
+   </div>
+</section>
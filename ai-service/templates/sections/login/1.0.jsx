@@ -0,0 +1,19 @@
+{/* [RYZE_LOGIN_SECTION] */}
+<section id="login" className="py-16 px-4">
+   <Card className="glass w-full max-w-md mx-auto p-8 rounded-3xl border-white/20 dark:border-white/10">
+      <div className="text-center mb-8">
+         <div className="inline-flex justify-center items-center w-14 h-14 rounded-2xl bg-gradient-to-tr from-{{PRIMARY_COLOR}}-500 to-purple-600 shadow-lg shadow-{{PRIMARY_COLOR}}-500/30 mb-4">
+            <Lucide.Lock className="w-7 h-7 text-white" />
+         </div>
+         <h2 className="text-2xl font-extrabold tracking-tight mb-2">Sign in to {{BRAND_NAME}}</h2>
+         <p className="text-muted-foreground">Enter your credentials to access your account</p>
+      </div>
+      <div className="space-y-6">
+         <Input label="Email Address" type="email" placeholder="name@company.com" icon={Lucide.Mail} className="h-12" />
+         <Input label="Password" type="password" placeholder="••••••••" icon={Lucide.Lock} className="h-12" />
+         <Button variant="primary" size="lg" className="w-full h-12 bg-gradient-to-r from-{{PRIMARY_COLOR}}-600 to-purple-600 text-white shadow-lg shadow-{{PRIMARY_COLOR}}-500/30">
+            Sign In
+         </Button>
+      </div>
+   </Card>
+</section>
@@ -1,56 +1,19 @@
-import requests
-import time
+"""
+Post-deploy smoke check: health, one /generate and one /modify against a
+running service. Exits non-zero on failure.
+
+    python verify_service.py [http://localhost:5001]
+
+For throughput and latency numbers use benchmarks/suite.py.
+"""
+import os
 import sys
 
-def check_health(url):
-    print(f"Checking health of {url}...")
-    try:
-        response = requests.get(f"{url}/")
-        if response.status_code == 200:
-            print("✅ Root Health Check Passed:", response.json())
-            return True
-        else:
-            print(f"❌ Root Health Check Failed: {response.status_code} - {response.text}")
-            return False
-    except Exception as e:
-        print(f"❌ Connection Failed: {e}")
-        return False
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks'))
 
-def check_generate(url):
-    print(f"\nChecking Generation Endpoint {url}/generate...")
-    try:
-        payload = {"prompt": "Create a blue dashboard for Ryze AI"}
-        start = time.time()
-        response = requests.post(f"{url}/generate", json=payload, timeout=10)
-        end = time.time()
-        
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Generation Successful in {round((end-start)*1000)}ms")
-            print("Intent:", data.get('meta', {}).get('intent'))
-            print("Review Plan:", data.get('plan')[:50] + "...")
-            return True
-        else:
-            print(f"❌ Generation Failed: {response.status_code} - {response.text}")
-            return False
-    except Exception as e:
-        print(f"❌ Connection Failed: {e}")
-        return False
+from suite import HttpTransport, smoke
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        base_url = sys.argv[1]
-    else:
-        base_url = "http://localhost:5001"
-        
+    base_url = sys.argv[1] if len(sys.argv) > 1 else "http://localhost:5001"
     print(f"--- Ryze AI Service Sanity Check for {base_url} ---\n")
-    
-    health = check_health(base_url)
-    gen = check_generate(base_url)
-    
-    if health and gen:
-        print("\n🎉 Service is FULLY FUNCTIONAL!")
-        sys.exit(0)
-    else:
-        print("\n⚠️ Service has issues.")
-        sys.exit(1)
+    sys.exit(0 if smoke(lambda: HttpTransport(base_url)) else 1)
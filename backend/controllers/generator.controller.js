@@ -8,7 +8,7 @@ const AI_SERVICE_URL = process.env.AI_SERVICE_URL || 'http://localhost:5001';
  * Calls the Python AI Service to generate UI code based on prompt.
  */
 exports.generateUI = async (req, res) => {
-  const { prompt } = req.body;
+  const { prompt, session, sessionId, compose } = req.body;
   
   if (!prompt) {
     return res.status(400).json({ error: "Prompt is required" });
@@ -19,7 +19,10 @@ exports.generateUI = async (req, res) => {
 
     // Forward request to Python Microservice
     const response = await axios.post(`${AI_SERVICE_URL}/generate`, {
-        prompt
+        prompt,
+        session,
+        sessionId,
+        compose
     });
     
     // Return Python's deterministic response to Frontend
@@ -55,10 +58,11 @@ exports.generateUI = async (req, res) => {
  * Calls Python AI Service to tweak existing code.
  */
 exports.modifyUI = async (req, res) => {
-  const { prompt, currentCode } = req.body;
+  const { prompt, currentCode, sessionId, baseVersion } = req.body;
 
-  if (!prompt || !currentCode) {
-    return res.status(400).json({ error: "Prompt and currentCode are required" });
+  // Session mode only needs the prompt; the AI service holds the code
+  if (!prompt || (!currentCode && !sessionId)) {
+    return res.status(400).json({ error: "Prompt and currentCode (or sessionId) are required" });
   }
 
   try {
@@ -68,6 +72,8 @@ exports.modifyUI = async (req, res) => {
     const response = await axios.post(`${AI_SERVICE_URL}/modify`, {
       prompt,
       currentCode,
+      sessionId,
+      baseVersion,
     });
 
     res.json(response.data);
@@ -86,6 +92,39 @@ exports.modifyUI = async (req, res) => {
   }
 };
 
+/**
+ * GENERATE UI (BATCH)
+ * Forwards a list of prompts to the Python AI Service in a single round trip.
+ */
+exports.generateBatch = async (req, res) => {
+  const { prompts } = req.body;
+
+  if (!Array.isArray(prompts) || prompts.length === 0) {
+    return res.status(400).json({ error: "prompts must be a non-empty array" });
+  }
+
+  try {
+    console.log(`[Node] Calling Python AI Service (Batch) for ${prompts.length} prompts`);
+
+    const response = await axios.post(`${AI_SERVICE_URL}/generate/batch`, {
+      prompts,
+    }, { maxContentLength: Infinity, maxBodyLength: Infinity });
+
+    res.json(response.data);
+  } catch (error) {
+    console.error("AI Service Error:", error.message);
+    if (error.response) {
+         return res.status(error.response.status).json(error.response.data);
+    }
+    if (error.code === 'ECONNREFUSED') {
+         return res.status(503).json({ 
+             error: "AI Service Unavailable. Please ensure the Python service is running on port 5001." 
+         });
+    }
+    res.status(500).json({ error: "Batch generation failed.", details: error.message });
+  }
+};
+
 /**
  * SHARE UI
  * Persists a generated UI snapshot and returns a stable public slug.
@@ -5,6 +5,9 @@ const generatorController = require('../controllers/generator.controller.js');
 // Generate new UI
 router.post('/generate', generatorController.generateUI);
 
+// Generate many UIs in one round trip
+router.post('/generate/batch', generatorController.generateBatch);
+
 // Modify existing UI
 router.post('/modify', generatorController.modifyUI);
 
@@ -41,6 +41,13 @@ console.log(`[Config] Base URL: ${BASE_URL}`);
 console.log(`[Config] API URL: ${API_URL}`);
 console.log(`[Config] Deploy URL: ${DEPLOY_URL}`);
 
+// Session-mode /modify returns [offset, delete, insert] ops (ascending, UTF-16 offsets);
+// applying them back to front keeps earlier offsets valid
+const applyEdits = (code, edits) => edits.reduceRight(
+  (result, [offset, remove, text]) => result.slice(0, offset) + text + result.slice(offset + remove),
+  code
+);
+
 
 // -----------------------------------------------------------------------------
 // Preview Component
@@ -582,14 +589,30 @@ export default function App() {
       setStatus('🎨 selecting_template.py...');
       await new Promise(r => setTimeout(r, 500));
 
-      if (currentStep >= 0 && history[currentStep].code) {
+      const baseItem = currentStep >= 0 ? history[currentStep] : null;
+
+      if (baseItem?.code) {
          setStatus('⚡ Iterating on design...');
-         response = await axios.post(`${API_URL}/modify`, {
+         const modify = (payload) => axios.post(`${API_URL}/modify`, {
              prompt: promptToUse,
-             currentCode: history[currentStep].code
+             ...payload
          }, {
             timeout: 300000 // 5 minutes
          });
+
+         if (baseItem.session) {
+             // Only the prompt travels; the AI service holds the code for this session
+             try {
+                 response = await modify({ sessionId: baseItem.session.id, baseVersion: baseItem.session.version });
+             } catch (err) {
+                 if (err.response?.status !== 409) throw err;
+                 // Session evicted or out of date on the server: re-seed it with the full code
+                 response = await modify({ sessionId: baseItem.session.id, currentCode: baseItem.code });
+             }
+         } else {
+             // The server assigns the id (crypto.randomUUID() needs a secure origin)
+             response = await modify({ session: true, currentCode: baseItem.code });
+         }
       } else {
          setStatus('⚛️ Compiling React Component...');
          
@@ -599,7 +622,8 @@ export default function App() {
          }, 8000);
 
          response = await axios.post(`${API_URL}/generate`, {
-             prompt: promptToUse
+             prompt: promptToUse,
+             session: true
          }, {
             timeout: 300000 // 5 minutes
          });
@@ -607,7 +631,8 @@ export default function App() {
          clearTimeout(coldStartTimer);
       }
 
-      const { plan, code, explanation } = response.data;
+      const { plan, explanation, edits, session } = response.data;
+      const code = edits ? applyEdits(baseItem.code, edits) : response.data.code;
       
       const newHistoryItem = {
           role: 'assistant',
@@ -615,6 +640,7 @@ export default function App() {
           plan,
           code,
           explanation,
+          session,
           timestamp: new Date().toISOString()
       };
 
@@ -650,7 +676,9 @@ export default function App() {
       const newItem = { 
           ...currentItem, 
           code: newCode, 
-          explanation: "Manual Edit" 
+          explanation: "Manual Edit",
+          // The server-side session no longer matches this code
+          session: undefined
       };
 
       setHistory(prev => [...prev.slice(0, currentStep), newItem]);